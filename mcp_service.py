@@ -4,17 +4,41 @@ Perplexity MCP Server
 An MCP server that provides Perplexity AI search capabilities.
 """
 
+import asyncio
+import functools
 import logging
 import os
-from typing import Literal, Optional
-from mcp.server.fastmcp import FastMCP
+import sqlite3
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Literal, NotRequired, Optional, TypedDict
+
+import orjson
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
-from src.core.perplexity_client import PerplexityClient
-from src.prompts import PROGRAMMING_RESEARCH_PROMPTS, VALID_CATEGORIES
+from mcp.types import ContentBlock, TextContent
+from src.api.dependencies import get_perplexity_client
+from src.config import config
+from src.core.perplexity_client import PerplexityClient, PerplexityResponse
+from src.core.response_cache import DiskResponseCache, ResponseCache
 
 logger = logging.getLogger(__name__)
 
 
+# Accepted spellings of a true boolean environment variable
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+# Hosts always accepted when host validation is enabled
+_DEFAULT_ALLOWED_HOSTS = (
+    "localhost",
+    "localhost:*",
+    "127.0.0.1",
+    "127.0.0.1:*",
+    "0.0.0.0",
+    "0.0.0.0:*",
+)
+
+
+@functools.cache
 def get_transport_security() -> TransportSecuritySettings:
     """Configure MCP transport security settings.
 
@@ -27,29 +51,22 @@ def get_transport_security() -> TransportSecuritySettings:
     Environment variables:
         MCP_ENABLE_HOST_CHECK: Set to 'true' to enable host validation (default: false)
         MCP_ALLOWED_HOSTS: Comma-separated list of allowed hosts (only when check enabled)
+
+    The result is cached, so the environment is parsed once per process.
     """
-    enable_check = os.environ.get("MCP_ENABLE_HOST_CHECK", "").lower() in (
-        "true",
-        "1",
-        "yes",
+    enable_check = (
+        os.environ.get("MCP_ENABLE_HOST_CHECK", "").strip().lower() in _TRUE_VALUES
     )
 
     if not enable_check:
         return TransportSecuritySettings(enable_dns_rebinding_protection=False)
 
+    custom_hosts = os.environ.get("MCP_ALLOWED_HOSTS", "")
     allowed_hosts = [
-        "localhost",
-        "localhost:*",
-        "127.0.0.1",
-        "127.0.0.1:*",
-        "0.0.0.0",
-        "0.0.0.0:*",
+        *_DEFAULT_ALLOWED_HOSTS,
+        *filter(None, map(str.strip, custom_hosts.split(","))),
     ]
 
-    custom_hosts = os.environ.get("MCP_ALLOWED_HOSTS", "")
-    if custom_hosts:
-        allowed_hosts.extend([h.strip() for h in custom_hosts.split(",") if h.strip()])
-
     return TransportSecuritySettings(
         enable_dns_rebinding_protection=True,
         allowed_hosts=allowed_hosts,
@@ -58,11 +75,61 @@ def get_transport_security() -> TransportSecuritySettings:
 
 transport_security = get_transport_security()
 
-mcp = FastMCP("Perplexity Search", transport_security=transport_security)
+
+class CompactFastMCP(FastMCP):
+    """
+    FastMCP server that returns dict tool results as compact JSON.
+
+    FastMCP renders dict results as JSON indented by two spaces, which
+    inflates long answers with whitespace the client has to transfer and
+    the model has to read. Dicts are serialized with orjson instead; every
+    other result goes through FastMCP's own conversion.
+    """
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any]:
+        result = await self._tool_manager.call_tool(
+            name, arguments, context=self.get_context(), convert_result=False
+        )
+        if isinstance(result, dict):
+            text = orjson.dumps(result, default=str).decode()
+            return [TextContent(type="text", text=text)]
+        return self._tool_manager.get_tool(name).fn_metadata.convert_result(result)
+
+
+mcp = CompactFastMCP(
+    "Perplexity Search",
+    transport_security=transport_security,
+    # Stateless mode keeps no per-session state, which lets the HTTP transport
+    # run under several uvicorn workers without sticky routing
+    stateless_http=config.mcp_session_backend == "stateless",
+)
 _client: Optional[PerplexityClient] = None
 
+# Exact-match cache of upstream responses, keyed by the normalized request
+_response_cache = ResponseCache(
+    maxsize=config.perplexity_cache_size,
+    ttl=config.perplexity_cache_ttl,
+)
+
+# Optional persistent layer under the memory cache, so restarts reuse answers.
+# Opened on first use by get_disk_cache(); stays None if disabled or unusable.
+_disk_cache: Optional[DiskResponseCache] = None
+_disk_cache_opened = False
+
+# Caps concurrent upstream requests; tool calls beyond it wait for a slot
+_upstream_slots = asyncio.Semaphore(max(1, config.mcp_max_inflight))
+
+# Upstream requests currently running, keyed like the response cache
+_inflight: dict[tuple, asyncio.Future] = {}
+
 DEFAULT_MODEL = "gpt56_terra_thinking"
 
+# Upper bounds for perplexity_batch, so one tool call cannot flood upstream
+BATCH_MAX_QUERIES = 10
+BATCH_MAX_CONCURRENT = 8
+
 ResearchCategory = Literal[
     "academic",
     "api",
@@ -88,21 +155,190 @@ ResearchCategory = Literal[
 ]
 
 
+class SearchResult(TypedDict):
+    """Result of a search or research tool call."""
+
+    text: str
+    citations: NotRequired[list[dict]]
+    related_queries: NotRequired[list[str]]
+
+
+class BatchItem(SearchResult):
+    """One perplexity_batch result, tagged with the query that produced it."""
+
+    query: str
+
+
+class BatchResult(TypedDict):
+    """Result of perplexity_batch; "text" carries a batch-level error."""
+
+    results: NotRequired[list[BatchItem]]
+    text: NotRequired[str]
+
+
 def get_client() -> PerplexityClient:
-    """Get or create the Perplexity client."""
+    """Get or create the Perplexity client, shared with the REST API."""
     global _client
     if _client is None:
-        _client = PerplexityClient()
+        _client = get_perplexity_client()
     return _client
 
 
+def get_disk_cache() -> Optional[DiskResponseCache]:
+    """Open the persistent cache on first use, or return None if unavailable."""
+    global _disk_cache, _disk_cache_opened
+    if _disk_cache is None and not _disk_cache_opened:
+        _disk_cache_opened = True
+        if config.perplexity_cache_dir:
+            try:
+                _disk_cache = DiskResponseCache(
+                    config.perplexity_cache_dir,
+                    ttl=config.perplexity_disk_cache_ttl,
+                )
+            except (OSError, sqlite3.Error) as e:
+                # The cache is optional; serve from upstream without it
+                logger.warning("Persistent response cache disabled: %s", e)
+    return _disk_cache
+
+
+@functools.cache
+def _research_dispatch() -> dict[str, tuple[str, str, str]]:
+    """
+    Load the compiled research templates on first use.
+
+    The templates are only needed by the research tools, so stdio sessions
+    that never call them skip importing and compiling them at startup.
+
+    Returns:
+        Dict mapping each category, plus its upper and title case spellings,
+        to (category, prefix, suffix)
+    """
+    from src.prompts import COMPILED_RESEARCH_PROMPTS
+
+    dispatch = {}
+    for category, (prefix, suffix) in COMPILED_RESEARCH_PROMPTS.items():
+        for variant in (category, category.upper(), category.title()):
+            dispatch[variant] = (category, prefix, suffix)
+    return dispatch
+
+
+def _normalize_text(text: str) -> str:
+    """Fold case and collapse whitespace so trivially different inputs match."""
+    return " ".join(text.split()).lower()
+
+
+async def _cached_ask(cache_key: tuple, **ask_kwargs) -> PerplexityResponse:
+    """Ask Perplexity, serving repeated equivalent requests from the cache."""
+    return await _coalesce(cache_key, lambda: get_client().ask_async(**ask_kwargs))
+
+
+async def _coalesce(
+    cache_key: tuple, request: Callable[[], Awaitable[PerplexityResponse]]
+) -> PerplexityResponse:
+    """
+    Serve cache_key from the caches or a running request, else start request.
+
+    Concurrent callers with the same key share one upstream request instead
+    of each starting their own. The shared request is shielded, so a caller
+    that is cancelled does not abort it for the others.
+    """
+    response = _response_cache.get(cache_key)
+    if response is not None:
+        return response
+
+    # No await between the lookup and the insert, so this needs no lock
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache(cache_key, request))
+        _inflight[cache_key] = task
+        task.add_done_callback(functools.partial(_finish_inflight, cache_key))
+    return await asyncio.shield(task)
+
+
+def _finish_inflight(cache_key: tuple, task: asyncio.Future) -> None:
+    """Forget a finished shared request and mark its exception as retrieved.
+
+    If every caller was cancelled nobody awaits the task, and asyncio would
+    otherwise log "Task exception was never retrieved" for a failed request.
+    """
+    _inflight.pop(cache_key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_and_cache(
+    cache_key: tuple, request: Callable[[], Awaitable[PerplexityResponse]]
+) -> PerplexityResponse:
+    """Answer from the persistent cache, or run one upstream request and cache it."""
+    response = await _load_persisted(cache_key)
+    if response is None:
+        async with _upstream_slots:
+            response = await _with_timeout(request())
+        await _store(cache_key, response)
+    return response
+
+
+async def _with_timeout(upstream: Awaitable[PerplexityResponse]) -> PerplexityResponse:
+    """Await an upstream request, giving up after MCP_REQUEST_TIMEOUT_S."""
+    timeout = config.mcp_request_timeout_s
+    try:
+        async with asyncio.timeout(timeout if timeout > 0 else None):
+            return await upstream
+    except TimeoutError:
+        raise TimeoutError(f"No answer from Perplexity within {timeout:g}s") from None
+
+
+async def _load_persisted(cache_key: tuple) -> Optional[PerplexityResponse]:
+    """Look a response up in the persistent cache, promoting hits to memory."""
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return None
+
+    try:
+        fields = await asyncio.to_thread(disk_cache.get, cache_key)
+    except sqlite3.Error as e:
+        # A locked or broken cache is a miss, not a failed tool call
+        logger.warning("Failed to read cached response: %s", e)
+        return None
+    if fields is None:
+        return None
+
+    response = PerplexityResponse(**fields)
+    _response_cache.set(cache_key, response)
+    return response
+
+
+async def _store(cache_key: tuple, response: PerplexityResponse) -> None:
+    """Cache a fresh upstream response in memory and, if enabled, on disk."""
+    # A stream that ended without an answer is not worth replaying
+    if not response.text:
+        return
+
+    _response_cache.set(cache_key, response)
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return
+
+    # raw_events are only needed while parsing and are not persisted
+    fields = {
+        "text": response.text,
+        "citations": response.citations,
+        "media_items": response.media_items,
+        "related_queries": response.related_queries,
+    }
+    try:
+        await asyncio.to_thread(disk_cache.set, cache_key, fields)
+    except sqlite3.Error as e:
+        logger.warning("Failed to persist cached response: %s", e)
+
+
 def _build_response(
-    response,
+    response: PerplexityResponse,
     include_citations: bool,
     include_related: bool,
-) -> dict:
+) -> SearchResult:
     """Build a response dict including only requested optional fields."""
-    result: dict = {"text": response.text or "No response received."}
+    result = SearchResult(text=response.text or "No response received.")
     if include_citations:
         result["citations"] = response.citations
     if include_related:
@@ -110,22 +346,57 @@ def _build_response(
     return result
 
 
-def _error_dict(error: Exception) -> dict:
+def _error_dict(error: Exception) -> SearchResult:
     """Build an error response with minimal shape."""
     msg = f"[Error] {type(error).__name__}: {error}"
     logger.error(msg)
-    return {"text": msg}
+    return SearchResult(text=msg)
 
 
-@mcp.tool()
-def perplexity_search(
+# Upstream options shared by every research request
+_RESEARCH_ASK_OPTIONS = {
+    "mode": "copilot",
+    "search_focus": "internet",
+    "sources": ["web", "scholar"],
+}
+
+
+def _build_research_prompt(topic: str, category: str) -> tuple[str, str]:
+    """Expand topic with its category template, falling back to "general".
+
+    Returns:
+        Tuple of (normalized category, research prompt)
+    """
+    dispatch = _research_dispatch()
+    # Common spellings hit in one lookup; anything else is normalized first
+    entry = (
+        dispatch.get(category)
+        or dispatch.get(category.strip().lower())
+        or dispatch["general"]
+    )
+
+    normalized_category, prefix, suffix = entry
+    return normalized_category, prefix + topic + suffix
+
+
+def _research_cache_key(category: str, topic: str, model_preference: str) -> tuple:
+    """Build the response cache key of a research request.
+
+    Keyed on the raw topic rather than the expanded prompt, which is cheaper
+    to hash and lets wording variants of the same topic share an entry.
+    """
+    return ("research", category, _normalize_text(topic), model_preference)
+
+
+@mcp.tool(structured_output=False)
+async def perplexity_search(
     query: str,
     sources: Optional[list[Literal["web", "scholar"]]] = None,
     include_citations: bool = False,
     include_related: bool = False,
     model_preference: str = DEFAULT_MODEL,
     mode: Literal["copilot", "search"] = "copilot",
-) -> dict:
+) -> SearchResult:
     """Search via Perplexity AI. Returns answer text; citations opt-in.
 
     Args:
@@ -145,9 +416,18 @@ def perplexity_search(
     selected_sources: list[str] = list(sources) if sources else ["web"]
     search_focus = "academic" if selected_sources == ["scholar"] else "internet"
 
+    cache_key = (
+        "search",
+        _normalize_text(query),
+        mode,
+        model_preference,
+        search_focus,
+        tuple(sorted(selected_sources)),
+    )
+
     try:
-        client = get_client()
-        response = client.ask(
+        response = await _cached_ask(
+            cache_key,
             query=query,
             mode=mode,
             model_preference=model_preference,
@@ -159,14 +439,63 @@ def perplexity_search(
         return _error_dict(e)
 
 
-@mcp.tool()
-def perplexity_research(
+@mcp.tool(structured_output=False)
+async def perplexity_batch(
+    queries: list[str],
+    sources: Optional[list[Literal["web", "scholar"]]] = None,
+    include_citations: bool = False,
+    include_related: bool = False,
+    model_preference: str = DEFAULT_MODEL,
+    mode: Literal["copilot", "search"] = "copilot",
+    max_concurrent: int = 4,
+) -> BatchResult:
+    """Run several searches concurrently. Options apply to every query.
+
+    Args:
+        queries: The search queries (at most 10).
+        sources: Search sources, as for perplexity_search.
+        include_citations: If True, include source citations in each result.
+        include_related: If True, include related query suggestions.
+        model_preference: AI model to use.
+        mode: "copilot" for comprehensive answers, "search" for quick results.
+        max_concurrent: Maximum number of queries in flight at once (1-8).
+
+    Returns:
+        Dict with "results": one perplexity_search result per query, in
+        order, each tagged with its "query". A failed query yields an
+        "[Error] ..." text without affecting the others.
+    """
+    if len(queries) > BATCH_MAX_QUERIES:
+        return BatchResult(
+            text=f"[Error] ValueError: At most {BATCH_MAX_QUERIES} queries "
+            f"per batch, got {len(queries)}"
+        )
+
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrent, BATCH_MAX_CONCURRENT)))
+
+    async def run(query: str) -> BatchItem:
+        async with semaphore:
+            result = await perplexity_search(
+                query,
+                sources=sources,
+                include_citations=include_citations,
+                include_related=include_related,
+                model_preference=model_preference,
+                mode=mode,
+            )
+        return BatchItem(query=query, **result)
+
+    return BatchResult(results=await asyncio.gather(*(run(query) for query in queries)))
+
+
+@mcp.tool(structured_output=False)
+async def perplexity_research(
     topic: str,
     category: ResearchCategory = "general",
     include_citations: bool = False,
     include_related: bool = False,
     model_preference: str = DEFAULT_MODEL,
-) -> dict:
+) -> SearchResult:
     """Research a topic with category-specific prompts. Citations opt-in.
 
     Args:
@@ -184,29 +513,116 @@ def perplexity_research(
         Dict with "text" always present. "citations" and "related_queries"
         included only when their respective flags are True.
     """
-    normalized_category = category.lower().strip()
-    if normalized_category not in VALID_CATEGORIES:
-        normalized_category = "general"
-
-    prompt_template = PROGRAMMING_RESEARCH_PROMPTS[normalized_category]
-    research_prompt = prompt_template.format(topic=topic)
+    normalized_category, research_prompt = _build_research_prompt(topic, category)
+    cache_key = _research_cache_key(normalized_category, topic, model_preference)
 
     try:
-        client = get_client()
-        response = client.ask(
+        response = await _cached_ask(
+            cache_key,
             query=research_prompt,
-            mode="copilot",
+            **_RESEARCH_ASK_OPTIONS,
             model_preference=model_preference,
-            search_focus="internet",
-            sources=["web", "scholar"],
         )
         return _build_response(response, include_citations, include_related)
     except Exception as e:
         return _error_dict(e)
 
 
+@mcp.tool(structured_output=False)
+async def perplexity_research_stream(
+    topic: str,
+    category: ResearchCategory = "general",
+    include_citations: bool = False,
+    include_related: bool = False,
+    model_preference: str = DEFAULT_MODEL,
+    ctx: Optional[Context] = None,
+) -> SearchResult:
+    """Research a topic like perplexity_research, streaming text as progress.
+
+    Answer text is forwarded in progress notifications as soon as it arrives,
+    so clients that send a progress token can render long research output
+    before the upstream response completes. The final result is identical
+    to perplexity_research. Failed connections are retried until answer
+    text starts arriving; a connection lost after that fails the call.
+
+    Args:
+        topic: The topic to research.
+        category: Research category, as for perplexity_research.
+        include_citations: If True, include source citations. Default False.
+        include_related: If True, include related query suggestions.
+        model_preference: AI model to use.
+
+    Returns:
+        Dict with "text" always present. "citations" and "related_queries"
+        included only when their respective flags are True.
+    """
+    normalized_category, research_prompt = _build_research_prompt(topic, category)
+    cache_key = _research_cache_key(normalized_category, topic, model_preference)
+
+    try:
+        # Callers that join a running request get the result without progress
+        response = await _coalesce(
+            cache_key,
+            lambda: _stream_research(
+                ctx,
+                query=research_prompt,
+                **_RESEARCH_ASK_OPTIONS,
+                model_preference=model_preference,
+            ),
+        )
+        return _build_response(response, include_citations, include_related)
+    except Exception as e:
+        return _error_dict(e)
+
+
+async def _stream_research(ctx: Optional[Context], **ask_kwargs) -> PerplexityResponse:
+    """Ask Perplexity, reporting answer text to ctx as progress as it arrives."""
+    response = PerplexityResponse()
+    streamed = ""
+    async for response in get_client().ask_partial_async(**ask_kwargs):
+        # Only forward text that extends what was already sent; the final
+        # event may rewrite the answer, which the returned result carries
+        text = response.text
+        if ctx is not None and text != streamed and text.startswith(streamed):
+            try:
+                await ctx.report_progress(len(text), message=text[len(streamed) :])
+            except Exception as e:
+                # The request is shared, so a caller that went away must not
+                # fail it for the others; stop reporting and keep reading
+                logger.debug("Stopped research progress reporting: %s", e)
+                ctx = None
+                continue
+            streamed = text
+    return response
+
+
+def _warm_client() -> None:
+    """Create the Perplexity client ahead of the first tool call."""
+    try:
+        get_client()
+    except ValueError as e:
+        # Keep serving; tool calls report the configuration error themselves
+        logger.warning("Perplexity client not initialized: %s", e)
+
+
+def _run_stdio() -> None:
+    """Serve over stdio, on uvloop when it is installed."""
+    import anyio
+
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        backend_options = {}
+    else:
+        backend_options = {"use_uvloop": True}
+
+    anyio.run(mcp.run_stdio_async, backend_options=backend_options)
+
+
 if __name__ == "__main__":
-    from src.config import config
+    # Pay client setup during server start-up rather than on the first call
+    _warm_client()
+    get_disk_cache()
 
     if config.mcp_transport_mode == "http":
         import uvicorn
@@ -219,6 +635,9 @@ if __name__ == "__main__":
             app,
             host=config.mcp_http_host,
             port=config.mcp_http_port,
+            # loop="auto" already selects uvloop when installed (not on Windows)
+            http="httptools",
+            access_log=config.debug,
         )
     else:
-        mcp.run()
+        _run_stdio()
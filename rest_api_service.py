@@ -7,33 +7,49 @@ Run with: python rest_server.py
 
 import logging
 from contextlib import asynccontextmanager
+import orjson
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.routing import Route
 
 from src.config import config
+from src.api.dependencies import close_perplexity_client
 from src.api.routes import router
 from src.api.error_handlers import register_error_handlers
+from src.api.middleware import (
+    BodySizeLimitMiddleware,
+    RESTAuthMiddleware,
+    StaticCORSMiddleware,
+)
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, config.log_level, logging.WARNING),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Interactive docs and the OpenAPI schema are only exposed in debug runs, so
+# production instances never build the schema or register the docs routes
+DOCS_URL = "/docs" if config.debug else None
+REDOC_URL = "/redoc" if config.debug else None
+OPENAPI_URL = "/openapi.json" if config.debug else None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
-    logger.info(f"Starting {config.api_title} v{config.api_version}")
+    logger.info("Starting %s v%s", config.api_title, config.api_version)
     logger.info(
-        f"Server running at http://{config.rest_api_host}:{config.rest_api_port}"
+        "Server running at http://%s:%s", config.rest_api_host, config.rest_api_port
     )
-    logger.info("Documentation available at /docs")
+    if DOCS_URL:
+        logger.info("Documentation available at %s", DOCS_URL)
     yield
-    # Shutdown (if needed in future)
+    # Shutdown
+    await close_perplexity_client()
 
 
 # Create FastAPI app
@@ -41,19 +57,21 @@ app = FastAPI(
     title=config.api_title,
     version=config.api_version,
     description="OpenAI-compatible REST API for Perplexity AI",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url=DOCS_URL,
+    redoc_url=REDOC_URL,
+    openapi_url=OPENAPI_URL,
     lifespan=lifespan,
 )
 
+# Check API keys for /v1/* before routing; added first so it runs inside CORS
+app.add_middleware(RESTAuthMiddleware)
+
+# Reject oversized request bodies before they are read or validated
+# Added before CORS so the 413 still carries CORS headers
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=config.max_request_body_bytes)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(StaticCORSMiddleware)
 
 # Register error handlers
 register_error_handlers(app)
@@ -62,20 +80,26 @@ register_error_handlers(app)
 app.include_router(router)
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
-        "name": config.api_title,
-        "version": config.api_version,
-        "status": "running",
-        "endpoints": {
-            "chat_completions": "/v1/chat/completions",
-            "models": "/v1/models",
-            "health": "/health",
-            "docs": "/docs",
-        },
-    }
+# Root endpoint
+# The payload is static, so it is serialized once and served from a shared
+# Response instance, which Starlette treats as a plain ASGI app
+ROOT_RESPONSE = Response(
+    content=orjson.dumps(
+        {
+            "name": config.api_title,
+            "version": config.api_version,
+            "status": "running",
+            "endpoints": {
+                "chat_completions": "/v1/chat/completions",
+                "models": "/v1/models",
+                "health": "/health",
+                "docs": DOCS_URL,
+            },
+        }
+    ),
+    media_type="application/json",
+)
+app.router.routes.insert(0, Route("/", endpoint=ROOT_RESPONSE, methods=["GET"]))
 
 
 if __name__ == "__main__":
@@ -83,5 +107,9 @@ if __name__ == "__main__":
         "rest_api_service:app",
         host=config.rest_api_host,
         port=config.rest_api_port,
-        reload=True,
+        reload=config.dev_reload,
+        workers=config.workers,
+        # loop="auto" already selects uvloop when installed (not on Windows)
+        http="httptools",
+        access_log=config.debug,
     )
@@ -5,10 +5,12 @@ Provides shared dependencies for API routes.
 """
 
 import logging
+import threading
 from typing import Optional
 
 from fastapi import Depends
 
+from src.config import config
 from src.core.perplexity_client import PerplexityClient
 from src.core.security import verify_api_key
 
@@ -21,12 +23,17 @@ logger = logging.getLogger(__name__)
 
 # Lazily initialized Perplexity client
 _perplexity_client: Optional[PerplexityClient] = None
+# Sync dependencies run in worker threads, so creation is guarded by a lock
+_client_lock = threading.Lock()
 
 
 def get_perplexity_client() -> PerplexityClient:
     """
     Get or create the Perplexity client singleton.
 
+    The MCP server uses the same instance, so a unified deployment keeps a
+    single client and connection pool.
+
     Returns:
         The shared PerplexityClient instance.
 
@@ -35,10 +42,25 @@ def get_perplexity_client() -> PerplexityClient:
     """
     global _perplexity_client
     if _perplexity_client is None:
-        _perplexity_client = PerplexityClient()
+        with _client_lock:
+            # Re-check: another thread may have created it while we waited
+            if _perplexity_client is None:
+                # REST requests share the pool, so it is sized on its own
+                # setting, but never below the MCP upstream slots
+                _perplexity_client = PerplexityClient(
+                    max_connections=max(
+                        1, config.perplexity_max_connections, config.mcp_max_inflight
+                    )
+                )
     return _perplexity_client
 
 
+async def close_perplexity_client() -> None:
+    """Release the singleton's async connections on application shutdown."""
+    if _perplexity_client is not None:
+        await _perplexity_client.aclose()
+
+
 # ============================================================================
 # FastAPI Dependencies
 # ============================================================================
@@ -5,11 +5,14 @@ Exception classes and FastAPI exception handlers for OpenAI format errors.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 
+from src.api.responses import OrjsonResponse
 from src.models.openai_models import APIErrorResponse, ErrorDetail
 
 logger = logging.getLogger(__name__)
@@ -127,49 +130,68 @@ async def openai_api_error_handler(
     request: Request, exc: OpenAIAPIError
 ) -> JSONResponse:
     """Handle OpenAI API errors."""
-    logger.warning(f"API Error: {exc.error_type} - {exc.message}")
-    return JSONResponse(
+    logger.warning("API Error: %s - %s", exc.error_type, exc.message)
+    return OrjsonResponse(
         status_code=exc.status_code,
         content=exc.to_response().model_dump(),
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    """Convert FastAPI HTTPException to OpenAI format."""
-    error_type_map = {
-        400: "invalid_request_error",
-        401: "authentication_error",
-        404: "not_found_error",
-        429: "rate_limit_error",
-        500: "api_error",
-        503: "service_unavailable_error",
-    }
-    error_type = error_type_map.get(exc.status_code, "api_error")
+# HTTP status code -> OpenAI error type for converted HTTPExceptions
+_HTTP_ERROR_TYPES = {
+    400: "invalid_request_error",
+    401: "authentication_error",
+    404: "not_found_error",
+    413: "invalid_request_error",
+    429: "rate_limit_error",
+    500: "api_error",
+    503: "service_unavailable_error",
+}
+
 
+@lru_cache(maxsize=256)
+def http_error_body(status_code: int, message: str) -> bytes:
+    """
+    Serialize the OpenAI error body for an HTTPException.
+
+    HTTPExceptions are raised with a small set of fixed details (auth
+    failures, unknown routes, disallowed methods), so bodies are memoized per
+    (status_code, message) pair instead of being rebuilt for every request.
+    """
     response = APIErrorResponse(
         error=ErrorDetail(
-            message=str(exc.detail),
-            type=error_type,
+            message=message,
+            type=_HTTP_ERROR_TYPES.get(status_code, "api_error"),
         )
     )
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=response.model_dump(),
-    )
+    return orjson.dumps(response.model_dump())
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle unexpected exceptions in OpenAI format."""
-    logger.exception(f"Unexpected error: {exc}")
-    response = APIErrorResponse(
+# The body for unexpected exceptions never varies, so it is serialized once
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    APIErrorResponse(
         error=ErrorDetail(
             message="Internal server error",
             type="api_error",
         )
+    ).model_dump()
+)
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    """Convert FastAPI HTTPException to OpenAI format."""
+    return OrjsonResponse(
+        status_code=exc.status_code,
+        content=http_error_body(exc.status_code, str(exc.detail)),
     )
-    return JSONResponse(
+
+
+async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Handle unexpected exceptions in OpenAI format."""
+    logger.exception("Unexpected error: %s", exc)
+    return OrjsonResponse(
         status_code=500,
-        content=response.model_dump(),
+        content=_INTERNAL_ERROR_BODY,
     )
 
 
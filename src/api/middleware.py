@@ -0,0 +1,262 @@
+"""
+Pure ASGI middleware for the REST API.
+
+These middlewares operate directly on the ASGI scope/send callables instead of
+subclassing BaseHTTPMiddleware, so no Request/Response objects are built on
+the hot path.
+"""
+
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.error_handlers import http_error_body
+from src.core.security import api_key_error
+
+
+# ============================================================================
+# CORS
+# ============================================================================
+
+# The CORS policy is fully static (any origin, method and header), so the
+# response headers are built once at import time. Credentials are not allowed:
+# browsers reject a wildcard origin on credentialed requests, and the API is
+# authenticated with the X-API-Key header rather than cookies.
+STATIC_CORS_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+    (b"vary", b"Origin"),
+]
+
+# Browsers may reuse a preflight answer for this many seconds (Chromium caps
+# it at 2 hours, Firefox at 24), so repeat requests skip the extra round-trip
+CORS_MAX_AGE = 86400
+
+_PREFLIGHT_RESPONSE_HEADERS: list[tuple[bytes, bytes]] = STATIC_CORS_HEADERS + [
+    (b"access-control-max-age", str(CORS_MAX_AGE).encode()),
+    (b"content-length", b"0"),
+]
+
+# A wildcard allow-headers never covers Authorization, so preflights echo the
+# requested headers instead, as CORSMiddleware does with allow_headers=["*"]
+_PREFLIGHT_BASE_HEADERS: list[tuple[bytes, bytes]] = [
+    header
+    for header in _PREFLIGHT_RESPONSE_HEADERS
+    if header[0] != b"access-control-allow-headers"
+]
+
+
+class StaticCORSMiddleware:
+    """
+    CORS middleware that appends a precomputed header list to every response.
+
+    Equivalent to CORSMiddleware with allow_origins=["*"], allow_methods=["*"]
+    and allow_headers=["*"], but skips per-request origin matching and header
+    construction. Preflight requests are answered directly without reaching
+    the wrapped app, echoing Access-Control-Request-Headers so that headers
+    a wildcard cannot cover (Authorization) are allowed, and may be cached by
+    the browser for CORS_MAX_AGE.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            is_preflight, requested_headers = _preflight_info(scope)
+            if is_preflight:
+                if requested_headers is None:
+                    headers = _PREFLIGHT_RESPONSE_HEADERS
+                else:
+                    headers = _PREFLIGHT_BASE_HEADERS + [
+                        (b"access-control-allow-headers", requested_headers)
+                    ]
+                await send(
+                    {"type": "http.response.start", "status": 200, "headers": headers}
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = (
+                    list(message.get("headers", ())) + STATIC_CORS_HEADERS
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+def _preflight_info(scope: Scope) -> tuple[bool, Optional[bytes]]:
+    """
+    Inspect an OPTIONS request for CORS preflight headers.
+
+    Returns whether it is a preflight request, and the value of its
+    Access-Control-Request-Headers header if one was sent.
+    """
+    is_preflight = False
+    requested_headers = None
+    for key, value in scope["headers"]:
+        if key == b"access-control-request-method":
+            is_preflight = True
+        elif key == b"access-control-request-headers":
+            requested_headers = value
+    return is_preflight, requested_headers
+
+
+# ============================================================================
+# Static Route Fast Path
+# ============================================================================
+
+
+class StaticRouteFastPath:
+    """
+    Dispatch known static paths with a single dict lookup.
+
+    Starlette's router compares the request against each route's compiled
+    path regex in order. For plain ASGI endpoints registered at fixed paths,
+    this middleware resolves the handler with one (method, path) lookup and
+    falls through to the wrapped app for everything else.
+
+    Only raw ASGI endpoints should be registered here. FastAPI routes rely on
+    the exception handling and dependency machinery behind the router.
+    """
+
+    __slots__ = ("app", "routes")
+
+    def __init__(self, app: ASGIApp, routes: dict[tuple[str, str], ASGIApp]):
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            handler = self.routes.get((scope["method"], _route_path(scope)))
+            if handler is not None:
+                await handler(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+
+# ============================================================================
+# Request Body Size Limit
+# ============================================================================
+
+_CONTENT_LENGTH_HEADER = b"content-length"
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject requests whose declared body exceeds a fixed size with a 413.
+
+    The Content-Length header is checked before the body is read, so an
+    oversized payload never reaches JSON decoding or Pydantic validation of
+    its messages. Requests without a Content-Length pass through. A
+    max_bytes of 0 disables the check.
+    """
+
+    __slots__ = ("app", "max_bytes", "_body")
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+        self._body = http_error_body(
+            413, f"Request body too large. Maximum size is {max_bytes} bytes."
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.max_bytes:
+            length = next(
+                (v for k, v in scope["headers"] if k == _CONTENT_LENGTH_HEADER), None
+            )
+            if length is not None and length.isdigit() and int(length) > self.max_bytes:
+                await _send_error(send, 413, self._body)
+                return
+
+        await self.app(scope, receive, send)
+
+
+# ============================================================================
+# Authentication
+# ============================================================================
+
+# Header names in ASGI scopes are lowercased bytes
+_AUTH_HEADER = b"x-api-key"
+_WWW_AUTHENTICATE_HEADERS = ((b"www-authenticate", b"ApiKey"),)
+
+
+class RESTAuthMiddleware:
+    """
+    API key authentication for the REST endpoints, checked before routing.
+
+    Requests under one of the protected path prefixes must carry a valid
+    X-API-Key header when auth is enabled. Rejections get the same OpenAI
+    error body as the verify_api_key dependency, from the memoized error
+    bodies, without building a Request or resolving route dependencies.
+    Other paths (health check, docs, MCP) pass through untouched. Prefixes
+    are matched after the root_path, as the router matches its routes, so
+    an app mounted or proxied under a prefix is protected all the same.
+    """
+
+    __slots__ = ("app", "prefixes")
+
+    def __init__(self, app: ASGIApp, prefixes: tuple[str, ...] = ("/v1/",)):
+        self.app = app
+        self.prefixes = prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _route_path(scope).startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        api_key = next((v for k, v in scope["headers"] if k == _AUTH_HEADER), None)
+        error = api_key_error(api_key)
+        if error is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _send_error(
+            send, 401, http_error_body(401, error), _WWW_AUTHENTICATE_HEADERS
+        )
+
+
+def _route_path(scope: Scope) -> str:
+    """Return the request path without the root_path, as the router sees it."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    # Same rule as Starlette's routing: strip root_path at a segment boundary
+    if (
+        root_path
+        and path.startswith(root_path)
+        and path[len(root_path) :][:1] in ("/", "")
+    ):
+        return path[len(root_path) :]
+    return path
+
+
+async def _send_error(
+    send: Send,
+    status: int,
+    body: bytes,
+    extra_headers: tuple[tuple[bytes, bytes], ...] = (),
+) -> None:
+    """Send a response with a pre-serialized JSON error body."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *extra_headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,26 @@
+"""
+Response classes for the REST API.
+
+FastAPI already serializes routes with a response model or return type
+through Pydantic's compiled serializer. These classes cover the responses we
+build by hand (error handlers, static payloads).
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson instead of the stdlib json module.
+
+    Content that is already bytes is treated as a pre-serialized JSON body
+    and sent as-is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content)
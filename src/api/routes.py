@@ -5,8 +5,9 @@ API routes for OpenAI-compatible REST API.
 import logging
 from typing import Union
 
+import orjson
 from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from src.core.perplexity_client import PerplexityClient
 from src.models.openai_models import (
@@ -16,7 +17,7 @@ from src.models.openai_models import (
     ModelInfo,
 )
 from src.models.model_mapping import list_available_models
-from src.api.dependencies import get_client, get_api_key
+from src.api.dependencies import get_client
 from src.services.chat_completion_service import ChatCompletionService
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,6 @@ router = APIRouter()
 async def chat_completions(
     request: ChatCompletionRequest,
     client: PerplexityClient = Depends(get_client),
-    api_key: str = Depends(get_api_key),
 ) -> Union[ChatCompletionResponse, StreamingResponse]:
     """
     Create a chat completion.
@@ -46,38 +46,38 @@ async def chat_completions(
 
     Note: All requests are processed in incognito mode and won't appear
     in your Perplexity dashboard.
+
+    Authentication for /v1/* routes is enforced by RESTAuthMiddleware
+    before the request reaches the router.
     """
     logger.info(
-        f"Chat completion request: model={request.model}, stream={request.stream}"
+        "Chat completion request: model=%s, stream=%s", request.model, request.stream
     )
 
     service = ChatCompletionService(client)
-    return service.handle_request(request)
-
-
-@router.get("/v1/models", response_model=ModelListResponse)
-async def list_models(
-    api_key: str = Depends(get_api_key),
-) -> ModelListResponse:
-    """
-    List available models.
-
-    Returns a list of models available for chat completions.
-    This endpoint is compatible with the OpenAI Models API.
-    """
-    models = [
-        ModelInfo(id=model_id, owned_by="perplexity")
-        for model_id in list_available_models()
-    ]
-    return ModelListResponse(data=models)
-
-
-@router.get("/health")
-async def health_check() -> dict:
-    """
-    Health check endpoint.
+    return await service.handle_request_async(request)
+
+
+# /v1/models and /health return constant payloads. Like the root endpoint,
+# each is serialized once and served from a shared Response instance, which
+# Starlette treats as a plain ASGI app, so no per-request validation or
+# serialization runs. The model registry is fixed at import, so the
+# created timestamps are frozen at start-up.
+MODELS_RESPONSE = Response(
+    content=orjson.dumps(
+        ModelListResponse(
+            data=[
+                ModelInfo(id=model_id, owned_by="perplexity")
+                for model_id in list_available_models()
+            ]
+        ).model_dump()
+    ),
+    media_type="application/json",
+)
+router.add_route("/v1/models", MODELS_RESPONSE, methods=["GET"])
 
-    Returns:
-        Simple status object indicating the service is running.
-    """
-    return {"status": "ok", "service": "perplexity-openai-api"}
+HEALTH_RESPONSE = Response(
+    content=orjson.dumps({"status": "ok", "service": "perplexity-openai-api"}),
+    media_type="application/json",
+)
+router.add_route("/health", HEALTH_RESPONSE, methods=["GET"])
@@ -5,21 +5,30 @@ Loads environment variables and provides centralized configuration.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """
+    Application configuration.
+
+    Frozen: values are read once at start-up and never change afterwards,
+    so derived settings such as auth_enabled are stored as plain fields.
+    """
 
     # REST API settings
     rest_api_host: str = "127.0.0.1"
     rest_api_port: int = 8045
 
+    # Server process settings
+    dev_reload: bool = False
+    workers: int = 1
+
     # Perplexity defaults
     default_model: str = "gpt56_terra_thinking"
     default_mode: str = "copilot"
@@ -28,6 +37,20 @@ class Config:
     # API settings
     api_title: str = "Perplexity OpenAI-Compatible API"
     api_version: str = "1.0.0"
+    debug: bool = False
+    log_level: str = "WARNING"
+    # Largest request body accepted by the HTTP services (0 disables)
+    max_request_body_bytes: int = 1048576
+
+    # MCP response cache (0 disables)
+    perplexity_cache_ttl: float = 3600.0
+    perplexity_cache_size: int = 512
+    # Persistent response cache directory ("" disables)
+    perplexity_cache_dir: str = ""
+    perplexity_disk_cache_ttl: float = 86400.0
+    # Upstream connections shared by REST and MCP requests; further requests
+    # wait for a free connection
+    perplexity_max_connections: int = 64
 
     # Authentication settings
     api_key: str = ""
@@ -36,25 +59,50 @@ class Config:
     mcp_transport_mode: str = "stdio"  # "stdio" or "http"
     mcp_http_host: str = "127.0.0.1"
     mcp_http_port: int = 8000
+    # "memory" keeps MCP sessions in the serving process; "stateless" creates
+    # a fresh transport per request so any worker can serve any client
+    mcp_session_backend: str = "memory"
+    # Upper bound on concurrent upstream Perplexity requests per process
+    mcp_max_inflight: int = 16
+    # Seconds an MCP tool waits for one upstream answer (0 disables)
+    mcp_request_timeout_s: float = 600.0
+
+    # Derived: API key authentication is enabled when api_key is set
+    auth_enabled: bool = field(init=False, default=False)
 
-    @property
-    def auth_enabled(self) -> bool:
-        """Check if API key authentication is enabled."""
-        return bool(self.api_key)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "auth_enabled", bool(self.api_key))
 
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
+        # One snapshot instead of a locked os.environ lookup per setting
+        env = os.environ.copy()
         return cls(
-            rest_api_host=os.getenv("REST_API_HOST", "127.0.0.1"),
-            rest_api_port=int(os.getenv("REST_API_PORT", "8045")),
-            default_model=os.getenv("DEFAULT_MODEL", "gpt56_terra_thinking"),
-            default_mode=os.getenv("DEFAULT_MODE", "copilot"),
-            default_search_focus=os.getenv("DEFAULT_SEARCH_FOCUS", "internet"),
-            api_key=os.getenv("API_KEY", ""),
-            mcp_transport_mode=os.getenv("MCP_TRANSPORT_MODE", "stdio"),
-            mcp_http_host=os.getenv("MCP_HTTP_HOST", "127.0.0.1"),
-            mcp_http_port=int(os.getenv("MCP_HTTP_PORT", "8000")),
+            rest_api_host=env.get("REST_API_HOST", "127.0.0.1"),
+            rest_api_port=int(env.get("REST_API_PORT", "8045")),
+            dev_reload=env.get("DEV_RELOAD", "").lower() in ("true", "1", "yes"),
+            workers=int(env.get("WORKERS", "1")),
+            default_model=env.get("DEFAULT_MODEL", "gpt56_terra_thinking"),
+            default_mode=env.get("DEFAULT_MODE", "copilot"),
+            default_search_focus=env.get("DEFAULT_SEARCH_FOCUS", "internet"),
+            debug=env.get("DEBUG", "").lower() in ("true", "1", "yes"),
+            log_level=env.get("LOG_LEVEL", "WARNING").upper(),
+            max_request_body_bytes=int(env.get("MAX_REQUEST_BODY_BYTES", "1048576")),
+            perplexity_cache_ttl=float(env.get("PERPLEXITY_CACHE_TTL", "3600")),
+            perplexity_cache_size=int(env.get("PERPLEXITY_CACHE_SIZE", "512")),
+            perplexity_cache_dir=env.get("PERPLEXITY_CACHE_DIR", ""),
+            perplexity_disk_cache_ttl=float(
+                env.get("PERPLEXITY_DISK_CACHE_TTL", "86400")
+            ),
+            perplexity_max_connections=int(env.get("PERPLEXITY_MAX_CONNECTIONS", "64")),
+            api_key=env.get("API_KEY", ""),
+            mcp_transport_mode=env.get("MCP_TRANSPORT_MODE", "stdio"),
+            mcp_http_host=env.get("MCP_HTTP_HOST", "127.0.0.1"),
+            mcp_http_port=int(env.get("MCP_HTTP_PORT", "8000")),
+            mcp_session_backend=env.get("MCP_SESSION_BACKEND", "memory").lower(),
+            mcp_max_inflight=int(env.get("MCP_MAX_INFLIGHT", "16")),
+            mcp_request_timeout_s=float(env.get("MCP_REQUEST_TIMEOUT_S", "600")),
         )
 
 
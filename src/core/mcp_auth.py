@@ -5,16 +5,37 @@ Provides API key authentication for MCP HTTP transport.
 """
 
 import secrets
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.config import config
 
+# Header names in ASGI scopes are lowercased bytes
+_AUTH_HEADER = b"x-api-key"
+
+
+def _unauthorized_body(message: str) -> bytes:
+    """Serialize a JSON-RPC unauthorized error."""
+    return orjson.dumps(
+        {
+            "jsonrpc": "2.0",
+            "error": {"code": -32001, "message": message},
+            "id": None,
+        }
+    )
+
+
+# The error payloads never change, so they are serialized once at import
+_MISSING_KEY_BODY = _unauthorized_body(
+    "Unauthorized: Missing API key. Provide X-API-Key header."
+)
+_INVALID_KEY_BODY = _unauthorized_body("Unauthorized: Invalid API key.")
+
 
-class MCPAuthMiddleware(BaseHTTPMiddleware):
+class MCPAuthMiddleware:
     """
-    Starlette middleware for API key authentication on MCP HTTP endpoints.
+    ASGI middleware for API key authentication on MCP HTTP endpoints.
 
     When auth is enabled (API_KEY env var set):
     - Requires X-API-Key header on all requests
@@ -23,42 +44,47 @@ class MCPAuthMiddleware(BaseHTTPMiddleware):
 
     When auth is disabled (API_KEY empty):
     - Allows all requests through
+
+    Implemented as a pure ASGI middleware: the header is read straight from
+    the scope, so no Request object is built per MCP call.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        """Process request and check authentication."""
-        # Skip auth if disabled
-        if not config.auth_enabled:
-            return await call_next(request)
+    __slots__ = ("app",)
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip non-HTTP scopes and disabled auth
+        if scope["type"] != "http" or not config.auth_enabled:
+            await self.app(scope, receive, send)
+            return
 
         # Check X-API-Key header
-        api_key = request.headers.get("X-API-Key")
+        api_key = next((v for k, v in scope["headers"] if k == _AUTH_HEADER), None)
 
         if not api_key:
-            return JSONResponse(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32001,
-                        "message": "Unauthorized: Missing API key. Provide X-API-Key header.",
-                    },
-                    "id": None,
-                },
-                status_code=401,
-            )
+            await _send_unauthorized(send, _MISSING_KEY_BODY)
+            return
 
         # Timing-safe comparison to prevent timing attacks
-        if not secrets.compare_digest(api_key, config.api_key):
-            return JSONResponse(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32001,
-                        "message": "Unauthorized: Invalid API key.",
-                    },
-                    "id": None,
-                },
-                status_code=401,
-            )
-
-        return await call_next(request)
+        if not secrets.compare_digest(api_key, config.api_key.encode()):
+            await _send_unauthorized(send, _INVALID_KEY_BODY)
+            return
+
+        await self.app(scope, receive, send)
+
+
+async def _send_unauthorized(send: Send, body: bytes) -> None:
+    """Send a 401 response with a pre-serialized JSON body."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
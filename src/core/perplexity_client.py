@@ -5,16 +5,95 @@ A Python wrapper for the Perplexity AI web interface API.
 Uses curl_cffi to bypass Cloudflare protection.
 """
 
-import json
+import asyncio
+import functools
+import logging
 import os
-import uuid
-from typing import Generator, Optional, Any
+import random
+import re
+import time
+from typing import AsyncGenerator, Generator, Optional, Any
 from dataclasses import dataclass, field
+import orjson
 from dotenv import load_dotenv
 from curl_cffi import requests as cffi_requests
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests import exceptions as cffi_exceptions
+
+logger = logging.getLogger(__name__)
+
+# A complete SSE data line, optionally indented; the payload is group 1.
+# orjson skips the whitespace (including \r) around the JSON itself.
+_DATA_LINE_RE = re.compile(rb"^[ \t\r\f\v]*data:([^\n]*)\n", re.MULTILINE)
+
+# Shared read-only fallbacks for missing keys in upstream events, so lookups
+# that miss don't allocate a fresh {} or [] each time. Never mutate these.
+_EMPTY_DICT: dict = {}
+_EMPTY_LIST: list = []
+
+
+# Answer block types the client declares support for. Sent on every request
+# and never mutated, so one shared tuple (serialized as a JSON array) is used.
+_SUPPORTED_BLOCK_USE_CASES = (
+    "answer_modes",
+    "media_items",
+    "knowledge_cards",
+    "inline_entity_cards",
+    "place_widgets",
+    "finance_widgets",
+    "prediction_market_widgets",
+    "sports_widgets",
+    "flight_status_widgets",
+    "news_widgets",
+    "shopping_widgets",
+    "jobs_widgets",
+    "search_result_widgets",
+    "inline_images",
+    "inline_assets",
+    "placeholder_cards",
+    "diff_blocks",
+    "inline_knowledge_cards",
+    "entity_group_v2",
+    "refinement_filters",
+    "canvas_mode",
+    "maps_preview",
+    "answer_tabs",
+    "price_comparison_widgets",
+    "preserve_latex",
+    "generic_onboarding_widgets",
+    "in_context_suggestions",
+    "pending_followups",
+    "inline_claims",
+    "unified_assets",
+    "workflow_steps",
+    "background_agents",
+)
+
+
+@functools.cache
+def _load_env(env_path: Optional[str]) -> None:
+    """
+    Load a .env file into the process environment, once per path.
+
+    The environment is process-wide, so re-reading the same file for every
+    client construction only costs a file read and parse.
+    """
+    if env_path:
+        load_dotenv(env_path)
+    else:
+        load_dotenv()
+
+
+def _fast_uuid4() -> str:
+    """Return a random version 4 UUID string without building a UUID object."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PerplexityResponse:
     """Structured response from Perplexity API."""
 
@@ -31,17 +110,26 @@ class PerplexityClient:
     BASE_URL = "https://www.perplexity.ai"
     SSE_ENDPOINT = "/rest/sse/perplexity_ask"
 
-    def __init__(self, env_path: Optional[str] = None):
+    # Transient transport failures that ask/ask_async retry with backoff
+    RETRYABLE_ERRORS = (
+        cffi_exceptions.Timeout,
+        cffi_exceptions.ConnectionError,
+        cffi_exceptions.IncompleteRead,
+    )
+    MAX_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+
+    def __init__(self, env_path: Optional[str] = None, max_connections: int = 10):
         """
         Initialize the Perplexity client.
 
         Args:
             env_path: Optional path to .env file. Defaults to current directory.
+            max_connections: Concurrent requests the async session runs at
+                once; further requests queue inside curl_cffi.
         """
-        if env_path:
-            load_dotenv(env_path)
-        else:
-            load_dotenv()
+        _load_env(env_path)
 
         self.session_token = os.getenv("PERPLEXITY_SESSION_TOKEN")
         self.cf_bm = os.getenv("PERPLEXITY_CF_BM")
@@ -55,6 +143,79 @@ class PerplexityClient:
                 "Please set PERPLEXITY_SESSION_TOKEN in your .env file."
             )
 
+        # Reused across requests so keep-alive connections and TLS sessions
+        # to perplexity.ai survive between calls. curl_cffi keeps one curl
+        # handle per thread, so the session is safe to share with the REST
+        # API's worker threads.
+        self._session = cffi_requests.Session()
+
+        # AsyncSession is bound to the event loop it was first used on, so it
+        # is created lazily from inside the running loop and must be closed
+        # with aclose() before the client is used from another loop
+        self._async_session: Optional[AsyncSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._max_connections = max_connections
+
+        # Request parts that never change, built once and reused by every
+        # request. The cookies come from the environment read above. Fields
+        # set to None in the params template are per-request and filled in
+        # by _build_payload; nested values are shared, so treat the template
+        # as read-only.
+        self._cookies = self._build_cookies()
+        self._base_headers = {
+            "accept": "text/event-stream",
+            "accept-language": "en-US,en;q=0.9,id;q=0.8,nb;q=0.7",
+            "content-type": "application/json",
+            "origin": self.BASE_URL,
+            "referer": f"{self.BASE_URL}/",
+            "sec-ch-ua": '"Chromium";v="146", "Not-A.Brand";v="24", "Microsoft Edge";v="146"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Linux"',
+            "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36 Edg/146.0.0.0",
+            "x-perplexity-request-endpoint": f"{self.BASE_URL}{self.SSE_ENDPOINT}",
+            "x-perplexity-request-reason": "perplexity-query-state-provider",
+            "x-perplexity-request-try-number": "1",
+        }
+        self._params_template: dict[str, Any] = {
+            "attachments": [],
+            "language": None,
+            "timezone": None,
+            "search_focus": None,
+            "sources": None,
+            "frontend_uuid": None,
+            "mode": None,
+            "model_preference": None,
+            "is_related_query": False,
+            "is_sponsored": False,
+            "frontend_context_uuid": None,
+            "prompt_source": "user",
+            "query_source": "home",
+            "is_incognito": None,
+            "time_from_first_type": 4395.6,
+            "local_search_enabled": False,
+            "use_schematized_api": True,
+            "send_back_text_in_streaming_api": False,
+            "supported_block_use_cases": _SUPPORTED_BLOCK_USE_CASES,
+            "client_coordinates": None,
+            "mentions": [],
+            "dsl_query": None,
+            "skip_search_enabled": True,
+            "is_nav_suggestions_disabled": False,
+            "source": "default",
+            "always_search_override": False,
+            "override_no_search": False,
+            "client_search_results_cache_key": None,
+            "should_ask_for_mcp_tool_confirmation": True,
+            "browser_agent_allow_once_from_toggle": False,
+            "force_enable_browser_agent": False,
+            "supported_features": [
+                "browser_agent_permission_banner_v1.1",
+            ],
+            "extended_context": False,
+            "version": "2.18",
+            "rum_session_id": None,
+        }
+
     def _build_cookies(self) -> dict:
         """Build cookies dict for requests."""
         cookies = {
@@ -71,21 +232,7 @@ class PerplexityClient:
 
     def _build_headers(self, request_id: str) -> dict[str, str]:
         """Build request headers."""
-        return {
-            "accept": "text/event-stream",
-            "accept-language": "en-US,en;q=0.9,id;q=0.8,nb;q=0.7",
-            "content-type": "application/json",
-            "origin": self.BASE_URL,
-            "referer": f"{self.BASE_URL}/",
-            "sec-ch-ua": '"Chromium";v="146", "Not-A.Brand";v="24", "Microsoft Edge";v="146"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Linux"',
-            "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36 Edg/146.0.0.0",
-            "x-perplexity-request-endpoint": f"{self.BASE_URL}{self.SSE_ENDPOINT}",
-            "x-perplexity-request-reason": "perplexity-query-state-provider",
-            "x-perplexity-request-try-number": "1",
-            "x-request-id": request_id,
-        }
+        return {**self._base_headers, "x-request-id": request_id}
 
     def _build_payload(
         self,
@@ -110,98 +257,27 @@ class PerplexityClient:
             timezone: Timezone string
             is_incognito: If True, query won't appear in Perplexity dashboard
         """
-        frontend_uuid = str(uuid.uuid4())
-        context_uuid = str(uuid.uuid4())
-
-        return {
-            "params": {
-                "attachments": [],
-                "language": language,
-                "timezone": timezone,
-                "search_focus": search_focus,
-                "sources": sources or ["web", "scholar"],
-                "frontend_uuid": frontend_uuid,
-                "mode": mode,
-                "model_preference": model_preference,
-                "is_related_query": False,
-                "is_sponsored": False,
-                "frontend_context_uuid": context_uuid,
-                "prompt_source": "user",
-                "query_source": "home",
-                "is_incognito": is_incognito,
-                "time_from_first_type": 4395.6,
-                "local_search_enabled": False,
-                "use_schematized_api": True,
-                "send_back_text_in_streaming_api": False,
-                "supported_block_use_cases": [
-                    "answer_modes",
-                    "media_items",
-                    "knowledge_cards",
-                    "inline_entity_cards",
-                    "place_widgets",
-                    "finance_widgets",
-                    "prediction_market_widgets",
-                    "sports_widgets",
-                    "flight_status_widgets",
-                    "news_widgets",
-                    "shopping_widgets",
-                    "jobs_widgets",
-                    "search_result_widgets",
-                    "inline_images",
-                    "inline_assets",
-                    "placeholder_cards",
-                    "diff_blocks",
-                    "inline_knowledge_cards",
-                    "entity_group_v2",
-                    "refinement_filters",
-                    "canvas_mode",
-                    "maps_preview",
-                    "answer_tabs",
-                    "price_comparison_widgets",
-                    "preserve_latex",
-                    "generic_onboarding_widgets",
-                    "in_context_suggestions",
-                    "pending_followups",
-                    "inline_claims",
-                    "unified_assets",
-                    "workflow_steps",
-                    "background_agents",
-                ],
-                "client_coordinates": None,
-                "mentions": [],
-                "dsl_query": query,
-                "skip_search_enabled": True,
-                "is_nav_suggestions_disabled": False,
-                "source": "default",
-                "always_search_override": False,
-                "override_no_search": False,
-                "client_search_results_cache_key": frontend_uuid,
-                "should_ask_for_mcp_tool_confirmation": True,
-                "browser_agent_allow_once_from_toggle": False,
-                "force_enable_browser_agent": False,
-                "supported_features": [
-                    "browser_agent_permission_banner_v1.1",
-                ],
-                "extended_context": False,
-                "version": "2.18",
-                "rum_session_id": str(uuid.uuid4()),
-            },
-            "query_str": query,
-        }
-
-    def _parse_sse_line(self, line: str) -> Optional[dict]:
-        """Parse a single SSE line."""
-        if not line or not line.startswith("data:"):
-            return None
-
-        data_str = line[5:].strip()  # Remove "data:" prefix
-        if not data_str:
-            return None
+        frontend_uuid = _fast_uuid4()
+
+        # Copying the template keeps the upstream key order; only the
+        # per-request fields are filled in
+        params = self._params_template.copy()
+        params.update(
+            language=language,
+            timezone=timezone,
+            search_focus=search_focus,
+            sources=sources or ["web", "scholar"],
+            frontend_uuid=frontend_uuid,
+            mode=mode,
+            model_preference=model_preference,
+            frontend_context_uuid=_fast_uuid4(),
+            is_incognito=is_incognito,
+            dsl_query=query,
+            client_search_results_cache_key=frontend_uuid,
+            rum_session_id=_fast_uuid4(),
+        )
 
-        try:
-            return json.loads(data_str)
-        except json.JSONDecodeError:
-            return None
+        return {"params": params, "query_str": query}
 
     def ask_stream(
         self,
@@ -226,50 +302,187 @@ class PerplexityClient:
         Yields:
             Parsed SSE event dictionaries
         """
-        request_id = str(uuid.uuid4())
-        cookies = self._build_cookies()
-        headers = self._build_headers(request_id)
-        payload = self._build_payload(
-            query=query,
-            mode=mode,
-            model_preference=model_preference,
-            search_focus=search_focus,
-            sources=sources,
-            is_incognito=is_incognito,
+        # Use curl_cffi with impersonate to bypass Cloudflare
+        response = self._session.post(
+            **self._build_request(
+                query=query,
+                mode=mode,
+                model_preference=model_preference,
+                search_focus=search_focus,
+                sources=sources,
+                is_incognito=is_incognito,
+            ),
+            stream=True,
         )
 
-        url = f"{self.BASE_URL}{self.SSE_ENDPOINT}"
+        try:
+            if response.status_code != 200:
+                raise Exception(
+                    f"Request failed with status {response.status_code}: "
+                    f"{response.text}"
+                )
+
+            # Parse SSE stream
+            pending: list[bytes] = []
+            for chunk in response.iter_content():
+                if chunk:
+                    yield from self._feed_chunk(pending, chunk)
+        finally:
+            # Also runs when the consumer stops early, releasing the connection
+            response.close()
+
+    async def ask_stream_async(
+        self,
+        query: str,
+        mode: str = "copilot",
+        model_preference: str = "gpt56_terra_thinking",
+        search_focus: str = "internet",
+        sources: Optional[list[str]] = None,
+        is_incognito: bool = False,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Async variant of ask_stream that does not block the event loop.
+
+        Takes the same arguments as ask_stream.
 
-        # Use curl_cffi with impersonate to bypass Cloudflare
-        response = cffi_requests.post(
-            url,
-            headers=headers,
-            cookies=cookies,
-            json=payload,
-            impersonate="edge",
-            timeout=1800,
+        Yields:
+            Parsed SSE event dictionaries
+        """
+        response = await self._get_async_session().post(
+            **self._build_request(
+                query=query,
+                mode=mode,
+                model_preference=model_preference,
+                search_focus=search_focus,
+                sources=sources,
+                is_incognito=is_incognito,
+            ),
             stream=True,
         )
+        try:
+            if response.status_code != 200:
+                body = await response.atext()
+                raise Exception(
+                    f"Request failed with status {response.status_code}: {body}"
+                )
+
+            pending: list[bytes] = []
+            async for chunk in response.aiter_content():
+                if chunk:
+                    for event in self._feed_chunk(pending, chunk):
+                        yield event
+        finally:
+            await response.aclose()
+
+    def close(self) -> None:
+        """Close the sync session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "PerplexityClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the async session and its connections, if one was opened."""
+        session, self._async_session = self._async_session, None
+        self._async_session_loop = None
+        if session is not None:
+            await session.close()
+
+    def _get_async_session(self) -> AsyncSession:
+        """
+        Return the AsyncSession for the running event loop, creating it once.
 
-        if response.status_code != 200:
-            raise Exception(
-                f"Request failed with status {response.status_code}: {response.text}"
+        Raises:
+            RuntimeError: If the session is still open on another event loop.
+                Its handles are registered with that loop, so it has to be
+                closed there with aclose() before the client moves on.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None:
+            self._async_session = AsyncSession(max_clients=self._max_connections)
+            self._async_session_loop = loop
+        elif self._async_session_loop is not loop:
+            raise RuntimeError(
+                "PerplexityClient's async session belongs to another event loop; "
+                "await aclose() on that loop before using the client from a new one"
             )
+        return self._async_session
 
-        # Parse SSE stream
-        buffer = ""
-        for chunk in response.iter_content():
-            if chunk:
-                buffer += chunk.decode("utf-8", errors="ignore")
+    def _build_request(
+        self,
+        query: str,
+        mode: str,
+        model_preference: str,
+        search_focus: str,
+        sources: Optional[list[str]],
+        is_incognito: bool,
+    ) -> dict[str, Any]:
+        """Build the keyword arguments shared by sync and async SSE requests."""
+        request_id = _fast_uuid4()
+        return {
+            "url": f"{self.BASE_URL}{self.SSE_ENDPOINT}",
+            "headers": self._build_headers(request_id),
+            "cookies": self._cookies,
+            # Serialized here with orjson rather than by curl_cffi's stdlib
+            # json.dumps; the content-type header is already set
+            "data": orjson.dumps(
+                self._build_payload(
+                    query=query,
+                    mode=mode,
+                    model_preference=model_preference,
+                    search_focus=search_focus,
+                    sources=sources,
+                    is_incognito=is_incognito,
+                )
+            ),
+            "impersonate": "edge",
+            "timeout": 1800,
+        }
 
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
+    def _feed_chunk(self, pending: list[bytes], chunk: bytes) -> list[dict]:
+        """
+        Add a received chunk to pending and parse the lines it completes.
+
+        Chunks are only joined once a line break arrives, so a large event
+        spread over many chunks is copied once instead of once per chunk.
+        Working on bytes also keeps multi-byte characters that straddle two
+        chunks intact.
+
+        Returns:
+            The events completed by this chunk
+        """
+        pending.append(chunk)
+        if b"\n" not in chunk:
+            return []
+
+        events, rest = self._drain_buffer(b"".join(pending))
+        pending[:] = [rest]
+        return events
 
-                    if line.startswith("data:"):
-                        event = self._parse_sse_line(line)
-                        if event:
-                            yield event
+    def _drain_buffer(self, buffer: bytes) -> tuple[list[dict], bytes]:
+        """
+        Parse every complete line in an SSE buffer.
+
+        Returns:
+            The parsed events and the trailing partial line still to be completed
+        """
+        end = buffer.rfind(b"\n") + 1
+
+        # Only data lines are visited; event:, id: and blank lines are
+        # skipped by the regex scanner instead of a Python-level loop
+        events = []
+        for match in _DATA_LINE_RE.finditer(buffer, 0, end):
+            try:
+                event = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                continue
+            if event:
+                events.append(event)
+
+        return events, buffer[end:]
 
     def ask(
         self,
@@ -279,6 +492,7 @@ class PerplexityClient:
         search_focus: str = "internet",
         sources: Optional[list[str]] = None,
         is_incognito: bool = False,
+        keep_raw_events: bool = False,
     ) -> PerplexityResponse:
         """
         Send a query to Perplexity and return the complete response.
@@ -290,13 +504,149 @@ class PerplexityClient:
             search_focus: Search focus (internet, academic, etc.)
             sources: List of sources to search
             is_incognito: If True, query won't appear in Perplexity dashboard
+            keep_raw_events: Keep every SSE event in raw_events and read the
+                stream to its end. Otherwise raw_events stays empty and
+                reading stops at the FINAL event, which carries the answer.
+
+        Returns:
+            PerplexityResponse with parsed results
+
+        Timeouts and dropped connections are retried with exponential
+        backoff, up to MAX_ATTEMPTS attempts in total.
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            result = PerplexityResponse()
+            final = False
+            try:
+                for event in self.ask_stream(
+                    query=query,
+                    mode=mode,
+                    model_preference=model_preference,
+                    search_focus=search_focus,
+                    sources=sources,
+                    is_incognito=is_incognito,
+                ):
+                    if final:
+                        # Only kept for raw_events; the answer is complete
+                        result.raw_events.append(event)
+                    else:
+                        final = self._apply_event(result, event, keep_raw_events)
+                    if final and not keep_raw_events:
+                        break
+                return result
+            except self.RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                time.sleep(self._retry_delay(attempt, e))
+
+    async def ask_async(
+        self,
+        query: str,
+        mode: str = "copilot",
+        model_preference: str = "gpt56_terra_thinking",
+        search_focus: str = "internet",
+        sources: Optional[list[str]] = None,
+        is_incognito: bool = False,
+        keep_raw_events: bool = False,
+    ) -> PerplexityResponse:
+        """
+        Async variant of ask for use from the event loop.
+
+        Takes the same arguments as ask and retries the same way.
 
         Returns:
             PerplexityResponse with parsed results
         """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            result = PerplexityResponse()
+            try:
+                async for result in self._stream_response_async(
+                    query=query,
+                    mode=mode,
+                    model_preference=model_preference,
+                    search_focus=search_focus,
+                    sources=sources,
+                    is_incognito=is_incognito,
+                    keep_raw_events=keep_raw_events,
+                ):
+                    pass
+                return result
+            except self.RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Log a failed attempt and return the jittered backoff before the next."""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        delay = random.uniform(delay / 2, delay)
+        logger.warning(
+            "Perplexity request failed (attempt %d/%d): %s; retrying in %.1fs",
+            attempt,
+            self.MAX_ATTEMPTS,
+            error,
+            delay,
+        )
+        return delay
+
+    async def ask_partial_async(
+        self,
+        query: str,
+        mode: str = "copilot",
+        model_preference: str = "gpt56_terra_thinking",
+        search_focus: str = "internet",
+        sources: Optional[list[str]] = None,
+        is_incognito: bool = False,
+        keep_raw_events: bool = False,
+    ) -> AsyncGenerator[PerplexityResponse, None]:
+        """
+        Async variant of ask that yields the response while it accumulates.
+
+        Takes the same arguments as ask. The same PerplexityResponse object is
+        yielded after every SSE event; the last one yielded is complete.
+
+        Attempts that fail before the first event are retried like ask_async.
+        Once a partial response has been yielded it cannot be taken back, so
+        later failures are raised to the caller.
+
+        Yields:
+            PerplexityResponse with the results parsed so far
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            started = False
+            try:
+                async for result in self._stream_response_async(
+                    query=query,
+                    mode=mode,
+                    model_preference=model_preference,
+                    search_focus=search_focus,
+                    sources=sources,
+                    is_incognito=is_incognito,
+                    keep_raw_events=keep_raw_events,
+                ):
+                    started = True
+                    yield result
+                return
+            except self.RETRYABLE_ERRORS as e:
+                if started or attempt == self.MAX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+
+    async def _stream_response_async(
+        self,
+        query: str,
+        mode: str,
+        model_preference: str,
+        search_focus: str,
+        sources: Optional[list[str]],
+        is_incognito: bool,
+        keep_raw_events: bool,
+    ) -> AsyncGenerator[PerplexityResponse, None]:
+        """Make a single attempt at ask_partial_async, without retries."""
         result = PerplexityResponse()
+        final = False
 
-        for event in self.ask_stream(
+        async for event in self.ask_stream_async(
             query=query,
             mode=mode,
             model_preference=model_preference,
@@ -304,103 +654,147 @@ class PerplexityClient:
             sources=sources,
             is_incognito=is_incognito,
         ):
+            if final:
+                # Only kept for raw_events; the answer is complete
+                result.raw_events.append(event)
+            else:
+                final = self._apply_event(result, event, keep_raw_events)
+            yield result
+            if final and not keep_raw_events:
+                return
+
+    @staticmethod
+    def _add_citations(result: PerplexityResponse, web_results: list) -> None:
+        """
+        Append the named, linked entries of web_results as citations.
+
+        Search steps and the final answer often list the same sources, so a
+        URL that is already cited is skipped.
+        """
+        if not web_results:
+            return
+
+        seen_urls = {citation["url"] for citation in result.citations}
+        for wr in web_results:
+            url = wr.get("url")
+            if not url or url in seen_urls or not wr.get("name"):
+                continue
+            seen_urls.add(url)
+            result.citations.append(
+                {
+                    "title": wr["name"],
+                    "url": url,
+                    "snippet": wr.get("snippet", ""),
+                }
+            )
+
+    @classmethod
+    def _apply_answer(cls, result: PerplexityResponse, answer_str: str) -> None:
+        """Fold the answer of an inner FINAL step into the response."""
+        # Only a JSON object carries answer fields; anything else is a
+        # plain-text answer, used as-is without paying for a failed parse
+        if not answer_str.lstrip().startswith("{"):
+            result.text = answer_str
+            return
+
+        try:
+            answer_data = orjson.loads(answer_str)
+        except orjson.JSONDecodeError:
+            # answer might be plain text
+            result.text = answer_str
+            return
+
+        if "answer" in answer_data:
+            result.text = answer_data["answer"]
+        # Also extract citations from web_results in answer
+        cls._add_citations(result, answer_data.get("web_results") or _EMPTY_LIST)
+        # Extract from structured_answer
+        cls._apply_structured_answer(
+            result, answer_data.get("structured_answer") or _EMPTY_LIST
+        )
+
+    @staticmethod
+    def _apply_structured_answer(result: PerplexityResponse, items: list) -> None:
+        """Take the answer text from the markdown items of a structured_answer."""
+        for item in items:
+            if item.get("type") == "markdown" and item.get("text"):
+                result.text = item["text"]
+
+    @staticmethod
+    def _apply_text_patch(result: PerplexityResponse, patch: dict) -> None:
+        """Apply one markdown block patch the way ChunkAggregator does."""
+        op = patch.get("op")
+        value = patch.get("value")
+        if op == "add" and patch.get("path", "").startswith("/chunks/"):
+            # A new chunk appended to the answer
+            if value is not None:
+                result.text += str(value)
+        elif op == "replace" and isinstance(value, dict) and value.get("chunks"):
+            # Initial block setup, carrying every chunk so far
+            result.text = "".join(value["chunks"])
+
+    def _apply_event(
+        self, result: PerplexityResponse, event: dict, keep_raw_events: bool
+    ) -> bool:
+        """
+        Fold a single SSE event into the accumulated response.
+
+        Returns:
+            True for the FINAL event, which completes the response. Later
+            events must not be folded in, since their blocks would overwrite
+            the answer.
+        """
+        if keep_raw_events:
             result.raw_events.append(event)
 
-            step_type = event.get("step_type", "")
-
-            # Handle FINAL event - contains the complete response as nested JSON
-            if step_type == "FINAL":
-                # Get related queries from top level
-                result.related_queries = event.get("related_queries", [])
-
-                # Parse the nested text field which contains all step data as JSON
-                text_json = event.get("text", "")
-                if text_json:
-                    try:
-                        steps = json.loads(text_json)
-                        for step in steps:
-                            step_content = step.get("content", {})
-                            inner_step_type = step.get("step_type", "")
-
-                            # Extract citations from SEARCH_RESULTS
-                            if inner_step_type == "SEARCH_RESULTS":
-                                web_results = step_content.get("web_results", [])
-                                for wr in web_results:
-                                    if wr.get("name") and wr.get("url"):
-                                        result.citations.append(
-                                            {
-                                                "title": wr.get("name", ""),
-                                                "url": wr.get("url", ""),
-                                                "snippet": wr.get("snippet", ""),
-                                            }
-                                        )
-
-                            # Extract answer from inner FINAL step
-                            if inner_step_type == "FINAL":
-                                answer_str = step_content.get("answer", "")
-                                if answer_str:
-                                    try:
-                                        answer_data = json.loads(answer_str)
-                                        if "answer" in answer_data:
-                                            result.text = answer_data["answer"]
-                                        # Also extract citations from web_results in answer
-                                        for wr in answer_data.get(
-                                            "web_results", []
-                                        ):
-                                            if wr.get("name") and wr.get("url"):
-                                                result.citations.append(
-                                                    {
-                                                        "title": wr.get("name", ""),
-                                                        "url": wr.get("url", ""),
-                                                        "snippet": wr.get(
-                                                            "snippet", ""
-                                                        ),
-                                                    }
-                                                )
-                                        # Extract from structured_answer
-                                        for item in answer_data.get(
-                                            "structured_answer", []
-                                        ):
-                                            if (
-                                                item.get("type") == "markdown"
-                                                and item.get("text")
-                                            ):
-                                                result.text = item["text"]
-                                    except json.JSONDecodeError:
-                                        # answer might be plain text
-                                        result.text = answer_str
-
-                            # Also check for structured_answer in other steps
-                            if "structured_answer" in step_content:
-                                for item in step_content.get("structured_answer", []):
-                                    if item.get("type") == "markdown" and item.get(
-                                        "text"
-                                    ):
-                                        result.text = item["text"]
-                    except json.JSONDecodeError:
-                        pass
-
-            # Handle streaming blocks with text chunks (fallback if no FINAL)
-            if not step_type and not result.text:
-                blocks = event.get("blocks", [])
-                for block in blocks:
-                    if block.get("intended_usage") in (
-                        "ask_text_0_markdown",
-                        "ask_text",
-                    ):
-                        diff_block = block.get("diff_block", {})
-                        patches = diff_block.get("patches", [])
-                        for patch in patches:
-                            if patch.get("op") == "replace" and patch.get("value"):
-                                value = patch["value"]
-                                if isinstance(value, dict) and value.get("chunks"):
-                                    result.text = "".join(value["chunks"])
-                            elif patch.get("op") == "add" and patch.get("value"):
-                                # Append chunk
-                                if result.text:
-                                    result.text += patch["value"]
-
-        return result
+        step_type = event.get("step_type")
+
+        # Handle FINAL event - contains the complete response as nested JSON
+        if step_type == "FINAL":
+            # Get related queries from top level
+            result.related_queries = event.get("related_queries", [])
+
+            # Parse the nested text field which contains all step data as JSON
+            text_json = event.get("text")
+            if text_json:
+                try:
+                    steps = orjson.loads(text_json)
+                    for step in steps:
+                        step_content = step.get("content") or _EMPTY_DICT
+                        inner_step_type = step.get("step_type")
+
+                        # Extract citations from SEARCH_RESULTS
+                        if inner_step_type == "SEARCH_RESULTS":
+                            self._add_citations(
+                                result, step_content.get("web_results") or _EMPTY_LIST
+                            )
+
+                        # Extract answer from inner FINAL step
+                        if inner_step_type == "FINAL":
+                            answer_str = step_content.get("answer")
+                            if answer_str:
+                                self._apply_answer(result, answer_str)
+
+                        # Also check for structured_answer in other steps
+                        structured = step_content.get("structured_answer")
+                        if structured:
+                            self._apply_structured_answer(result, structured)
+                except orjson.JSONDecodeError:
+                    pass
+
+        # Handle streaming blocks with text chunks, so the text grows with
+        # every event until FINAL carries the complete answer
+        if not step_type:
+            for block in event.get("blocks") or _EMPTY_LIST:
+                if block.get("intended_usage") in (
+                    "ask_text_0_markdown",
+                    "ask_text",
+                ):
+                    diff_block = block.get("diff_block") or _EMPTY_DICT
+                    for patch in diff_block.get("patches") or _EMPTY_LIST:
+                        self._apply_text_patch(result, patch)
+
+        return step_type == "FINAL"
 
 
 # Convenience function for simple usage
@@ -420,6 +814,6 @@ def perplexity_search(
     Returns:
         The response text
     """
-    client = PerplexityClient()
-    response = client.ask(query, mode=mode, model_preference=model_preference)
+    with PerplexityClient() as client:
+        response = client.ask(query, mode=mode, model_preference=model_preference)
     return response.text
@@ -0,0 +1,139 @@
+"""
+Response caches.
+
+Bounded in-memory LRU cache with per-entry expiry, and an optional SQLite
+cache that keeps answers across restarts. Both are used to answer repeated
+identical Perplexity queries without another upstream round-trip.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import orjson
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire a fixed TTL after insertion.
+
+    Keys are the request tuples themselves: hashing a tuple of short strings
+    is as cheap as digesting it, and the key stays readable when debugging.
+    Access is guarded by a lock so the cache is also safe to share with
+    worker threads. A maxsize or ttl of 0 disables the cache: get() always
+    misses and set() stores nothing.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting least recently used entries."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResponseCache:
+    """
+    SQLite-backed cache whose entries survive process restarts.
+
+    Keys and values must be JSON-serializable. Entries expire a fixed TTL
+    after insertion, measured in wall-clock time so expiry holds across
+    restarts. Several processes may share one directory; SQLite serializes
+    their writes. Calls block on disk I/O, so async callers should run them
+    in a worker thread.
+    """
+
+    FILENAME = "responses.sqlite3"
+
+    def __init__(self, directory: str, ttl: float = 86400.0):
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, self.FILENAME),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        # Expired rows are skipped on read; drop them once per start-up
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, value FROM responses WHERE key = ?",
+                (orjson.dumps(key),),
+            ).fetchone()
+
+        if row is None or row[0] <= time.time():
+            return None
+        return orjson.loads(row[1])
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key."""
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (orjson.dumps(key), time.time() + self.ttl, orjson.dumps(value)),
+            )
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
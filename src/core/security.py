@@ -21,6 +21,41 @@ def get_api_key_header() -> APIKeyHeader:
     return api_key_header
 
 
+MISSING_API_KEY_MESSAGE = "Missing API key. Provide X-API-Key header."
+INVALID_API_KEY_MESSAGE = "Invalid API key."
+
+
+def api_key_error(api_key: Optional[str | bytes]) -> Optional[str]:
+    """
+    Check an API key against the configured one.
+
+    Shared by the verify_api_key dependency and RESTAuthMiddleware, which
+    passes the raw header bytes straight from the ASGI scope.
+
+    Args:
+        api_key: The X-API-Key header value, if any
+
+    Returns:
+        Why the request is rejected, or None if it may proceed
+    """
+    # If auth is disabled, allow all requests
+    if not config.auth_enabled:
+        return None
+
+    # Auth is enabled - key is required
+    if not api_key:
+        return MISSING_API_KEY_MESSAGE
+
+    # Timing-safe comparison to prevent timing attacks
+    expected = config.api_key
+    if isinstance(api_key, bytes):
+        expected = expected.encode()
+    if not secrets.compare_digest(api_key, expected):
+        return INVALID_API_KEY_MESSAGE
+
+    return None
+
+
 def verify_api_key(
     api_key: Optional[str] = Security(api_key_header),
 ) -> Optional[str]:
@@ -46,24 +81,12 @@ def verify_api_key(
     Raises:
         HTTPException: 401 if auth is enabled and key is missing/invalid
     """
-    # If auth is disabled, allow all requests
-    if not config.auth_enabled:
-        return None
-
-    # Auth is enabled - key is required
-    if not api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API key. Provide X-API-Key header.",
-            headers={"WWW-Authenticate": "ApiKey"},
-        )
-
-    # Timing-safe comparison to prevent timing attacks
-    if not secrets.compare_digest(api_key, config.api_key):
+    error = api_key_error(api_key)
+    if error is not None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key.",
+            detail=error,
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    return api_key
+    return api_key if config.auth_enabled else None
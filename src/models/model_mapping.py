@@ -16,215 +16,129 @@ class ModelConfig:
     description: str = ""
 
 
-# Model registry mapping OpenAI-style names to Perplexity configurations.
+# One configuration per Perplexity model, keyed by its internal ID.
 # Internal perplexity_model IDs mirror Perplexity's live model selector
 # (mode="search" entries). Update these when Perplexity ships new models.
-MODEL_REGISTRY: dict[str, ModelConfig] = {
+_CANONICAL: dict[str, ModelConfig] = {
+    config.perplexity_model: config
+    for config in (
+        # Perplexity Native / Auto
+        ModelConfig(
+            "pplx_pro", description="Best - auto-selects the best model per query"
+        ),
+        ModelConfig(
+            "experimental", description="Sonar 2 - Perplexity's latest in-house model"
+        ),
+        ModelConfig("pplx_alpha", description="Perplexity Alpha - deep research"),
+        # Claude (Anthropic) - current: Sonnet 5, Opus 5
+        ModelConfig("claude50sonnet", description="Claude Sonnet 5"),
+        ModelConfig(
+            "claude50sonnetthinking", description="Claude Sonnet 5 with Reasoning"
+        ),
+        ModelConfig("claude50opus", description="Claude Opus 5"),
+        ModelConfig("claude50opusthinking", description="Claude Opus 5 with Reasoning"),
+        # GPT (OpenAI) - current: 5.6 Terra, 5.6 Sol
+        ModelConfig("gpt56_terra", description="GPT-5.6 Terra"),
+        ModelConfig("gpt56_terra_thinking", description="GPT-5.6 Terra with Reasoning"),
+        ModelConfig(
+            "gpt56_sol", description="GPT-5.6 Sol - OpenAI's most powerful model"
+        ),
+        ModelConfig("gpt56_sol_thinking", description="GPT-5.6 Sol with Reasoning"),
+        # Gemini (Google) - current: 3.1 Pro
+        ModelConfig("gemini31pro_low", description="Gemini 3.1 Pro"),
+        ModelConfig("gemini31pro_high", description="Gemini 3.1 Pro with Reasoning"),
+        # Grok (xAI) - current: 4.5
+        ModelConfig("grok45low", description="Grok 4.5"),
+        ModelConfig("grok45medium", description="Grok 4.5 with Reasoning"),
+        # Kimi (Moonshot) - current: K3
+        ModelConfig("kimik3thinking", description="Kimi K3 (Thinking)"),
+        # GLM (Z.ai) - current: 5.2
+        ModelConfig("glm_5_2", description="GLM 5.2 (Thinking)"),
+        # Nemotron (NVIDIA) - current: 3 Ultra / 3 Super
+        ModelConfig("nv_nemotron_3_ultra", description="Nemotron 3 Ultra 550B"),
+        ModelConfig("nv_nemotron_3_super", description="Nemotron 3 Super 120B"),
+    )
+}
+
+# OpenAI-style model names mapped to internal Perplexity model IDs. Every
+# internal ID is also accepted as a model name and maps to itself.
+_ALIASES: dict[str, str] = {
     # =========================================================================
     # Perplexity Native / Auto
     # =========================================================================
-    "best": ModelConfig(
-        perplexity_model="pplx_pro",
-        description="Best - auto-selects the best model per query",
-    ),
-    "auto": ModelConfig(
-        perplexity_model="pplx_pro",
-        description="Best - auto-selects the best model per query",
-    ),
-    "pplx_pro": ModelConfig(
-        perplexity_model="pplx_pro",
-        description="Best - auto-selects the best model per query",
-    ),
-    "sonar": ModelConfig(
-        perplexity_model="experimental",
-        description="Sonar 2 - Perplexity's latest in-house model",
-    ),
-    "sonar-2": ModelConfig(
-        perplexity_model="experimental",
-        description="Sonar 2 - Perplexity's latest in-house model",
-    ),
-    "experimental": ModelConfig(
-        perplexity_model="experimental",
-        description="Sonar 2 - Perplexity's latest in-house model",
-    ),
-    "pplx-alpha": ModelConfig(
-        perplexity_model="pplx_alpha",
-        description="Perplexity Alpha - deep research",
-    ),
-    "perplexity-alpha": ModelConfig(
-        perplexity_model="pplx_alpha",
-        description="Perplexity Alpha - deep research",
-    ),
-    # =========================================================================
-    # Claude (Anthropic) - current: Sonnet 5, Opus 5
-    # =========================================================================
-    "claude-sonnet-5": ModelConfig(
-        perplexity_model="claude50sonnet",
-        description="Claude Sonnet 5",
-    ),
-    "claude50sonnet": ModelConfig(
-        perplexity_model="claude50sonnet",
-        description="Claude Sonnet 5",
-    ),
-    "claude-sonnet-5-thinking": ModelConfig(
-        perplexity_model="claude50sonnetthinking",
-        description="Claude Sonnet 5 with Reasoning (default)",
-    ),
-    "claude50sonnetthinking": ModelConfig(
-        perplexity_model="claude50sonnetthinking",
-        description="Claude Sonnet 5 with Reasoning",
-    ),
-    "claude-opus-5": ModelConfig(
-        perplexity_model="claude50opus",
-        description="Claude Opus 5",
-    ),
-    "claude50opus": ModelConfig(
-        perplexity_model="claude50opus",
-        description="Claude Opus 5",
-    ),
-    "claude-opus-5-thinking": ModelConfig(
-        perplexity_model="claude50opusthinking",
-        description="Claude Opus 5 with Reasoning",
-    ),
-    "claude50opusthinking": ModelConfig(
-        perplexity_model="claude50opusthinking",
-        description="Claude Opus 5 with Reasoning",
-    ),
-    # =========================================================================
-    # GPT (OpenAI) - current: 5.6 Terra, 5.6 Sol
-    # =========================================================================
-    "gpt-5.6-terra": ModelConfig(
-        perplexity_model="gpt56_terra",
-        description="GPT-5.6 Terra",
-    ),
-    "gpt56_terra": ModelConfig(
-        perplexity_model="gpt56_terra",
-        description="GPT-5.6 Terra",
-    ),
-    "gpt-5.6-terra-thinking": ModelConfig(
-        perplexity_model="gpt56_terra_thinking",
-        description="GPT-5.6 Terra with Reasoning",
-    ),
-    "gpt56_terra_thinking": ModelConfig(
-        perplexity_model="gpt56_terra_thinking",
-        description="GPT-5.6 Terra with Reasoning",
-    ),
-    "gpt-5.6-sol": ModelConfig(
-        perplexity_model="gpt56_sol",
-        description="GPT-5.6 Sol - OpenAI's most powerful model",
-    ),
-    "gpt56_sol": ModelConfig(
-        perplexity_model="gpt56_sol",
-        description="GPT-5.6 Sol - OpenAI's most powerful model",
-    ),
-    "gpt-5.6-sol-thinking": ModelConfig(
-        perplexity_model="gpt56_sol_thinking",
-        description="GPT-5.6 Sol with Reasoning",
-    ),
-    "gpt56_sol_thinking": ModelConfig(
-        perplexity_model="gpt56_sol_thinking",
-        description="GPT-5.6 Sol with Reasoning",
-    ),
+    "best": "pplx_pro",
+    "auto": "pplx_pro",
+    "pplx_pro": "pplx_pro",
+    "sonar": "experimental",
+    "sonar-2": "experimental",
+    "experimental": "experimental",
+    "pplx-alpha": "pplx_alpha",
+    "perplexity-alpha": "pplx_alpha",
+    # =========================================================================
+    # Claude (Anthropic)
+    # =========================================================================
+    "claude-sonnet-5": "claude50sonnet",
+    "claude50sonnet": "claude50sonnet",
+    "claude-sonnet-5-thinking": "claude50sonnetthinking",
+    "claude50sonnetthinking": "claude50sonnetthinking",
+    "claude-opus-5": "claude50opus",
+    "claude50opus": "claude50opus",
+    "claude-opus-5-thinking": "claude50opusthinking",
+    "claude50opusthinking": "claude50opusthinking",
+    # =========================================================================
+    # GPT (OpenAI)
+    # =========================================================================
+    "gpt-5.6-terra": "gpt56_terra",
+    "gpt56_terra": "gpt56_terra",
+    "gpt-5.6-terra-thinking": "gpt56_terra_thinking",
+    "gpt56_terra_thinking": "gpt56_terra_thinking",
+    "gpt-5.6-sol": "gpt56_sol",
+    "gpt56_sol": "gpt56_sol",
+    "gpt-5.6-sol-thinking": "gpt56_sol_thinking",
+    "gpt56_sol_thinking": "gpt56_sol_thinking",
     # Legacy OpenAI compatibility mappings
-    "gpt-4": ModelConfig(
-        perplexity_model="gpt56_terra",
-        description="GPT-4 compatibility (maps to GPT-5.6 Terra)",
-    ),
-    "gpt-4o": ModelConfig(
-        perplexity_model="gpt56_terra",
-        description="GPT-4o compatibility (maps to GPT-5.6 Terra)",
-    ),
-    "gpt-4-turbo": ModelConfig(
-        perplexity_model="gpt56_terra",
-        description="GPT-4 Turbo compatibility (maps to GPT-5.6 Terra)",
-    ),
-    "gpt-3.5-turbo": ModelConfig(
-        perplexity_model="pplx_alpha",
-        description="GPT-3.5 compatibility (maps to Perplexity Alpha)",
-    ),
+    "gpt-4": "gpt56_terra",
+    "gpt-4o": "gpt56_terra",
+    "gpt-4-turbo": "gpt56_terra",
+    "gpt-3.5-turbo": "pplx_alpha",
     # =========================================================================
-    # Gemini (Google) - current: 3.1 Pro
+    # Gemini (Google)
     # =========================================================================
-    "gemini-3.1-pro": ModelConfig(
-        perplexity_model="gemini31pro_low",
-        description="Gemini 3.1 Pro",
-    ),
-    "gemini31pro_low": ModelConfig(
-        perplexity_model="gemini31pro_low",
-        description="Gemini 3.1 Pro",
-    ),
-    "gemini-3.1-pro-thinking": ModelConfig(
-        perplexity_model="gemini31pro_high",
-        description="Gemini 3.1 Pro with Reasoning",
-    ),
-    "gemini31pro_high": ModelConfig(
-        perplexity_model="gemini31pro_high",
-        description="Gemini 3.1 Pro with Reasoning",
-    ),
+    "gemini-3.1-pro": "gemini31pro_low",
+    "gemini31pro_low": "gemini31pro_low",
+    "gemini-3.1-pro-thinking": "gemini31pro_high",
+    "gemini31pro_high": "gemini31pro_high",
     # =========================================================================
-    # Grok (xAI) - current: 4.5
+    # Grok (xAI)
     # =========================================================================
-    "grok-4.5": ModelConfig(
-        perplexity_model="grok45low",
-        description="Grok 4.5",
-    ),
-    "grok45low": ModelConfig(
-        perplexity_model="grok45low",
-        description="Grok 4.5",
-    ),
-    "grok-4.5-thinking": ModelConfig(
-        perplexity_model="grok45medium",
-        description="Grok 4.5 with Reasoning",
-    ),
-    "grok45medium": ModelConfig(
-        perplexity_model="grok45medium",
-        description="Grok 4.5 with Reasoning",
-    ),
+    "grok-4.5": "grok45low",
+    "grok45low": "grok45low",
+    "grok-4.5-thinking": "grok45medium",
+    "grok45medium": "grok45medium",
     # =========================================================================
-    # Kimi (Moonshot) - current: K3
+    # Kimi (Moonshot)
     # =========================================================================
-    "kimi-k3": ModelConfig(
-        perplexity_model="kimik3thinking",
-        description="Kimi K3 (Thinking)",
-    ),
-    "kimi-k3-thinking": ModelConfig(
-        perplexity_model="kimik3thinking",
-        description="Kimi K3 (Thinking)",
-    ),
-    "kimik3thinking": ModelConfig(
-        perplexity_model="kimik3thinking",
-        description="Kimi K3 (Thinking)",
-    ),
+    "kimi-k3": "kimik3thinking",
+    "kimi-k3-thinking": "kimik3thinking",
+    "kimik3thinking": "kimik3thinking",
     # =========================================================================
-    # GLM (Z.ai) - current: 5.2
+    # GLM (Z.ai)
     # =========================================================================
-    "glm-5.2": ModelConfig(
-        perplexity_model="glm_5_2",
-        description="GLM 5.2 (Thinking)",
-    ),
-    "glm_5_2": ModelConfig(
-        perplexity_model="glm_5_2",
-        description="GLM 5.2 (Thinking)",
-    ),
+    "glm-5.2": "glm_5_2",
+    "glm_5_2": "glm_5_2",
     # =========================================================================
-    # Nemotron (NVIDIA) - current: 3 Ultra / 3 Super
+    # Nemotron (NVIDIA)
     # =========================================================================
-    "nemotron-3-ultra": ModelConfig(
-        perplexity_model="nv_nemotron_3_ultra",
-        description="Nemotron 3 Ultra 550B",
-    ),
-    "nv_nemotron_3_ultra": ModelConfig(
-        perplexity_model="nv_nemotron_3_ultra",
-        description="Nemotron 3 Ultra 550B",
-    ),
-    "nemotron-3-super": ModelConfig(
-        perplexity_model="nv_nemotron_3_super",
-        description="Nemotron 3 Super 120B",
-    ),
-    "nv_nemotron_3_super": ModelConfig(
-        perplexity_model="nv_nemotron_3_super",
-        description="Nemotron 3 Super 120B",
-    ),
+    "nemotron-3-ultra": "nv_nemotron_3_ultra",
+    "nv_nemotron_3_ultra": "nv_nemotron_3_ultra",
+    "nemotron-3-super": "nv_nemotron_3_super",
+    "nv_nemotron_3_super": "nv_nemotron_3_super",
+}
+
+# Model registry mapping OpenAI-style names to Perplexity configurations.
+# Aliases of the same model share one ModelConfig instance.
+MODEL_REGISTRY: dict[str, ModelConfig] = {
+    alias: _CANONICAL[internal] for alias, internal in _ALIASES.items()
 }
 
 # Default model when unknown model is requested
@@ -232,6 +146,9 @@ DEFAULT_MODEL = "gpt56_terra_thinking"
 DEFAULT_MODE = "copilot"
 DEFAULT_SEARCH_FOCUS = "internet"
 
+# Shared configuration returned for unknown model names
+_DEFAULT_CONFIG = ModelConfig(perplexity_model=DEFAULT_MODEL)
+
 
 def get_perplexity_model(openai_model: str) -> str:
     """
@@ -243,10 +160,7 @@ def get_perplexity_model(openai_model: str) -> str:
     Returns:
         The Perplexity model_preference value
     """
-    config = MODEL_REGISTRY.get(openai_model)
-    if config:
-        return config.perplexity_model
-    return DEFAULT_MODEL
+    return MODEL_REGISTRY.get(openai_model, _DEFAULT_CONFIG).perplexity_model
 
 
 def get_model_config(openai_model: str) -> ModelConfig:
@@ -259,12 +173,13 @@ def get_model_config(openai_model: str) -> ModelConfig:
     Returns:
         ModelConfig with all Perplexity settings
     """
-    config = MODEL_REGISTRY.get(openai_model)
-    if config:
-        return config
-    return ModelConfig(perplexity_model=DEFAULT_MODEL)
+    return MODEL_REGISTRY.get(openai_model, _DEFAULT_CONFIG)
+
+
+# The registry is fixed at import, so the model ID listing is built once
+_AVAILABLE_MODELS: tuple[str, ...] = tuple(MODEL_REGISTRY)
 
 
-def list_available_models() -> list[str]:
-    """Get list of available model IDs."""
-    return list(MODEL_REGISTRY.keys())
+def list_available_models() -> tuple[str, ...]:
+    """Get the available model IDs."""
+    return _AVAILABLE_MODELS
@@ -5,8 +5,8 @@ These models follow the OpenAI Chat Completions API specification
 for maximum compatibility with existing clients.
 """
 
+import secrets
 import time
-import uuid
 from enum import Enum
 from typing import Optional, Literal, Union
 
@@ -92,7 +92,7 @@ class Choice(BaseModel):
 class ChatCompletionResponse(BaseModel):
     """OpenAI-compatible chat completion response."""
 
-    id: str = Field(default_factory=lambda: f"chatcmpl-{uuid.uuid4().hex[:24]}")
+    id: str = Field(default_factory=lambda: "chatcmpl-" + secrets.token_hex(12))
     object: Literal["chat.completion"] = "chat.completion"
     created: int = Field(default_factory=lambda: int(time.time()))
     model: str
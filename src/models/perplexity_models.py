@@ -3,24 +3,27 @@ Perplexity SSE response models.
 
 Internal models for parsing Perplexity's complex SSE format.
 NOT exposed to API consumers - only used for internal processing.
+
+The SSE event models are slotted dataclasses rather than Pydantic models:
+one is built per streamed event, PerplexitySSEParser already normalizes
+every field from the decoded JSON, and nothing serializes them back out.
 """
 
 from __future__ import annotations
 
+import secrets
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Optional, Any, Literal
 
-from pydantic import BaseModel
-
 
 # ============================================================================
 # SSE Event Models
 # ============================================================================
 
 
-class JSONPatch(BaseModel):
+@dataclass(slots=True)
+class JSONPatch:
     """Single JSON Patch operation (RFC 6902)."""
 
     op: Literal["add", "replace", "remove"]
@@ -28,25 +31,28 @@ class JSONPatch(BaseModel):
     value: Optional[Any] = None
 
 
-class DiffBlock(BaseModel):
+@dataclass(slots=True)
+class DiffBlock:
     """Diff block with JSON Patch operations."""
 
     field: str  # e.g., "markdown_block"
-    patches: list[JSONPatch] = []
+    patches: list[JSONPatch] = field(default_factory=list)
 
 
-class MarkdownBlock(BaseModel):
+@dataclass(slots=True)
+class MarkdownBlock:
     """Markdown block containing answer text."""
 
     progress: Literal["IN_PROGRESS", "DONE"] = "IN_PROGRESS"
-    chunks: list[str] = []
+    chunks: list[str] = field(default_factory=list)
     chunk_starting_offset: int = 0
     answer: Optional[str] = None
     media_items: Optional[list[Any]] = None
-    inline_token_annotations: list[Any] = []
+    inline_token_annotations: list[Any] = field(default_factory=list)
 
 
-class PerplexityBlock(BaseModel):
+@dataclass(slots=True)
+class PerplexityBlock:
     """A content block in Perplexity SSE."""
 
     intended_usage: str
@@ -55,7 +61,8 @@ class PerplexityBlock(BaseModel):
     markdown_block: Optional[MarkdownBlock] = None
 
 
-class PerplexitySSEEvent(BaseModel):
+@dataclass(slots=True)
+class PerplexitySSEEvent:
     """Top-level SSE event from Perplexity."""
 
     backend_uuid: str = ""
@@ -65,7 +72,7 @@ class PerplexitySSEEvent(BaseModel):
     search_focus: str = ""
     text_completed: bool = False
     message_mode: str = "STREAMING"
-    blocks: list[PerplexityBlock] = []
+    blocks: list[PerplexityBlock] = field(default_factory=list)
     thread_url_slug: Optional[str] = None
 
 
@@ -74,7 +81,7 @@ class PerplexitySSEEvent(BaseModel):
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkAggregator:
     """
     Aggregates text chunks from Perplexity SSE stream.
@@ -96,7 +103,7 @@ class ChunkAggregator:
         Returns:
             New chunk text if patch adds content, None otherwise.
         """
-        if patch.op == "add" and "/chunks/" in patch.path:
+        if patch.op == "add" and patch.path.startswith("/chunks/"):
             # Adding a new chunk - extract and store
             chunk_text = str(patch.value) if patch.value is not None else ""
             self.chunks.append(chunk_text)
@@ -117,7 +124,7 @@ class ChunkAggregator:
         return "".join(self.chunks)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingState:
     """
     State for OpenAI streaming response transformation.
@@ -127,7 +134,7 @@ class StreamingState:
     """
 
     completion_id: str = field(
-        default_factory=lambda: f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        default_factory=lambda: "chatcmpl-" + secrets.token_hex(12)
     )
     created: int = field(default_factory=lambda: int(time.time()))
     model: str = ""
@@ -141,16 +148,18 @@ class StreamingState:
 
     def get_or_create_aggregator(self, intended_usage: str) -> ChunkAggregator:
         """Get or create aggregator for a specific markdown block."""
-        if intended_usage not in self.aggregators:
-            self.aggregators[intended_usage] = ChunkAggregator()
-        return self.aggregators[intended_usage]
+        aggregator = self.aggregators.get(intended_usage)
+        if aggregator is None:
+            aggregator = self.aggregators[intended_usage] = ChunkAggregator()
+        return aggregator
 
     def get_all_text(self) -> str:
         """Get concatenated text from all aggregators."""
-        all_text = []
-        for key in sorted(self.aggregators.keys()):
-            all_text.append(self.aggregators[key].get_full_text())
-        return "".join(all_text)
+        # One join over every chunk, instead of joining each block first
+        aggregators = self.aggregators
+        return "".join(
+            chunk for key in sorted(aggregators) for chunk in aggregators[key].chunks
+        )
 
     def is_all_complete(self) -> bool:
         """Check if all aggregators are complete."""
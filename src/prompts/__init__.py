@@ -5,7 +5,8 @@ This module contains all research prompt templates organized by domain.
 Each template is optimized for specific research contexts.
 
 Template files export a single TEMPLATE constant string.
-This __init__.py aggregates all templates into PROGRAMMING_RESEARCH_PROMPTS.
+This __init__.py aggregates all templates into PROGRAMMING_RESEARCH_PROMPTS,
+and precompiles them into COMPILED_RESEARCH_PROMPTS for the request path.
 """
 
 from .academic import TEMPLATE as academic_template
@@ -54,6 +55,34 @@ PROGRAMMING_RESEARCH_PROMPTS = {
     "ml_dataset_multimodal": ml_dataset_multimodal_template,
 }
 
-VALID_CATEGORIES = set(PROGRAMMING_RESEARCH_PROMPTS.keys())
+VALID_CATEGORIES = frozenset(PROGRAMMING_RESEARCH_PROMPTS)
 
-__all__ = ["PROGRAMMING_RESEARCH_PROMPTS", "VALID_CATEGORIES"]
+# Placeholder substituted for {topic} while splitting templates; it cannot
+# appear in the template text itself
+_TOPIC_MARKER = "\x00topic\x00"
+
+
+def _compile_template(template: str) -> tuple[str, str]:
+    """
+    Split a template around its {topic} field.
+
+    The template is run through str.format once with a marker, so escaped
+    braces ({{ and }}) are resolved exactly as they would be per request.
+    Rendering then reduces to prefix + topic + suffix.
+    """
+    prefix, _, suffix = template.format(topic=_TOPIC_MARKER).partition(_TOPIC_MARKER)
+    if _TOPIC_MARKER in suffix:
+        raise ValueError("Research templates must contain a single {topic} field")
+    return prefix, suffix
+
+
+COMPILED_RESEARCH_PROMPTS: dict[str, tuple[str, str]] = {
+    category: _compile_template(template)
+    for category, template in PROGRAMMING_RESEARCH_PROMPTS.items()
+}
+
+__all__ = [
+    "PROGRAMMING_RESEARCH_PROMPTS",
+    "COMPILED_RESEARCH_PROMPTS",
+    "VALID_CATEGORIES",
+]
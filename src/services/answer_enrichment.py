@@ -15,12 +15,13 @@ directly.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Citation:
     """A web source cited in the answer."""
 
@@ -29,7 +30,7 @@ class Citation:
     snippet: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """An inline image/diagram attached to the answer."""
 
@@ -38,7 +39,7 @@ class MediaItem:
     source_url: str = ""  # page the image came from
 
 
-@dataclass
+@dataclass(slots=True)
 class Enrichment:
     """Side data recovered from a Perplexity response."""
 
@@ -51,12 +52,12 @@ class Enrichment:
 
 
 def _safe_json(value: Any) -> Optional[Any]:
-    """json.loads that never raises; returns None on non-string/invalid input."""
+    """orjson.loads that never raises; returns None on non-string/invalid input."""
     if not isinstance(value, str) or not value:
         return None
     try:
-        return json.loads(value)
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
         return None
 
 
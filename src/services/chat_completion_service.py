@@ -5,7 +5,7 @@ High-level service that orchestrates chat completion requests.
 """
 
 import logging
-from typing import Generator, Union
+from typing import AsyncIterator, Iterator, Union
 
 from fastapi.responses import StreamingResponse
 
@@ -22,6 +22,23 @@ from src.services.stream_formatter import (
 
 logger = logging.getLogger(__name__)
 
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+
+
+def _sse_response(
+    body: Iterator[bytes] | AsyncIterator[bytes],
+) -> StreamingResponse:
+    """Wrap formatted SSE chunks in an uncached, unbuffered StreamingResponse."""
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
 
 class ChatCompletionService:
     """
@@ -52,7 +69,7 @@ class ChatCompletionService:
         Returns:
             ChatCompletionResponse with the completion.
         """
-        logger.info(f"Processing completion request for model: {request.model}")
+        logger.info("Processing completion request for model: %s", request.model)
 
         # Execute completion
         response_text, model_name = self._adapter.complete(
@@ -79,7 +96,7 @@ class ChatCompletionService:
         Returns:
             StreamingResponse with SSE-formatted chunks.
         """
-        logger.info(f"Processing streaming request for model: {request.model}")
+        logger.info("Processing streaming request for model: %s", request.model)
 
         # Get the stream generator
         chunk_generator, model_name = self._adapter.stream(
@@ -103,15 +120,7 @@ class ChatCompletionService:
             # Send final chunk
             yield formatter.format_final_chunk()
 
-        return StreamingResponse(
-            generate_sse(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            },
-        )
+        return _sse_response(generate_sse())
 
     def handle_request(
         self,
@@ -129,3 +138,79 @@ class ChatCompletionService:
         if request.stream:
             return self.handle_streaming(request)
         return self.handle_completion(request)
+
+    async def handle_completion_async(
+        self,
+        request: ChatCompletionRequest,
+    ) -> ChatCompletionResponse:
+        """
+        Async variant of handle_completion() that does not block the event loop.
+
+        Args:
+            request: The validated ChatCompletionRequest
+
+        Returns:
+            ChatCompletionResponse with the completion.
+        """
+        logger.info("Processing completion request for model: %s", request.model)
+
+        response_text, model_name = await self._adapter.complete_async(
+            messages=request.messages,
+            model=request.model,
+        )
+
+        return format_openai_response(
+            content=response_text,
+            model=model_name,
+        )
+
+    def handle_streaming_async(
+        self,
+        request: ChatCompletionRequest,
+    ) -> StreamingResponse:
+        """
+        Handle a streaming request on the event loop instead of a worker thread.
+
+        Args:
+            request: The validated ChatCompletionRequest
+
+        Returns:
+            StreamingResponse with SSE-formatted chunks.
+        """
+        logger.info("Processing streaming request for model: %s", request.model)
+
+        chunk_generator, model_name = self._adapter.stream_async(
+            messages=request.messages,
+            model=request.model,
+        )
+
+        async def generate_sse():
+            """Generate SSE-formatted chunks."""
+            formatter = StreamFormatter(model=model_name)
+
+            yield formatter.format_role_chunk()
+
+            async for text_chunk in chunk_generator:
+                if text_chunk:
+                    yield formatter.format_content_chunk(text_chunk)
+
+            yield formatter.format_final_chunk()
+
+        return _sse_response(generate_sse())
+
+    async def handle_request_async(
+        self,
+        request: ChatCompletionRequest,
+    ) -> ChatCompletionResponse | StreamingResponse:
+        """
+        Async variant of handle_request() used by the REST route.
+
+        Args:
+            request: The validated ChatCompletionRequest
+
+        Returns:
+            ChatCompletionResponse or StreamingResponse based on request.stream
+        """
+        if request.stream:
+            return self.handle_streaming_async(request)
+        return await self.handle_completion_async(request)
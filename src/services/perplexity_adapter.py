@@ -5,7 +5,7 @@ Adapts Perplexity's API to the OpenAI chat completions format.
 """
 
 import logging
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 
 from src.core.perplexity_client import PerplexityClient
 from src.models.openai_models import ChatMessage, MessageRole
@@ -78,6 +78,17 @@ class PerplexityAdapter:
 
         return "\n\n".join(parts) if parts else ""
 
+    def _ask_kwargs(self, messages: list[ChatMessage], config: ModelConfig) -> dict:
+        """Build the client keyword arguments shared by every ask variant."""
+        return {
+            "query": self.format_messages_as_query(messages),
+            "mode": config.mode,
+            "model_preference": config.perplexity_model,
+            "search_focus": config.search_focus,
+            "sources": config.sources,
+            "is_incognito": True,  # MANDATORY for REST API
+        }
+
     def complete(
         self,
         messages: list[ChatMessage],
@@ -96,19 +107,12 @@ class PerplexityAdapter:
         # Get model configuration
         config = get_model_config(model)
 
-        # Format messages as query
-        query = self.format_messages_as_query(messages)
-
-        logger.debug(f"Executing completion with model {config.perplexity_model}")
+        logger.debug("Executing completion with model %s", config.perplexity_model)
 
         # Call Perplexity (always incognito for REST API)
+        # raw_events feed the citation and media enrichment below
         response = self._client.ask(
-            query=query,
-            mode=config.mode,
-            model_preference=config.perplexity_model,
-            search_focus=config.search_focus,
-            sources=config.sources,
-            is_incognito=True,  # MANDATORY for REST API
+            **self._ask_kwargs(messages, config), keep_raw_events=True
         )
 
         text = response.text
@@ -137,11 +141,9 @@ class PerplexityAdapter:
         """
         # Get model configuration
         config = get_model_config(model)
+        ask_kwargs = self._ask_kwargs(messages, config)
 
-        # Format messages as query
-        query = self.format_messages_as_query(messages)
-
-        logger.debug(f"Starting stream with model {config.perplexity_model}")
+        logger.debug("Starting stream with model %s", config.perplexity_model)
 
         # Create a generator wrapper
         def chunk_generator():
@@ -149,14 +151,72 @@ class PerplexityAdapter:
             extractor = ChunkExtractor()
             events = []
 
-            for event_data in self._client.ask_stream(
-                query=query,
-                mode=config.mode,
-                model_preference=config.perplexity_model,
-                search_focus=config.search_focus,
-                sources=config.sources,
-                is_incognito=True,  # MANDATORY for REST API
-            ):
+            for event_data in self._client.ask_stream(**ask_kwargs):
+                events.append(event_data)
+                for chunk in extractor.process_event(event_data):
+                    if chunk:
+                        yield chunk
+
+            section = format_enrichment_markdown(extract_enrichment(events))
+            if section:
+                yield section
+
+        return chunk_generator(), config.perplexity_model
+
+    async def complete_async(
+        self,
+        messages: list[ChatMessage],
+        model: str,
+    ) -> tuple[str, str]:
+        """
+        Async variant of complete() that does not block the event loop.
+
+        Args:
+            messages: The conversation messages
+            model: The OpenAI-style model name
+
+        Returns:
+            Tuple of (response_text, perplexity_model_name)
+        """
+        config = get_model_config(model)
+        logger.debug("Executing completion with model %s", config.perplexity_model)
+
+        response = await self._client.ask_async(
+            **self._ask_kwargs(messages, config), keep_raw_events=True
+        )
+
+        text = response.text
+        enrichment = extract_enrichment(getattr(response, "raw_events", None))
+        text += format_enrichment_markdown(enrichment)
+
+        return text, config.perplexity_model
+
+    def stream_async(
+        self,
+        messages: list[ChatMessage],
+        model: str,
+    ) -> tuple[AsyncGenerator[str, None], str]:
+        """
+        Async variant of stream() backed by the client's async SSE stream.
+
+        Args:
+            messages: The conversation messages
+            model: The OpenAI-style model name
+
+        Returns:
+            Tuple of (async generator of text chunks, perplexity_model_name)
+        """
+        config = get_model_config(model)
+        ask_kwargs = self._ask_kwargs(messages, config)
+
+        logger.debug("Starting stream with model %s", config.perplexity_model)
+
+        async def chunk_generator():
+            """Async generator that yields text chunks."""
+            extractor = ChunkExtractor()
+            events = []
+
+            async for event_data in self._client.ask_stream_async(**ask_kwargs):
                 events.append(event_data)
                 for chunk in extractor.process_event(event_data):
                     if chunk:
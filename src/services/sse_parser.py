@@ -13,6 +13,7 @@ from src.models.perplexity_models import (
     PerplexityBlock,
     DiffBlock,
     JSONPatch,
+    MarkdownBlock,
 )
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,7 @@ class PerplexitySSEParser:
                 thread_url_slug=data.get("thread_url_slug"),
             )
         except Exception as e:
-            logger.debug(f"Failed to parse SSE event: {e}")
+            logger.debug("Failed to parse SSE event: %s", e)
             return None
 
     @staticmethod
@@ -88,14 +89,28 @@ class PerplexitySSEParser:
                     patches=patches,
                 )
 
+            markdown_block = None
+            if "markdown_block" in block_data:
+                markdown_data = block_data["markdown_block"]
+                markdown_block = MarkdownBlock(
+                    progress=markdown_data.get("progress", "IN_PROGRESS"),
+                    chunks=markdown_data.get("chunks", []),
+                    chunk_starting_offset=markdown_data.get("chunk_starting_offset", 0),
+                    answer=markdown_data.get("answer"),
+                    media_items=markdown_data.get("media_items"),
+                    inline_token_annotations=markdown_data.get(
+                        "inline_token_annotations", []
+                    ),
+                )
+
             return PerplexityBlock(
                 intended_usage=intended_usage,
                 diff_block=diff_block,
                 plan_block=block_data.get("plan_block"),
-                markdown_block=block_data.get("markdown_block"),
+                markdown_block=markdown_block,
             )
         except Exception as e:
-            logger.debug(f"Failed to parse block: {e}")
+            logger.debug("Failed to parse block: %s", e)
             return None
 
     @staticmethod
@@ -5,8 +5,8 @@ Formats Perplexity responses into OpenAI-compatible response formats.
 """
 
 import json
+import secrets
 import time
-import uuid
 from typing import Optional
 
 from src.models.openai_models import (
@@ -22,7 +22,7 @@ from src.models.openai_models import (
 
 def generate_completion_id() -> str:
     """Generate a unique completion ID in OpenAI format."""
-    return f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    return "chatcmpl-" + secrets.token_hex(12)
 
 
 def format_openai_response(
@@ -108,7 +108,15 @@ def format_openai_chunk(
     )
 
 
-def format_sse_event(chunk: ChatCompletionChunk) -> str:
+# SSE frames are built as bytes: chunks serialize straight to JSON bytes and
+# StreamingResponse sends bytes without re-encoding each frame
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+_chunk_to_json = ChatCompletionChunk.__pydantic_serializer__.to_json
+
+
+def format_sse_event(chunk: ChatCompletionChunk) -> bytes:
     """
     Format a chunk as an SSE data event.
 
@@ -116,19 +124,19 @@ def format_sse_event(chunk: ChatCompletionChunk) -> str:
         chunk: The ChatCompletionChunk to format
 
     Returns:
-        SSE-formatted string: "data: {json}\n\n"
+        SSE-formatted bytes: b"data: {json}\n\n"
     """
-    return f"data: {chunk.model_dump_json()}\n\n"
+    return _SSE_PREFIX + _chunk_to_json(chunk) + _SSE_SUFFIX
 
 
-def format_sse_done() -> str:
+def format_sse_done() -> bytes:
     """
     Format the final SSE done event.
 
     Returns:
-        SSE done marker: "data: [DONE]\n\n"
+        SSE done marker: b"data: [DONE]\n\n"
     """
-    return "data: [DONE]\n\n"
+    return _SSE_DONE
 
 
 class StreamFormatter:
@@ -151,15 +159,15 @@ class StreamFormatter:
         self.created = int(time.time())
         self.has_sent_role = False
 
-    def format_role_chunk(self) -> str:
+    def format_role_chunk(self) -> bytes:
         """
         Format and return the initial role announcement chunk.
 
         Returns:
-            SSE-formatted role chunk, or empty string if already sent.
+            SSE-formatted role chunk, or empty bytes if already sent.
         """
         if self.has_sent_role:
-            return ""
+            return b""
 
         self.has_sent_role = True
         chunk = format_openai_chunk(
@@ -170,7 +178,7 @@ class StreamFormatter:
         )
         return format_sse_event(chunk)
 
-    def format_content_chunk(self, content: str) -> str:
+    def format_content_chunk(self, content: str) -> bytes:
         """
         Format a content chunk.
 
@@ -181,7 +189,7 @@ class StreamFormatter:
             SSE-formatted content chunk.
         """
         # Ensure role is sent first
-        prefix = ""
+        prefix = b""
         if not self.has_sent_role:
             prefix = self.format_role_chunk()
 
@@ -193,7 +201,7 @@ class StreamFormatter:
         )
         return prefix + format_sse_event(chunk)
 
-    def format_final_chunk(self) -> str:
+    def format_final_chunk(self) -> bytes:
         """
         Format the final chunk with finish_reason and DONE marker.
 
@@ -101,3 +101,23 @@ class TestApiKeyHeader:
         """auto_error should be False to allow optional auth."""
         # APIKeyHeader stores auto_error on the instance, not the model
         assert api_key_header.auto_error is False
+
+
+class TestAuthConfig:
+    """Tests for the auth settings derived from the environment."""
+
+    def test_api_key_enables_auth(self, auth_enabled_config):
+        """A non-empty API_KEY turns authentication on."""
+        assert auth_enabled_config.api_key == "test-secret-key-123"
+        assert auth_enabled_config.auth_enabled is True
+
+    def test_empty_api_key_disables_auth(self, auth_disabled_config):
+        """An empty API_KEY leaves authentication off."""
+        assert auth_disabled_config.auth_enabled is False
+
+    def test_config_is_frozen(self, auth_enabled_config):
+        """Settings cannot drift from auth_enabled after start-up."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            auth_enabled_config.api_key = ""
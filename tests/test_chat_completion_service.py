@@ -7,7 +7,7 @@ Target: 90%+ code coverage.
 
 import unittest
 import asyncio
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import AsyncMock, Mock, MagicMock, patch, call
 from typing import Generator
 
 from fastapi.responses import StreamingResponse
@@ -618,5 +618,69 @@ class TestChatCompletionServiceStreamingGenerator(unittest.TestCase):
                 assert mock_adapter.stream.return_value[1] == adapter_model_name
 
 
+class TestChatCompletionServiceAsync(unittest.IsolatedAsyncioTestCase):
+    """Tests for the async request path used by the REST route."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_adapter = MagicMock()
+
+        with patch(
+            "src.services.chat_completion_service.PerplexityAdapter",
+            return_value=self.mock_adapter,
+        ):
+            self.service = ChatCompletionService(Mock())
+
+    async def test_handle_request_async_completion_awaits_adapter(self):
+        """Test that non-streaming requests await adapter.complete_async()."""
+        # Arrange
+        self.mock_adapter.complete_async = AsyncMock(
+            return_value=("Response", "model-name")
+        )
+        messages = [ChatMessage(role=MessageRole.USER, content="Hello")]
+        request = ChatCompletionRequest(model="gpt-4", messages=messages)
+
+        # Act
+        result = await self.service.handle_request_async(request)
+
+        # Assert
+        assert isinstance(result, ChatCompletionResponse)
+        assert result.choices[0].message.content == "Response"
+        self.mock_adapter.complete.assert_not_called()
+        self.mock_adapter.complete_async.assert_awaited_once_with(
+            messages=messages, model="gpt-4"
+        )
+
+    async def test_handle_request_async_streams_formatted_chunks(self):
+        """Test that streaming requests consume adapter.stream_async()."""
+
+        # Arrange
+        async def chunks():
+            for chunk in ["Hello", "", "world"]:
+                yield chunk
+
+        self.mock_adapter.stream_async.return_value = (chunks(), "model-name")
+        messages = [ChatMessage(role=MessageRole.USER, content="Hello")]
+        request = ChatCompletionRequest(model="gpt-4", messages=messages, stream=True)
+
+        # Act
+        with patch(
+            "src.services.chat_completion_service.StreamFormatter"
+        ) as mock_formatter_class:
+            mock_formatter = mock_formatter_class.return_value
+            mock_formatter.format_role_chunk.return_value = "role"
+            mock_formatter.format_content_chunk.side_effect = lambda text: text
+            mock_formatter.format_final_chunk.return_value = "final"
+
+            result = await self.service.handle_request_async(request)
+            body = [chunk async for chunk in result.body_iterator]
+
+        # Assert
+        assert isinstance(result, StreamingResponse)
+        assert result.headers["X-Accel-Buffering"] == "no"
+        assert body == ["role", "Hello", "world", "final"]
+        self.mock_adapter.stream.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -504,7 +504,7 @@ class TestChunkExtractorGetFullText:
 
         # Mock state.get_all_text() to verify it's called
         with patch.object(
-            extractor.state, "get_all_text", return_value="mocked_text"
+            StreamingState, "get_all_text", return_value="mocked_text"
         ) as mock_get_all:
             result = extractor.get_full_text()
 
@@ -578,7 +578,7 @@ class TestChunkExtractorIsComplete:
 
         # Mock state.is_all_complete()
         with patch.object(
-            extractor.state, "is_all_complete", return_value=True
+            StreamingState, "is_all_complete", return_value=True
         ) as mock_is_complete:
             result = extractor.is_complete()
 
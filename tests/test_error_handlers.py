@@ -4,6 +4,8 @@ Unit tests for src/api/error_handlers.py
 Tests exception classes, error handlers, and handler registration.
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from fastapi import HTTPException, Request
@@ -324,6 +326,17 @@ class TestOpenAIAPIErrorHandler:
         # JSONResponse content is passed as dict
         assert response.body is not None
 
+    @pytest.mark.asyncio
+    async def test_body_is_compact_json(self):
+        """Test handler body is rendered as compact UTF-8 JSON."""
+        error = AuthenticationError(message="Invalid key")
+        request = MagicMock(spec=Request)
+
+        response = await openai_api_error_handler(request, error)
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.body.startswith(b'{"error":{"message":"Invalid key"')
+
     @pytest.mark.asyncio
     async def test_logs_warning(self):
         """Test handler logs warning."""
@@ -457,6 +470,32 @@ class TestHTTPExceptionHandler:
 
         assert response.status_code == 418
 
+    @pytest.mark.asyncio
+    async def test_body_uses_openai_error_format(self):
+        """Test handler body carries the detail and mapped error type."""
+        exc = HTTPException(status_code=404, detail="Not Found")
+        request = MagicMock(spec=Request)
+
+        response = await http_exception_handler(request, exc)
+
+        data = json.loads(response.body)
+        assert data["error"]["message"] == "Not Found"
+        assert data["error"]["type"] == "not_found_error"
+
+    @pytest.mark.asyncio
+    async def test_repeated_exception_reuses_body(self):
+        """Test identical HTTPExceptions share one serialized body."""
+        request = MagicMock(spec=Request)
+
+        first = await http_exception_handler(
+            request, HTTPException(status_code=401, detail="Invalid API key.")
+        )
+        second = await http_exception_handler(
+            request, HTTPException(status_code=401, detail="Invalid API key.")
+        )
+
+        assert first.body is second.body
+
 
 class TestGeneralExceptionHandler:
     """Test cases for general_exception_handler."""
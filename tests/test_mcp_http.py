@@ -127,6 +127,25 @@ class TestMCPAuthMiddleware:
             assert response.status_code == 200
             assert response.json() == {"status": "ok"}
 
+    @pytest.mark.asyncio
+    async def test_middleware_passes_non_http_scopes(self):
+        """Lifespan and other non-HTTP scopes should bypass the key check."""
+        calls = []
+
+        async def inner_app(scope, receive, send):
+            calls.append(scope["type"])
+
+        with patch("src.core.mcp_auth.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-secret-key"
+
+            from src.core.mcp_auth import MCPAuthMiddleware
+
+            middleware = MCPAuthMiddleware(inner_app)
+            await middleware({"type": "lifespan"}, None, None)
+
+        assert calls == ["lifespan"]
+
 
 class TestMCPHTTPAppCreation:
     """Tests for MCP HTTP app creation."""
@@ -218,3 +237,56 @@ class TestMCPHTTPConfig:
             importlib.reload(src.config)
 
             assert src.config.config.mcp_http_port == 8000
+
+    def test_mcp_session_backend_default_is_memory(self):
+        """Default MCP session backend should keep sessions in memory."""
+        with patch.dict("os.environ", {}, clear=False):
+            import os
+
+            os.environ.pop("MCP_SESSION_BACKEND", None)
+
+            import importlib
+            import src.config
+
+            importlib.reload(src.config)
+
+            assert src.config.config.mcp_session_backend == "memory"
+
+
+class TestTransportSecurity:
+    """Tests for MCP transport security settings."""
+
+    def test_host_check_parses_allowed_hosts(self):
+        """Custom hosts should be trimmed and empty entries dropped."""
+        from mcp_service import get_transport_security
+
+        env = {"MCP_ENABLE_HOST_CHECK": " Yes ", "MCP_ALLOWED_HOSTS": "a.io, ,b.io "}
+        get_transport_security.cache_clear()
+        try:
+            with patch.dict("os.environ", env):
+                settings = get_transport_security()
+        finally:
+            get_transport_security.cache_clear()
+
+        assert settings.enable_dns_rebinding_protection is True
+        assert settings.allowed_hosts[-2:] == ["a.io", "b.io"]
+
+    def test_host_check_defaults_to_local_hosts(self):
+        """Without MCP_ALLOWED_HOSTS only the local defaults are allowed."""
+        from mcp_service import _DEFAULT_ALLOWED_HOSTS, get_transport_security
+
+        env = {"MCP_ENABLE_HOST_CHECK": "true", "MCP_ALLOWED_HOSTS": ""}
+        get_transport_security.cache_clear()
+        try:
+            with patch.dict("os.environ", env):
+                settings = get_transport_security()
+        finally:
+            get_transport_security.cache_clear()
+
+        assert settings.allowed_hosts == list(_DEFAULT_ALLOWED_HOSTS)
+
+    def test_result_is_cached(self):
+        """Repeated calls should return the same settings object."""
+        from mcp_service import get_transport_security
+
+        assert get_transport_security() is get_transport_security()
@@ -9,11 +9,24 @@ These unit tests mock PerplexityClient to avoid live API calls. They verify:
 - Error responses return {"text": "[Error] ..."}
 """
 
-from unittest.mock import patch, MagicMock
+import asyncio
+import dataclasses
+import sqlite3
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 
 import mcp_service
+from src.core.perplexity_client import PerplexityClient, PerplexityResponse
+from src.core.response_cache import DiskResponseCache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty response cache."""
+    mcp_service._response_cache.clear()
+    yield
+    mcp_service._response_cache.clear()
 
 
 @pytest.fixture
@@ -31,9 +44,9 @@ def mock_response():
 
 @pytest.fixture
 def mock_client(mock_response):
-    """Patch get_client() to return a mock whose .ask() returns mock_response."""
+    """Patch get_client() to return a mock whose .ask_async() returns mock_response."""
     client = MagicMock()
-    client.ask.return_value = mock_response
+    client.ask_async = AsyncMock(return_value=mock_response)
     with patch.object(mcp_service, "get_client", return_value=client):
         # Also reset the module-level cached client
         mcp_service._client = None
@@ -43,27 +56,27 @@ def mock_client(mock_response):
 class TestPerplexitySearchResponseShape:
     """Verify conditional response shape for perplexity_search."""
 
-    def test_default_returns_text_only(self, mock_client):
-        result = mcp_service.perplexity_search("hello")
+    async def test_default_returns_text_only(self, mock_client):
+        result = await mcp_service.perplexity_search("hello")
         assert result == {"text": "The answer is 42."}
         assert "citations" not in result
         assert "related_queries" not in result
         assert "media_count" not in result
 
-    def test_include_citations_adds_citations(self, mock_client):
-        result = mcp_service.perplexity_search("hello", include_citations=True)
+    async def test_include_citations_adds_citations(self, mock_client):
+        result = await mcp_service.perplexity_search("hello", include_citations=True)
         assert "citations" in result
         assert len(result["citations"]) == 2
         assert "related_queries" not in result
 
-    def test_include_related_adds_related_queries(self, mock_client):
-        result = mcp_service.perplexity_search("hello", include_related=True)
+    async def test_include_related_adds_related_queries(self, mock_client):
+        result = await mcp_service.perplexity_search("hello", include_related=True)
         assert "related_queries" in result
         assert result["related_queries"] == ["query 1", "query 2"]
         assert "citations" not in result
 
-    def test_both_flags_include_both(self, mock_client):
-        result = mcp_service.perplexity_search(
+    async def test_both_flags_include_both(self, mock_client):
+        result = await mcp_service.perplexity_search(
             "hello", include_citations=True, include_related=True
         )
         assert "citations" in result
@@ -74,21 +87,21 @@ class TestPerplexitySearchResponseShape:
 class TestPerplexitySearchSourcesRouting:
     """Verify sources parameter maps to the right search_focus."""
 
-    def test_default_sources_web(self, mock_client):
-        mcp_service.perplexity_search("q")
-        call_kwargs = mock_client.ask.call_args.kwargs
+    async def test_default_sources_web(self, mock_client):
+        await mcp_service.perplexity_search("q")
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         assert call_kwargs["sources"] == ["web"]
         assert call_kwargs["search_focus"] == "internet"
 
-    def test_scholar_only_uses_academic_focus(self, mock_client):
-        mcp_service.perplexity_search("q", sources=["scholar"])
-        call_kwargs = mock_client.ask.call_args.kwargs
+    async def test_scholar_only_uses_academic_focus(self, mock_client):
+        await mcp_service.perplexity_search("q", sources=["scholar"])
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         assert call_kwargs["sources"] == ["scholar"]
         assert call_kwargs["search_focus"] == "academic"
 
-    def test_combined_sources_uses_internet_focus(self, mock_client):
-        mcp_service.perplexity_search("q", sources=["web", "scholar"])
-        call_kwargs = mock_client.ask.call_args.kwargs
+    async def test_combined_sources_uses_internet_focus(self, mock_client):
+        await mcp_service.perplexity_search("q", sources=["web", "scholar"])
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         assert call_kwargs["sources"] == ["web", "scholar"]
         assert call_kwargs["search_focus"] == "internet"
 
@@ -96,63 +109,398 @@ class TestPerplexitySearchSourcesRouting:
 class TestPerplexityResearch:
     """Verify perplexity_research tool."""
 
-    def test_default_returns_text_only(self, mock_client):
-        result = mcp_service.perplexity_research("topic X")
+    async def test_default_returns_text_only(self, mock_client):
+        result = await mcp_service.perplexity_research("topic X")
         assert "text" in result
         assert "citations" not in result
         assert "related_queries" not in result
 
-    def test_academic_category_resolves(self, mock_client):
+    async def test_academic_category_resolves(self, mock_client):
         """New 'academic' category must be registered and load the academic template."""
-        mcp_service.perplexity_research("topic", category="academic")
-        call_kwargs = mock_client.ask.call_args.kwargs
+        await mcp_service.perplexity_research("topic", category="academic")
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         prompt = call_kwargs["query"]
         assert "academic/general context" in prompt
         assert "topic" in prompt
 
-    def test_unknown_category_falls_back_to_general(self, mock_client):
+    async def test_unknown_category_falls_back_to_general(self, mock_client):
         """Unknown category should silently fall back to 'general' template."""
-        mcp_service.perplexity_research("topic", category="not_a_real_category")
-        call_kwargs = mock_client.ask.call_args.kwargs
+        await mcp_service.perplexity_research("topic", category="not_a_real_category")
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         # general.py TEMPLATE should contain a recognizable marker
         assert "topic" in call_kwargs["query"]
 
-    def test_ml_dataset_category_uses_correct_template(self, mock_client):
-        mcp_service.perplexity_research("housing", category="ml_dataset_tabular")
-        call_kwargs = mock_client.ask.call_args.kwargs
+    @pytest.mark.parametrize("spelling", ["API", "Api", " api "])
+    async def test_category_spellings_resolve(self, mock_client, spelling):
+        await mcp_service.perplexity_research("topic", category=spelling)
+        _, expected = mcp_service._build_research_prompt("topic", "api")
+        assert mock_client.ask_async.call_args.kwargs["query"] == expected
+
+    async def test_ml_dataset_category_uses_correct_template(self, mock_client):
+        await mcp_service.perplexity_research("housing", category="ml_dataset_tabular")
+        call_kwargs = mock_client.ask_async.call_args.kwargs
         assert "tabular" in call_kwargs["query"].lower()
         assert "housing" in call_kwargs["query"]
 
-    def test_include_citations_opt_in(self, mock_client):
-        result = mcp_service.perplexity_research(
+    async def test_include_citations_opt_in(self, mock_client):
+        result = await mcp_service.perplexity_research(
             "topic", category="general", include_citations=True
         )
         assert "citations" in result
 
 
+class TestPerplexityResearchStream:
+    """Verify perplexity_research_stream forwards text as progress."""
+
+    @staticmethod
+    def _streaming_client(*texts):
+        """Build a client whose ask_partial_async grows the answer step by step."""
+        partial = MagicMock(citations=[], related_queries=[])
+
+        async def ask_partial_async(**kwargs):
+            for text in texts:
+                partial.text = text
+                yield partial
+
+        client = MagicMock()
+        client.ask_partial_async = MagicMock(side_effect=ask_partial_async)
+        return client
+
+    async def test_reports_text_deltas_as_progress(self):
+        client = self._streaming_client("The ", "The answer", "The answer is 42.")
+        ctx = MagicMock(report_progress=AsyncMock())
+        with patch.object(mcp_service, "get_client", return_value=client):
+            result = await mcp_service.perplexity_research_stream("topic", ctx=ctx)
+
+        assert result == {"text": "The answer is 42."}
+        messages = [c.kwargs["message"] for c in ctx.report_progress.call_args_list]
+        assert messages == ["The ", "answer", " is 42."]
+
+    async def test_rewritten_text_is_not_reported(self):
+        client = self._streaming_client("draft", "Final answer")
+        ctx = MagicMock(report_progress=AsyncMock())
+        with patch.object(mcp_service, "get_client", return_value=client):
+            result = await mcp_service.perplexity_research_stream("topic", ctx=ctx)
+
+        assert result == {"text": "Final answer"}
+        ctx.report_progress.assert_awaited_once_with(5, message="draft")
+
+    async def test_reports_every_upstream_chunk(self):
+        env_vars = {
+            "PERPLEXITY_SESSION_TOKEN": "test_session_token",
+            "PERPLEXITY_CF_CLEARANCE": "test_cf_clearance",
+        }
+        with patch.dict("os.environ", env_vars, clear=True):
+            with patch("src.core.perplexity_client.load_dotenv"):
+                client = PerplexityClient()
+
+        def block_event(patch_):
+            usage = "ask_text_0_markdown"
+            return {
+                "blocks": [
+                    {"intended_usage": usage, "diff_block": {"patches": [patch_]}}
+                ]
+            }
+
+        async def fake_stream(**kwargs):
+            yield block_event(
+                {"op": "replace", "path": "", "value": {"chunks": ["Hello"]}}
+            )
+            yield block_event({"op": "add", "path": "/chunks/1", "value": " big"})
+            yield block_event({"op": "add", "path": "/chunks/2", "value": " world"})
+            yield {"step_type": "FINAL", "text": "[]"}
+
+        ctx = MagicMock(report_progress=AsyncMock())
+        with patch.object(client, "ask_stream_async", side_effect=fake_stream):
+            with patch.object(mcp_service, "get_client", return_value=client):
+                result = await mcp_service.perplexity_research_stream("topic", ctx=ctx)
+
+        assert result == {"text": "Hello big world"}
+        messages = [c.kwargs["message"] for c in ctx.report_progress.call_args_list]
+        assert messages == ["Hello", " big", " world"]
+
+    async def test_failed_progress_stops_reporting_but_keeps_result(self):
+        client = self._streaming_client("The ", "The answer", "The answer is 42.")
+        ctx = MagicMock(report_progress=AsyncMock(side_effect=RuntimeError("gone")))
+        with patch.object(mcp_service, "get_client", return_value=client):
+            result = await mcp_service.perplexity_research_stream("topic", ctx=ctx)
+
+        assert result == {"text": "The answer is 42."}
+        ctx.report_progress.assert_awaited_once()
+
+    async def test_joins_running_research_request(self, mock_client, mock_response):
+        release = asyncio.Event()
+
+        async def slow_ask(**kwargs):
+            await release.wait()
+            return mock_response
+
+        mock_client.ask_async = AsyncMock(side_effect=slow_ask)
+        pending = asyncio.gather(
+            mcp_service.perplexity_research("topic"),
+            mcp_service.perplexity_research_stream("topic"),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        research, streamed = await pending
+
+        assert research == streamed == {"text": "The answer is 42."}
+        mock_client.ask_partial_async.assert_not_called()
+
+    async def test_shares_cache_with_perplexity_research(self, mock_client):
+        await mcp_service.perplexity_research("topic", category="api")
+        result = await mcp_service.perplexity_research_stream("topic", category="api")
+        assert result == {"text": "The answer is 42."}
+        mock_client.ask_partial_async.assert_not_called()
+
+
+class TestPerplexityBatch:
+    """Verify perplexity_batch fans queries out to perplexity_search."""
+
+    async def test_returns_results_in_query_order(self, mock_client):
+        result = await mcp_service.perplexity_batch(["one", "two", "three"])
+        assert [r["query"] for r in result["results"]] == ["one", "two", "three"]
+        assert all(r["text"] == "The answer is 42." for r in result["results"])
+        assert mock_client.ask_async.call_count == 3
+
+    async def test_failed_query_does_not_fail_batch(self, mock_response):
+        client = MagicMock()
+        client.ask_async = AsyncMock(side_effect=[RuntimeError("boom"), mock_response])
+        with patch.object(mcp_service, "get_client", return_value=client):
+            result = await mcp_service.perplexity_batch(
+                ["bad", "good"], max_concurrent=1
+            )
+        assert "[Error]" in result["results"][0]["text"]
+        assert result["results"][1]["text"] == "The answer is 42."
+
+    async def test_rejects_oversized_batch(self, mock_client):
+        queries = [f"q{i}" for i in range(mcp_service.BATCH_MAX_QUERIES + 1)]
+        result = await mcp_service.perplexity_batch(queries)
+        assert "[Error]" in result["text"]
+        mock_client.ask_async.assert_not_called()
+
+
+class TestUpstreamConcurrency:
+    """Upstream requests are capped across all tool calls."""
+
+    async def test_requests_beyond_cap_wait(self, mock_client, mock_response):
+        running = 0
+        peak = 0
+
+        async def tracked_ask(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return mock_response
+
+        mock_client.ask_async = AsyncMock(side_effect=tracked_ask)
+        with patch.object(mcp_service, "_upstream_slots", asyncio.Semaphore(2)):
+            result = await mcp_service.perplexity_batch(
+                ["one", "two", "three", "four"], max_concurrent=4
+            )
+
+        assert len(result["results"]) == 4
+        assert mock_client.ask_async.call_count == 4
+        assert peak == 2
+
+    async def test_slow_upstream_times_out(self, mock_client):
+        async def hanging_ask(**kwargs):
+            await asyncio.sleep(10)
+
+        mock_client.ask_async = AsyncMock(side_effect=hanging_ask)
+        timeout_config = dataclasses.replace(
+            mcp_service.config, mcp_request_timeout_s=0.01
+        )
+        with patch.object(mcp_service, "config", timeout_config):
+            result = await mcp_service.perplexity_search("q")
+
+        assert result == {
+            "text": "[Error] TimeoutError: No answer from Perplexity within 0.01s"
+        }
+        assert mcp_service._inflight == {}
+
+
+class TestResponseCache:
+    """Repeated identical requests are served from the response cache."""
+
+    async def test_repeated_search_hits_upstream_once(self, mock_client):
+        first = await mcp_service.perplexity_search("hello")
+        second = await mcp_service.perplexity_search("  Hello ")
+        assert first == second
+        assert mock_client.ask_async.call_count == 1
+
+    async def test_different_sources_miss_cache(self, mock_client):
+        await mcp_service.perplexity_search("hello")
+        await mcp_service.perplexity_search("hello", sources=["scholar"])
+        assert mock_client.ask_async.call_count == 2
+
+    async def test_research_topic_variants_share_entry(self, mock_client):
+        await mcp_service.perplexity_research("pytorch dataloader", category="library")
+        await mcp_service.perplexity_research(
+            "PyTorch   DataLoader", category="library"
+        )
+        await mcp_service.perplexity_research("pytorch dataloader", category="api")
+        assert mock_client.ask_async.call_count == 2
+
+    async def test_concurrent_identical_searches_share_request(
+        self, mock_client, mock_response
+    ):
+        release = asyncio.Event()
+
+        async def slow_ask(**kwargs):
+            await release.wait()
+            return mock_response
+
+        mock_client.ask_async = AsyncMock(side_effect=slow_ask)
+        pending = asyncio.gather(
+            mcp_service.perplexity_search("hello"),
+            mcp_service.perplexity_search("Hello"),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        first, second = await pending
+
+        assert first == second == {"text": "The answer is 42."}
+        assert mock_client.ask_async.call_count == 1
+        assert mcp_service._inflight == {}
+
+    async def test_abandoned_failure_is_retrieved(self, mock_client):
+        release = asyncio.Event()
+
+        async def failing_ask(**kwargs):
+            await release.wait()
+            raise RuntimeError("boom")
+
+        mock_client.ask_async = AsyncMock(side_effect=failing_ask)
+        caller = asyncio.ensure_future(mcp_service.perplexity_search("hello"))
+        await asyncio.sleep(0)
+        (task,) = mcp_service._inflight.values()
+        caller.cancel()
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert task.done()
+        assert mcp_service._inflight == {}
+        # asyncio only logs "exception was never retrieved" for unset flags
+        assert not task._log_traceback
+
+    async def test_persistent_cache_survives_memory_loss(self, mock_client, tmp_path):
+        disk_cache = DiskResponseCache(str(tmp_path), ttl=60)
+        with patch.object(mcp_service, "_disk_cache", disk_cache):
+            mock_client.ask_async.return_value = PerplexityResponse(text="saved")
+            await mcp_service.perplexity_search("hello")
+            mcp_service._response_cache.clear()
+            result = await mcp_service.perplexity_search("hello")
+        disk_cache.close()
+
+        assert result == {"text": "saved"}
+        assert mock_client.ask_async.call_count == 1
+
+    async def test_unreadable_persistent_cache_is_a_miss(self, mock_client):
+        disk_cache = MagicMock()
+        disk_cache.get.side_effect = sqlite3.OperationalError("database is locked")
+        with patch.object(mcp_service, "_disk_cache", disk_cache):
+            result = await mcp_service.perplexity_search("hello")
+
+        assert result == {"text": "The answer is 42."}
+        mock_client.ask_async.assert_awaited_once()
+
+    async def test_unusable_cache_dir_disables_persistent_cache(
+        self, mock_client, tmp_path
+    ):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache_config = dataclasses.replace(
+            mcp_service.config, perplexity_cache_dir=str(blocker)
+        )
+        with (
+            patch.object(mcp_service, "config", cache_config),
+            patch.object(mcp_service, "_disk_cache", None),
+            patch.object(mcp_service, "_disk_cache_opened", False),
+        ):
+            result = await mcp_service.perplexity_search("hello")
+            assert mcp_service.get_disk_cache() is None
+
+        assert result == {"text": "The answer is 42."}
+
+    async def test_empty_answers_are_not_cached(self, mock_client):
+        mock_client.ask_async.return_value = PerplexityResponse()
+        first = await mcp_service.perplexity_search("q")
+        await mcp_service.perplexity_search("q")
+        assert first == {"text": "No response received."}
+        assert mock_client.ask_async.call_count == 2
+
+    async def test_errors_are_not_cached(self, mock_response):
+        client = MagicMock()
+        client.ask_async = AsyncMock(side_effect=[RuntimeError("boom"), mock_response])
+        with patch.object(mcp_service, "get_client", return_value=client):
+            failed = await mcp_service.perplexity_search("q")
+            retried = await mcp_service.perplexity_search("q")
+        assert "[Error]" in failed["text"]
+        assert retried == {"text": "The answer is 42."}
+
+
 class TestErrorShape:
     """Error responses still match the minimal shape."""
 
-    def test_search_error_returns_text_only(self):
+    async def test_search_error_returns_text_only(self):
         broken_client = MagicMock()
-        broken_client.ask.side_effect = RuntimeError("boom")
+        broken_client.ask_async = AsyncMock(side_effect=RuntimeError("boom"))
         with patch.object(mcp_service, "get_client", return_value=broken_client):
             mcp_service._client = None
-            result = mcp_service.perplexity_search("q")
+            result = await mcp_service.perplexity_search("q")
         assert list(result.keys()) == ["text"]
         assert "[Error]" in result["text"]
         assert "boom" in result["text"]
 
-    def test_research_error_returns_text_only(self):
+    async def test_research_error_returns_text_only(self):
         broken_client = MagicMock()
-        broken_client.ask.side_effect = ValueError("nope")
+        broken_client.ask_async = AsyncMock(side_effect=ValueError("nope"))
         with patch.object(mcp_service, "get_client", return_value=broken_client):
             mcp_service._client = None
-            result = mcp_service.perplexity_research("t")
+            result = await mcp_service.perplexity_research("t")
         assert list(result.keys()) == ["text"]
         assert "[Error]" in result["text"]
 
 
+class TestCompactOutput:
+    """Dict tool results are sent as compact JSON text."""
+
+    async def test_call_tool_returns_compact_json(self, mock_client):
+        content = await mcp_service.mcp.call_tool(
+            "perplexity_search", {"query": "q", "include_related": True}
+        )
+        assert len(content) == 1
+        assert content[0].text == (
+            '{"text":"The answer is 42.","related_queries":["query 1","query 2"]}'
+        )
+
+
+class TestWarmClient:
+    """Start-up client initialization."""
+
+    def test_warm_client_tolerates_missing_credentials(self):
+        with patch.object(
+            mcp_service, "get_client", side_effect=ValueError("missing token")
+        ) as get_client:
+            mcp_service._warm_client()
+        get_client.assert_called_once()
+
+
+class TestSharedClient:
+    """The MCP server shares the REST API's client."""
+
+    def test_get_client_uses_rest_singleton(self):
+        client = MagicMock()
+        with patch.object(mcp_service, "_client", None):
+            with patch.object(
+                mcp_service, "get_perplexity_client", return_value=client
+            ):
+                assert mcp_service.get_client() is client
+
+
 class TestToolSurface:
     """Ensure only the 2 new tools are exposed, old tools are gone."""
 
@@ -170,3 +518,5 @@ class TestToolSurface:
     def test_new_tools_present(self):
         assert hasattr(mcp_service, "perplexity_search")
         assert hasattr(mcp_service, "perplexity_research")
+        assert hasattr(mcp_service, "perplexity_batch")
+        assert hasattr(mcp_service, "perplexity_research_stream")
@@ -0,0 +1,300 @@
+"""Tests for pure ASGI REST middleware."""
+
+import pytest
+from unittest.mock import patch
+from httpx import AsyncClient, ASGITransport
+
+
+def _make_app():
+    """Build a minimal Starlette app with a single JSON route."""
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+    from starlette.responses import JSONResponse
+
+    async def dummy_endpoint(request):
+        return JSONResponse({"status": "ok"})
+
+    return Starlette(
+        routes=[
+            Route("/test", dummy_endpoint, methods=["GET"]),
+            Route("/v1/test", dummy_endpoint, methods=["GET"]),
+            Route("/v1/upload", dummy_endpoint, methods=["POST"]),
+        ]
+    )
+
+
+class TestStaticCORSMiddleware:
+    """Tests for StaticCORSMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_adds_cors_headers_to_response(self):
+        """Regular responses should carry the static CORS headers."""
+        from src.api.middleware import StaticCORSMiddleware
+
+        app = _make_app()
+        app.add_middleware(StaticCORSMiddleware)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/test", headers={"Origin": "http://example.com"}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["vary"] == "Origin"
+        assert "access-control-allow-credentials" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_preflight_short_circuits(self):
+        """Preflight requests should be answered without reaching the app."""
+        from src.api.middleware import StaticCORSMiddleware
+
+        app = _make_app()
+        app.add_middleware(StaticCORSMiddleware)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.options(
+                "/test",
+                headers={
+                    "Origin": "http://example.com",
+                    "Access-Control-Request-Method": "POST",
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["access-control-allow-methods"] == "*"
+        assert response.headers["access-control-allow-headers"] == "*"
+        assert response.headers["access-control-max-age"] == "86400"
+
+    @pytest.mark.asyncio
+    async def test_preflight_echoes_requested_headers(self):
+        """Requested headers, including Authorization, should be allowed."""
+        from src.api.middleware import StaticCORSMiddleware
+
+        app = _make_app()
+        app.add_middleware(StaticCORSMiddleware)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.options(
+                "/v1/test",
+                headers={
+                    "Origin": "http://example.com",
+                    "Access-Control-Request-Method": "POST",
+                    "Access-Control-Request-Headers": "authorization,content-type",
+                },
+            )
+
+        assert response.status_code == 200
+        assert (
+            response.headers["access-control-allow-headers"]
+            == "authorization,content-type"
+        )
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-max-age"] == "86400"
+
+    @pytest.mark.asyncio
+    async def test_plain_options_reaches_app(self):
+        """OPTIONS without a preflight header should be routed normally."""
+        from src.api.middleware import StaticCORSMiddleware
+
+        app = _make_app()
+        app.add_middleware(StaticCORSMiddleware)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.options("/test")
+
+        # The route only allows GET, so the router answers 405
+        assert response.status_code == 405
+        assert response.headers["access-control-allow-origin"] == "*"
+
+
+class TestStaticRouteFastPath:
+    """Tests for StaticRouteFastPath."""
+
+    @staticmethod
+    async def _asgi_endpoint(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/plain")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"fast"})
+
+    @pytest.mark.asyncio
+    async def test_registered_path_bypasses_router(self):
+        """Registered (method, path) pairs should hit the handler directly."""
+        from src.api.middleware import StaticRouteFastPath
+
+        app = _make_app()
+        app.add_middleware(
+            StaticRouteFastPath, routes={("POST", "/fast"): self._asgi_endpoint}
+        )
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post("/fast")
+
+        assert response.status_code == 200
+        assert response.text == "fast"
+
+    @pytest.mark.asyncio
+    async def test_unregistered_method_falls_through(self):
+        """Other methods on a registered path should reach the router."""
+        from src.api.middleware import StaticRouteFastPath
+
+        app = _make_app()
+        app.add_middleware(
+            StaticRouteFastPath, routes={("POST", "/fast"): self._asgi_endpoint}
+        )
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            fallthrough = await client.get("/fast")
+            routed = await client.get("/test")
+
+        assert fallthrough.status_code == 404
+        assert routed.json() == {"status": "ok"}
+
+
+class TestRESTAuthMiddleware:
+    """Tests for RESTAuthMiddleware."""
+
+    async def _get(self, path, headers=None, root_path=""):
+        from src.api.middleware import RESTAuthMiddleware
+
+        app = _make_app()
+        app.add_middleware(RESTAuthMiddleware)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app, root_path=root_path),
+            base_url="http://test",
+        ) as client:
+            return await client.get(path, headers=headers)
+
+    @pytest.mark.asyncio
+    async def test_missing_key_rejected_before_routing(self):
+        """Protected paths without a key should get an OpenAI-style 401."""
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-key"
+
+            response = await self._get("/v1/test")
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "ApiKey"
+        assert response.json()["error"] == {
+            "message": "Missing API key. Provide X-API-Key header.",
+            "type": "authentication_error",
+            "param": None,
+            "code": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_protected_under_root_path(self):
+        """A root_path prefix must not let protected paths skip auth."""
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-key"
+
+            rejected = await self._get("/api/v1/test", root_path="/api")
+            accepted = await self._get(
+                "/api/v1/test", headers={"X-API-Key": "valid-key"}, root_path="/api"
+            )
+
+        assert rejected.status_code == 401
+        assert accepted.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_rejected(self):
+        """A wrong key should be rejected."""
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-key"
+
+            response = await self._get("/v1/test", headers={"X-API-Key": "wrong"})
+
+        assert response.status_code == 401
+        assert response.json()["error"]["message"] == "Invalid API key."
+
+    @pytest.mark.asyncio
+    async def test_valid_key_reaches_app(self):
+        """The configured key should pass through to the route."""
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-key"
+
+            response = await self._get("/v1/test", headers={"X-API-Key": "valid-key"})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_unprotected_paths_and_disabled_auth_pass(self):
+        """Paths outside /v1/ and disabled auth should not be checked."""
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = True
+            mock_config.api_key = "valid-key"
+            unprotected = await self._get("/test")
+
+            mock_config.auth_enabled = False
+            disabled = await self._get("/v1/test")
+
+        assert unprotected.status_code == 200
+        assert disabled.status_code == 200
+
+
+class TestBodySizeLimitMiddleware:
+    """Tests for BodySizeLimitMiddleware."""
+
+    async def _post(self, content, max_bytes=16):
+        from src.api.middleware import BodySizeLimitMiddleware
+
+        app = _make_app()
+        app.add_middleware(BodySizeLimitMiddleware, max_bytes=max_bytes)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post("/v1/upload", content=content)
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_rejected(self):
+        """A Content-Length above the limit should get an OpenAI-style 413."""
+        response = await self._post(b"x" * 17)
+
+        assert response.status_code == 413
+        assert response.json()["error"] == {
+            "message": "Request body too large. Maximum size is 16 bytes.",
+            "type": "invalid_request_error",
+            "param": None,
+            "code": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_body_within_limit_reaches_app(self):
+        """Bodies up to the limit should pass through."""
+        response = await self._post(b"x" * 16)
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_disables_check(self):
+        """A limit of 0 should let any body through."""
+        response = await self._post(b"x" * 1024, max_bytes=0)
+
+        assert response.status_code == 200
@@ -176,6 +176,9 @@ class TestGetModelConfig:
         config = get_model_config("")
         assert config.perplexity_model == DEFAULT_MODEL
 
+    def test_unknown_models_share_default_config(self):
+        assert get_model_config("unknown-a") is get_model_config("unknown-b")
+
     def test_config_immutability_across_calls(self):
         config1 = get_model_config("claude-sonnet-5")
         config2 = get_model_config("gpt-5.6-terra")
@@ -193,11 +196,14 @@ class TestGetModelConfig:
 class TestListAvailableModels:
     """Tests for list_available_models() function."""
 
-    def test_returns_non_empty_list(self):
+    def test_returns_non_empty_tuple(self):
         result = list_available_models()
-        assert isinstance(result, list)
+        assert isinstance(result, tuple)
         assert len(result) > 0
 
+    def test_returns_same_object_each_call(self):
+        assert list_available_models() is list_available_models()
+
     def test_contains_all_registry_keys(self):
         result = list_available_models()
         assert set(result) == set(MODEL_REGISTRY.keys())
@@ -251,6 +257,12 @@ class TestModelRegistry:
             if internal in MODEL_REGISTRY:
                 assert MODEL_REGISTRY[internal].perplexity_model == internal
 
+    def test_aliases_share_one_config_per_model(self):
+        """Aliases of the same internal model resolve to a single instance."""
+        by_model = {}
+        for config in MODEL_REGISTRY.values():
+            assert by_model.setdefault(config.perplexity_model, config) is config
+
     def test_all_configs_have_sources_list(self):
         for config in MODEL_REGISTRY.values():
             assert isinstance(config.sources, list)
@@ -303,7 +315,10 @@ class TestIntegration:
 
     def test_get_perplexity_model_matches_get_model_config(self):
         model_name = "gpt-5.6-terra"
-        assert get_perplexity_model(model_name) == get_model_config(model_name).perplexity_model
+        assert (
+            get_perplexity_model(model_name)
+            == get_model_config(model_name).perplexity_model
+        )
 
     def test_list_available_models_all_resolve(self):
         for model in list_available_models():
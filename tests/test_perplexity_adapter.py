@@ -6,12 +6,13 @@ Tests cover:
 - Message formatting (format_messages_as_query)
 - Non-streaming completion (complete)
 - Streaming completion (stream)
+- Async variants (complete_async, stream_async)
 
 All tests use mocked PerplexityClient to avoid real API calls.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from src.services.perplexity_adapter import PerplexityAdapter
 from src.models.openai_models import ChatMessage, MessageRole
 from src.models.model_mapping import ModelConfig
@@ -510,6 +511,68 @@ class TestStream:
             assert None not in chunks
 
 
+class TestAsyncVariants:
+    """Test complete_async and stream_async."""
+
+    @pytest.mark.asyncio
+    async def test_complete_async_awaits_client_ask_async(self):
+        """Test that complete_async() uses the non-blocking client call."""
+        # Arrange
+        mock_client = Mock()
+        mock_client.ask_async = AsyncMock(return_value=Mock(text="Async answer"))
+
+        adapter = PerplexityAdapter(client=mock_client)
+        messages = [ChatMessage(role=MessageRole.USER, content="Test")]
+
+        # Act
+        text, model_name = await adapter.complete_async(
+            messages=messages, model="claude-sonnet-5"
+        )
+
+        # Assert
+        assert text == "Async answer"
+        assert model_name == "claude50sonnet"
+        mock_client.ask.assert_not_called()
+        call_kwargs = mock_client.ask_async.call_args.kwargs
+        assert call_kwargs["query"] == "Test"
+        assert call_kwargs["is_incognito"] is True
+        # Enrichment reads the raw events, so the client must keep them
+        assert call_kwargs["keep_raw_events"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_async_yields_chunks(self):
+        """Test that stream_async() yields chunks from the async SSE stream."""
+
+        # Arrange
+        async def events(**kwargs):
+            yield {"type": "event"}
+
+        mock_client = Mock()
+        mock_client.ask_stream_async = Mock(side_effect=events)
+
+        adapter = PerplexityAdapter(client=mock_client)
+        messages = [ChatMessage(role=MessageRole.USER, content="Test")]
+
+        with patch(
+            "src.services.perplexity_adapter.ChunkExtractor"
+        ) as mock_extractor_class:
+            mock_extractor = Mock()
+            mock_extractor_class.return_value = mock_extractor
+            mock_extractor.process_event.return_value = iter(["chunk1", "", "chunk2"])
+
+            # Act
+            generator, model_name = adapter.stream_async(
+                messages=messages, model="claude-sonnet-5"
+            )
+            chunks = [chunk async for chunk in generator]
+
+        # Assert
+        assert chunks == ["chunk1", "chunk2"]
+        assert model_name == "claude50sonnet"
+        mock_client.ask_stream.assert_not_called()
+        assert mock_client.ask_stream_async.call_args.kwargs["is_incognito"] is True
+
+
 class TestIntegration:
     """Integration tests combining multiple components."""
 
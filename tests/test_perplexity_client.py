@@ -11,11 +11,26 @@ Tests cover:
 """
 
 import json
+import uuid
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from dataclasses import fields
 
-from src.core.perplexity_client import PerplexityClient, PerplexityResponse
+from curl_cffi.requests import exceptions as cffi_exceptions
+
+from src.core.perplexity_client import (
+    PerplexityClient,
+    PerplexityResponse,
+    _load_env,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_env_loading():
+    """Let every test observe its own .env load."""
+    _load_env.cache_clear()
+    yield
+    _load_env.cache_clear()
 
 
 class TestPerplexityClientInit:
@@ -118,6 +133,23 @@ class TestPerplexityClientInit:
                 PerplexityClient(env_path="/custom/.env")
                 mock_load.assert_called_once_with("/custom/.env")
 
+    def test_init_loads_each_env_file_once(self):
+        """Test that repeated construction does not re-read the same .env."""
+        env_vars = {
+            "PERPLEXITY_SESSION_TOKEN": "test_session_token",
+            "PERPLEXITY_CF_CLEARANCE": "test_cf_clearance",
+            "PERPLEXITY_VISITOR_ID": "test_visitor_id",
+        }
+
+        with patch.dict("os.environ", env_vars, clear=True):
+            with patch("src.core.perplexity_client.load_dotenv") as mock_load:
+                PerplexityClient()
+                PerplexityClient()
+                PerplexityClient(env_path="/custom/.env")
+                PerplexityClient(env_path="/custom/.env")
+
+                assert mock_load.call_count == 2
+
     def test_init_loads_default_env_path(self):
         """Test that load_dotenv is called without path by default."""
         env_vars = {
@@ -218,6 +250,26 @@ class TestBuildCookies:
 
         assert isinstance(cookies, dict)
 
+    def test_requests_reuse_cookies_built_at_init(self):
+        """Test that every request sends the cookies built once in __init__."""
+        client = self._create_client(cf_bm="test_cf_bm")
+        request_args = {
+            "query": "q",
+            "mode": "copilot",
+            "model_preference": "m",
+            "search_focus": "internet",
+            "sources": None,
+            "is_incognito": False,
+        }
+
+        with patch.object(client, "_build_cookies") as build:
+            first = client._build_request(**request_args)
+            second = client._build_request(**request_args)
+
+        build.assert_not_called()
+        assert first["cookies"] is second["cookies"]
+        assert first["cookies"] == client._build_cookies()
+
 
 class TestBuildHeaders:
     """Tests for PerplexityClient._build_headers()"""
@@ -511,6 +563,17 @@ class TestBuildPayload:
         assert len(uuid_str) == 36  # Standard UUID length
         assert uuid_str.count("-") == 4
 
+    def test_build_payload_uuids_are_version_4(self):
+        """Test that generated ids are valid random (version 4) UUIDs."""
+        client = self._create_client()
+        params = client._build_payload("test")["params"]
+
+        for key in ("frontend_uuid", "frontend_context_uuid", "rum_session_id"):
+            parsed = uuid.UUID(params[key])
+            assert str(parsed) == params[key]
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
     def test_build_payload_includes_frontend_context_uuid(self):
         """Test that params includes frontend_context_uuid."""
         client = self._create_client()
@@ -550,9 +613,42 @@ class TestBuildPayload:
 
         assert payload["params"]["attachments"] == []
 
+    def test_build_request_sends_orjson_encoded_payload(self):
+        """Test that the request body is the payload pre-serialized as JSON."""
+        client = self._create_client()
+        request = client._build_request(
+            query="caf\u00e9",
+            mode="copilot",
+            model_preference="gpt-4",
+            search_focus="internet",
+            sources=None,
+            is_incognito=True,
+        )
+
+        assert "json" not in request
+        assert isinstance(request["data"], bytes)
+        assert request["headers"]["content-type"] == "application/json"
+        body = json.loads(request["data"])
+        assert body["query_str"] == "caf\u00e9"
+        assert body["params"]["supported_block_use_cases"][0] == "answer_modes"
+        assert body["params"]["is_incognito"] is True
+
+    def test_build_payload_does_not_leak_between_requests(self):
+        """Test that per-request params don't bleed into the shared template."""
+        client = self._create_client()
+        first = client._build_payload("first", mode="search")
+        second = client._build_payload("second")
+
+        assert first["params"] is not second["params"]
+        assert first["params"]["dsl_query"] == "first"
+        assert second["params"]["dsl_query"] == "second"
+        assert second["params"]["mode"] == "copilot"
+        assert client._params_template["dsl_query"] is None
+        assert list(first["params"]) == list(client._params_template)
+
 
-class TestParseSSELine:
-    """Tests for PerplexityClient._parse_sse_line()"""
+class TestSSEStreamHandling:
+    """Tests for SSE buffer draining and event folding shared by ask/ask_async"""
 
     def _create_client(self):
         """Helper to create a client with mocked env vars."""
@@ -566,149 +662,468 @@ class TestParseSSELine:
             with patch("src.core.perplexity_client.load_dotenv"):
                 return PerplexityClient()
 
-    def test_parse_sse_line_parses_valid_data_line(self):
-        """Test that _parse_sse_line parses valid 'data: {...}' lines."""
+    def test_drain_buffer_keeps_partial_line(self):
+        """Test that an incomplete trailing line is left in the buffer."""
         client = self._create_client()
-        data = {"key": "value", "nested": {"inner": "data"}}
-        line = f"data: {json.dumps(data)}"
 
-        result = client._parse_sse_line(line)
+        events, rest = client._drain_buffer(b'data: {"a": 1}\n\ndata: {"b"')
 
-        assert result == data
+        assert events == [{"a": 1}]
+        assert rest == b'data: {"b"'
 
-    def test_parse_sse_line_returns_none_for_empty_line(self):
-        """Test that _parse_sse_line returns None for empty lines."""
+    def test_drain_buffer_skips_non_data_lines(self):
+        """Test that comments and event names are ignored."""
         client = self._create_client()
 
-        result = client._parse_sse_line("")
+        events, rest = client._drain_buffer(b'event: message\n: ping\ndata: {"a": 1}\n')
 
-        assert result is None
+        assert events == [{"a": 1}]
+        assert rest == b""
 
-    def test_parse_sse_line_returns_none_for_whitespace_line(self):
-        """Test that _parse_sse_line returns None for whitespace-only lines."""
+    def test_drain_buffer_handles_crlf_and_bad_lines(self):
+        """Test CRLF endings, indented data lines and undecodable payloads."""
         client = self._create_client()
 
-        result = client._parse_sse_line("   ")
+        events, rest = client._drain_buffer(
+            b'event: message\r\ndata: {"a": 1}\r\n\r\n'
+            b"data: {invalid}\n"
+            b"data:\n"
+            b'  data:{"b": 2}\n'
+            b'id: data: {"c": 3}\n'
+        )
+
+        assert events == [{"a": 1}, {"b": 2}]
+        assert rest == b""
+
+    @pytest.mark.parametrize(
+        "line",
+        [b"data:   \n", b"data: null\n", b"data: false\n", b"   \n", b"\n"],
+    )
+    def test_drain_buffer_skips_empty_payloads(self, line):
+        """Test that blank lines and empty or falsy payloads yield no event."""
+        client = self._create_client()
+
+        events, rest = client._drain_buffer(line)
 
-        assert result is None
+        assert events == []
+        assert rest == b""
 
-    def test_parse_sse_line_returns_none_for_non_data_line(self):
-        """Test that _parse_sse_line returns None for non-data lines."""
+    def test_drain_buffer_strips_payload_whitespace(self):
+        """Test that whitespace around the payload is ignored."""
         client = self._create_client()
+        data = {
+            "step_type": "FINAL",
+            "text": '{"nested": "json"}',
+            "citations": [{"title": "Example", "url": "https://example.com"}],
+        }
 
-        result = client._parse_sse_line("event: message")
+        events, _ = client._drain_buffer(f"data:   {json.dumps(data)}   \r\n".encode())
 
-        assert result is None
+        assert events == [data]
 
-    def test_parse_sse_line_returns_none_for_invalid_json(self):
-        """Test that _parse_sse_line returns None for invalid JSON."""
+    def test_feed_chunk_joins_split_event(self):
+        """Test that an event split across chunks is parsed once complete."""
+        client = self._create_client()
+        raw = 'data: {"text": "caf\u00e9"}\n'.encode()
+        pending = []
+
+        assert client._feed_chunk(pending, raw[:10]) == []
+        # Split inside the two-byte encoding of the accented character
+        assert client._feed_chunk(pending, raw[10:20]) == []
+        assert client._feed_chunk(pending, raw[20:]) == [{"text": "caf\u00e9"}]
+        assert pending == [b""]
+
+    @pytest.mark.asyncio
+    async def test_ask_async_folds_stream_events(self):
+        """Test that ask_async builds the response from the async event stream."""
         client = self._create_client()
+        final_event = {
+            "step_type": "FINAL",
+            "related_queries": ["next"],
+            "text": json.dumps(
+                [
+                    {
+                        "step_type": "FINAL",
+                        "content": {"answer": json.dumps({"answer": "Hello"})},
+                    }
+                ]
+            ),
+        }
 
-        result = client._parse_sse_line("data: {invalid json}")
+        async def fake_stream(**kwargs):
+            yield final_event
 
-        assert result is None
+        with patch.object(client, "ask_stream_async", side_effect=fake_stream):
+            response = await client.ask_async("hi")
+
+        assert response.text == "Hello"
+        assert response.related_queries == ["next"]
+        assert response.raw_events == []
 
-    def test_parse_sse_line_returns_none_for_data_with_empty_content(self):
-        """Test that _parse_sse_line returns None for 'data:' with no content."""
+    def test_ask_deduplicates_citations_by_url(self):
+        """Test that sources repeated across steps are cited once."""
         client = self._create_client()
+        source = {"name": "Python", "url": "https://python.org", "snippet": "s"}
+        other = {"name": "PEP 8", "url": "https://peps.python.org/pep-0008/"}
+        final_event = {
+            "step_type": "FINAL",
+            "text": json.dumps(
+                [
+                    {
+                        "step_type": "SEARCH_RESULTS",
+                        "content": {"web_results": [source, source]},
+                    },
+                    {
+                        "step_type": "FINAL",
+                        "content": {
+                            "answer": json.dumps(
+                                {"answer": "Hi", "web_results": [source, other]}
+                            )
+                        },
+                    },
+                ]
+            ),
+        }
 
-        result = client._parse_sse_line("data:")
+        with patch.object(client, "ask_stream", return_value=iter([final_event])):
+            response = client.ask("hi")
 
-        assert result is None
+        assert [c["url"] for c in response.citations] == [
+            "https://python.org",
+            "https://peps.python.org/pep-0008/",
+        ]
+        assert response.citations[0] == {
+            "title": "Python",
+            "url": "https://python.org",
+            "snippet": "s",
+        }
 
-    def test_parse_sse_line_returns_none_for_data_with_only_whitespace(self):
-        """Test that _parse_sse_line returns None for 'data:   ' (whitespace only)."""
+    def test_ask_stops_at_final_unless_raw_events_are_kept(self):
+        """Test that ask stops reading at FINAL and only keeps events on request."""
         client = self._create_client()
+        final_event = {
+            "step_type": "FINAL",
+            "text": json.dumps([{"step_type": "FINAL", "content": {"answer": "Done"}}]),
+        }
+        trailing_event = {"blocks": []}
+        consumed = []
 
-        result = client._parse_sse_line("data:   ")
+        def fake_stream(**kwargs):
+            for event in (final_event, trailing_event):
+                consumed.append(event)
+                yield event
 
-        assert result is None
+        with patch.object(client, "ask_stream", side_effect=fake_stream):
+            response = client.ask("hi")
+        assert response.text == "Done"
+        assert response.raw_events == []
+        assert consumed == [final_event]
 
-    def test_parse_sse_line_parses_complex_json(self):
-        """Test that _parse_sse_line parses complex JSON structures."""
+        consumed.clear()
+        with patch.object(client, "ask_stream", side_effect=fake_stream):
+            response = client.ask("hi", keep_raw_events=True)
+        assert response.text == "Done"
+        assert response.raw_events == [final_event, trailing_event]
+
+    @pytest.mark.asyncio
+    async def test_ask_async_uses_plain_text_answer_as_is(self):
+        """Test that a non-JSON answer becomes the text without being parsed."""
         client = self._create_client()
-        data = {
+        final_event = {
             "step_type": "FINAL",
-            "text": '{"nested": "json"}',
-            "citations": [{"title": "Example", "url": "https://example.com"}],
-            "related_queries": ["query1", "query2"],
+            "text": json.dumps(
+                [{"step_type": "FINAL", "content": {"answer": "[1] Plain answer"}}]
+            ),
+        }
+
+        async def fake_stream(**kwargs):
+            yield final_event
+
+        with patch.object(client, "ask_stream_async", side_effect=fake_stream):
+            response = await client.ask_async("hi")
+
+        assert response.text == "[1] Plain answer"
+
+    @pytest.mark.asyncio
+    async def test_ask_partial_async_yields_accumulating_response(self):
+        """Test that ask_partial_async yields the response after every event."""
+        client = self._create_client()
+        events = [
+            {
+                "blocks": [
+                    {
+                        "intended_usage": "ask_text",
+                        "diff_block": {
+                            "patches": [{"op": "replace", "value": {"chunks": ["Hel"]}}]
+                        },
+                    }
+                ]
+            },
+            {
+                "step_type": "FINAL",
+                "text": json.dumps(
+                    [
+                        {
+                            "step_type": "FINAL",
+                            "content": {"answer": json.dumps({"answer": "Hello"})},
+                        }
+                    ]
+                ),
+            },
+        ]
+
+        async def fake_stream(**kwargs):
+            for event in events:
+                yield event
+
+        with patch.object(client, "ask_stream_async", side_effect=fake_stream):
+            texts = [r.text async for r in client.ask_partial_async("hi")]
+
+        assert texts == ["Hel", "Hello"]
+
+    @pytest.mark.asyncio
+    async def test_ask_partial_async_grows_with_every_block_event(self):
+        """Test that each streamed chunk extends the yielded text before FINAL."""
+        client = self._create_client()
+
+        def block_event(*patches):
+            return {
+                "blocks": [
+                    {
+                        "intended_usage": "ask_text_0_markdown",
+                        "diff_block": {"patches": list(patches)},
+                    }
+                ]
+            }
+
+        events = [
+            block_event({"op": "replace", "path": "", "value": {"chunks": ["Hello"]}}),
+            block_event({"op": "add", "path": "/chunks/1", "value": " big"}),
+            block_event(
+                {"op": "add", "path": "/chunks/2", "value": " world"},
+                {"op": "replace", "path": "/progress", "value": "DONE"},
+            ),
+            {
+                "step_type": "FINAL",
+                "text": json.dumps(
+                    [{"step_type": "FINAL", "content": {"answer": "Hello big world!"}}]
+                ),
+            },
+            block_event({"op": "add", "path": "/chunks/3", "value": " late"}),
+        ]
+
+        async def fake_stream(**kwargs):
+            for event in events:
+                yield event
+
+        with patch.object(client, "ask_stream_async", side_effect=fake_stream):
+            texts = [r.text async for r in client.ask_partial_async("hi")]
+            response = await client.ask_async("hi", keep_raw_events=True)
+
+        assert texts == [
+            "Hello",
+            "Hello big",
+            "Hello big world",
+            "Hello big world!",
+        ]
+        # Blocks arriving after FINAL do not overwrite its answer
+        assert response.text == "Hello big world!"
+
+
+class TestRetry:
+    """Tests for retrying transient upstream failures"""
+
+    def _create_client(self):
+        """Helper to create a client with mocked env vars."""
+        env_vars = {
+            "PERPLEXITY_SESSION_TOKEN": "test_session_token",
+            "PERPLEXITY_CF_CLEARANCE": "test_cf_clearance",
+            "PERPLEXITY_VISITOR_ID": "test_visitor_id",
         }
-        line = f"data: {json.dumps(data)}"
 
-        result = client._parse_sse_line(line)
+        with patch.dict("os.environ", env_vars, clear=True):
+            with patch("src.core.perplexity_client.load_dotenv"):
+                return PerplexityClient()
+
+    def test_ask_retries_timeouts(self):
+        """Test that ask retries a timed out request from scratch."""
+        client = self._create_client()
+        attempts = iter([cffi_exceptions.Timeout("timed out"), [{"blocks": []}]])
+
+        def flaky_stream(**kwargs):
+            outcome = next(attempts)
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield from outcome
+
+        with patch.object(client, "ask_stream", side_effect=flaky_stream):
+            with patch("src.core.perplexity_client.time.sleep") as sleep:
+                response = client.ask("hi", keep_raw_events=True)
+
+        sleep.assert_called_once()
+        assert response.raw_events == [{"blocks": []}]
 
-        assert result == data
-        assert result["step_type"] == "FINAL"
-        assert isinstance(result["citations"], list)
+    def test_ask_does_not_retry_other_errors(self):
+        """Test that non-transient failures are raised immediately."""
+        client = self._create_client()
+
+        with patch.object(client, "ask_stream", side_effect=Exception("HTTP 403")):
+            with patch("src.core.perplexity_client.time.sleep") as sleep:
+                with pytest.raises(Exception, match="HTTP 403"):
+                    client.ask("hi")
 
-    def test_parse_sse_line_parses_with_extra_whitespace(self):
-        """Test that _parse_sse_line handles extra whitespace correctly."""
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ask_async_gives_up_after_max_attempts(self):
+        """Test that ask_async re-raises once every attempt has failed."""
         client = self._create_client()
-        data = {"key": "value"}
-        line = f"data:   {json.dumps(data)}   "
 
-        result = client._parse_sse_line(line)
+        async def failing_stream(**kwargs):
+            raise cffi_exceptions.ConnectionError("reset")
+            yield
+
+        with patch.object(client, "ask_stream_async", side_effect=failing_stream):
+            with patch(
+                "src.core.perplexity_client.asyncio.sleep", new=AsyncMock()
+            ) as sleep:
+                with pytest.raises(cffi_exceptions.ConnectionError):
+                    await client.ask_async("hi")
 
-        assert result == data
+        assert sleep.await_count == PerplexityClient.MAX_ATTEMPTS - 1
 
-    def test_parse_sse_line_strips_data_content(self):
-        """Test that _parse_sse_line strips the data content correctly."""
+    @pytest.mark.asyncio
+    async def test_ask_partial_async_retries_before_first_event(self):
+        """Test that ask_partial_async retries a request that never started."""
         client = self._create_client()
-        data = {"test": "data"}
-        # Note: line itself should not have leading whitespace, only the data content
-        line = f"data: {json.dumps(data)}  "
+        attempts = iter([cffi_exceptions.Timeout("timed out"), [{"blocks": []}]])
+
+        async def flaky_stream(**kwargs):
+            outcome = next(attempts)
+            if isinstance(outcome, Exception):
+                raise outcome
+            for event in outcome:
+                yield event
+
+        with patch.object(client, "ask_stream_async", side_effect=flaky_stream):
+            with patch(
+                "src.core.perplexity_client.asyncio.sleep", new=AsyncMock()
+            ) as sleep:
+                responses = [r async for r in client.ask_partial_async("hi")]
+
+        sleep.assert_awaited_once()
+        assert len(responses) == 1
+
+    @pytest.mark.asyncio
+    async def test_ask_partial_async_does_not_retry_after_first_event(self):
+        """Test that a stream failing midway is not replayed to the caller."""
+        client = self._create_client()
+
+        async def dropping_stream(**kwargs):
+            yield {"blocks": []}
+            raise cffi_exceptions.ConnectionError("reset")
+
+        with patch.object(
+            client, "ask_stream_async", side_effect=dropping_stream
+        ) as stream:
+            with patch(
+                "src.core.perplexity_client.asyncio.sleep", new=AsyncMock()
+            ) as sleep:
+                with pytest.raises(cffi_exceptions.ConnectionError):
+                    async for _ in client.ask_partial_async("hi"):
+                        pass
+
+        sleep.assert_not_awaited()
+        assert stream.call_count == 1
 
-        result = client._parse_sse_line(line)
 
-        assert result == data
+class TestSessionReuse:
+    """Tests for HTTP session reuse across requests"""
 
-    def test_parse_sse_line_parses_null_json(self):
-        """Test that _parse_sse_line handles null JSON."""
+    def _create_client(self):
+        """Helper to create a client with mocked env vars."""
+        env_vars = {
+            "PERPLEXITY_SESSION_TOKEN": "test_session_token",
+            "PERPLEXITY_CF_CLEARANCE": "test_cf_clearance",
+            "PERPLEXITY_VISITOR_ID": "test_visitor_id",
+        }
+
+        with patch.dict("os.environ", env_vars, clear=True):
+            with patch("src.core.perplexity_client.load_dotenv"):
+                return PerplexityClient()
+
+    def test_ask_stream_uses_shared_session(self):
+        """Test that consecutive requests go through the same session."""
         client = self._create_client()
-        line = "data: null"
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = [b'data: {"a": 1}\n']
 
-        result = client._parse_sse_line(line)
+        with patch.object(client._session, "post", return_value=response) as post:
+            list(client.ask_stream("one"))
+            list(client.ask_stream("two"))
 
-        assert result is None
+        assert post.call_count == 2
+        assert post.call_args.kwargs["impersonate"] == "edge"
 
-    def test_parse_sse_line_parses_array_json(self):
-        """Test that _parse_sse_line can parse JSON arrays."""
+    @pytest.mark.asyncio
+    async def test_async_session_is_reused_within_loop(self):
+        """Test that the AsyncSession is created once per event loop."""
         client = self._create_client()
-        data = [1, 2, 3, {"key": "value"}]
-        line = f"data: {json.dumps(data)}"
 
-        result = client._parse_sse_line(line)
+        first = client._get_async_session()
+        second = client._get_async_session()
+
+        assert first is second
 
-        assert result == data
-        assert isinstance(result, list)
+    def test_async_session_rejects_another_loop(self):
+        """Test that an open AsyncSession is not silently replaced on a new loop."""
+        import asyncio
 
-    def test_parse_sse_line_parses_string_json(self):
-        """Test that _parse_sse_line can parse JSON strings."""
         client = self._create_client()
-        line = 'data: "just a string"'
 
-        result = client._parse_sse_line(line)
+        async def get_session():
+            return client._get_async_session()
 
-        assert result == "just a string"
+        with patch("src.core.perplexity_client.AsyncSession"):
+            asyncio.run(get_session())
+            with pytest.raises(RuntimeError, match="another event loop"):
+                asyncio.run(get_session())
 
-    def test_parse_sse_line_parses_number_json(self):
-        """Test that _parse_sse_line can parse JSON numbers."""
+    def test_context_manager_closes_session(self):
+        """Test that leaving a with block closes the shared session."""
         client = self._create_client()
-        line = "data: 42"
 
-        result = client._parse_sse_line(line)
+        with patch.object(client._session, "close") as close:
+            with client as entered:
+                assert entered is client
 
-        assert result == 42
+        close.assert_called_once()
 
-    def test_parse_sse_line_parses_boolean_json(self):
-        """Test that _parse_sse_line can parse JSON booleans."""
+    @pytest.mark.asyncio
+    async def test_aclose_closes_async_session(self):
+        """Test that aclose closes the AsyncSession and allows a fresh one."""
         client = self._create_client()
+        session = client._get_async_session()
+
+        with patch.object(session, "close", new=AsyncMock()) as close:
+            await client.aclose()
+            await client.aclose()
 
-        result_true = client._parse_sse_line("data: true")
-        result_false = client._parse_sse_line("data: false")
+        close.assert_awaited_once()
+        assert client._get_async_session() is not session
 
-        assert result_true is True
-        assert result_false is False
+    @pytest.mark.asyncio
+    async def test_async_session_pool_size(self):
+        """Test that max_connections sizes the AsyncSession's handle pool."""
+        env_vars = {"PERPLEXITY_SESSION_TOKEN": "test_session_token"}
+        with patch.dict("os.environ", env_vars, clear=True):
+            with patch("src.core.perplexity_client.load_dotenv"):
+                client = PerplexityClient(max_connections=32)
+
+        with patch("src.core.perplexity_client.AsyncSession") as session_cls:
+            client._get_async_session()
+
+        session_cls.assert_called_once_with(max_clients=32)
 
 
 class TestPerplexityResponse:
@@ -825,6 +1240,14 @@ class TestPerplexityResponse:
         # Check that it has dataclass fields
         assert hasattr(PerplexityResponse, "__dataclass_fields__")
 
+    def test_response_uses_slots(self):
+        """Test that PerplexityResponse stores its fields in slots."""
+        response = PerplexityResponse()
+
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.unknown = 1
+
     def test_response_has_all_expected_fields(self):
         """Test that PerplexityResponse has all expected fields."""
         response = PerplexityResponse()
@@ -0,0 +1,27 @@
+"""Tests for the research prompt templates."""
+
+import pytest
+
+from src.prompts import (
+    COMPILED_RESEARCH_PROMPTS,
+    PROGRAMMING_RESEARCH_PROMPTS,
+    VALID_CATEGORIES,
+)
+
+
+class TestCompiledResearchPrompts:
+    """Compiled (prefix, suffix) pairs must render like str.format."""
+
+    def test_every_category_is_compiled(self):
+        assert set(COMPILED_RESEARCH_PROMPTS) == VALID_CATEGORIES
+
+    @pytest.mark.parametrize("category", sorted(PROGRAMMING_RESEARCH_PROMPTS))
+    def test_matches_format(self, category):
+        topic = "graph {neural} networks"
+        prefix, suffix = COMPILED_RESEARCH_PROMPTS[category]
+        expected = PROGRAMMING_RESEARCH_PROMPTS[category].format(topic=topic)
+        assert prefix + topic + suffix == expected
+
+    def test_escaped_braces_are_resolved(self):
+        prefix, suffix = COMPILED_RESEARCH_PROMPTS["ml_training"]
+        assert "{{" not in prefix + suffix
@@ -0,0 +1,67 @@
+"""Tests for the response caches."""
+
+from unittest.mock import patch
+
+from src.core.response_cache import DiskResponseCache, ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_get_returns_stored_value(self):
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self):
+        cache = ResponseCache(maxsize=2, ttl=10)
+        with patch("src.core.response_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.core.response_cache.time.monotonic", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("src.core.response_cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self):
+        cache = ResponseCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+        assert not cache.enabled
+        assert cache.get("a") is None
+
+
+class TestDiskResponseCache:
+    """Tests for DiskResponseCache."""
+
+    def test_entries_survive_reopening(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path), ttl=60)
+        cache.set(("search", "q"), {"text": "answer"})
+        cache.close()
+
+        reopened = DiskResponseCache(str(tmp_path), ttl=60)
+        assert reopened.get(("search", "q")) == {"text": "answer"}
+        assert reopened.get(("search", "other")) is None
+        reopened.close()
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path), ttl=10)
+        with patch("src.core.response_cache.time.time", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.core.response_cache.time.time", return_value=109.0):
+            assert cache.get("a") == 1
+        with patch("src.core.response_cache.time.time", return_value=110.0):
+            assert cache.get("a") is None
+        cache.close()
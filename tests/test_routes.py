@@ -61,10 +61,64 @@ class TestHealthEndpoint:
             response = await client.get("/health")
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert data["status"] == "ok"
 
 
+class TestRootEndpoint:
+    """Tests for the / service information endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_root_returns_service_info(self):
+        """Root endpoint should return the static service description."""
+        from rest_api_service import app
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get("/")
+            second = await client.get("/")
+
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "application/json"
+        data = first.json()
+        assert data["status"] == "running"
+        assert data["endpoints"]["chat_completions"] == "/v1/chat/completions"
+        assert second.content == first.content
+
+    @pytest.mark.asyncio
+    async def test_root_rejects_post(self):
+        """Root endpoint only serves GET."""
+        from rest_api_service import app
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post("/")
+
+        assert response.status_code == 405
+
+
+class TestDocsEndpoints:
+    """Tests for the debug-only documentation endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_docs_disabled_outside_debug(self):
+        """Docs and the OpenAPI schema should not be served unless DEBUG is set."""
+        import rest_api_service
+
+        if rest_api_service.DOCS_URL is not None:
+            pytest.skip("DEBUG is enabled in this environment")
+
+        async with AsyncClient(
+            transport=ASGITransport(app=rest_api_service.app), base_url="http://test"
+        ) as client:
+            for path in ("/docs", "/redoc", "/openapi.json"):
+                response = await client.get(path)
+                assert response.status_code == 404
+
+
 class TestModelsEndpointAuth:
     """Tests for /v1/models endpoint authentication."""
 
@@ -86,6 +140,28 @@ class TestModelsEndpointAuth:
                 data = response.json()
                 assert "data" in data
 
+    @pytest.mark.asyncio
+    async def test_models_payload_is_static(self):
+        """Every /v1/models call should return the same pre-serialized body."""
+        from src.models.model_mapping import list_available_models
+
+        with patch("src.core.security.config") as mock_config:
+            mock_config.auth_enabled = False
+
+            from rest_api_service import app
+
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                first = await client.get("/v1/models")
+                second = await client.get("/v1/models")
+
+        assert first.headers["content-type"] == "application/json"
+        assert second.content == first.content
+        data = first.json()
+        assert data["object"] == "list"
+        assert [m["id"] for m in data["data"]] == list(list_available_models())
+
     @pytest.mark.asyncio
     async def test_models_with_valid_key(self):
         """When auth enabled, /v1/models should work with valid key."""
@@ -187,3 +263,54 @@ class TestChatCompletionsEndpointAuth:
                 )
 
             assert response.status_code == 401
+
+
+class TestClientSingleton:
+    """Tests for the lazily created PerplexityClient singleton."""
+
+    def test_concurrent_first_calls_create_one_client(self):
+        """Threads racing on a cold start should share a single client."""
+        import threading
+        import time
+
+        from src.api import dependencies
+
+        def slow_client(**kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(dependencies.get_perplexity_client())
+
+        with patch.object(dependencies, "_perplexity_client", None):
+            with patch.object(
+                dependencies, "PerplexityClient", side_effect=slow_client
+            ) as mock_cls:
+                threads = [threading.Thread(target=worker) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        assert mock_cls.call_count == 1
+        assert all(client is results[0] for client in results)
+
+    def test_pool_sized_independently_of_mcp_limit(self):
+        """REST traffic should not be capped at the MCP in-flight limit."""
+        import dataclasses
+
+        from src.api import dependencies
+
+        pool_config = dataclasses.replace(
+            dependencies.config, perplexity_max_connections=64, mcp_max_inflight=16
+        )
+        with patch.object(dependencies, "_perplexity_client", None):
+            with patch.object(dependencies, "config", pool_config):
+                with patch.object(dependencies, "PerplexityClient") as mock_cls:
+                    dependencies.get_perplexity_client()
+
+        mock_cls.assert_called_once_with(max_connections=64)
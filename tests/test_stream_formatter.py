@@ -303,8 +303,8 @@ class TestFormatOpenaiChunk:
 class TestFormatSseEvent:
     """Tests for format_sse_event() function."""
 
-    def test_returns_string(self):
-        """Test that function returns a string."""
+    def test_returns_bytes(self):
+        """Test that function returns bytes."""
         chunk = format_openai_chunk(
             completion_id="chatcmpl-test",
             created=1234567890,
@@ -312,7 +312,7 @@ class TestFormatSseEvent:
             content="test",
         )
         result = format_sse_event(chunk)
-        assert isinstance(result, str)
+        assert isinstance(result, bytes)
 
     def test_format_includes_data_prefix(self):
         """Test that result starts with 'data: '."""
@@ -323,7 +323,7 @@ class TestFormatSseEvent:
             content="test",
         )
         result = format_sse_event(chunk)
-        assert result.startswith("data: ")
+        assert result.startswith(b"data: ")
 
     def test_format_ends_with_double_newline(self):
         """Test that result ends with '\\n\\n'."""
@@ -334,7 +334,7 @@ class TestFormatSseEvent:
             content="test",
         )
         result = format_sse_event(chunk)
-        assert result.endswith("\n\n")
+        assert result.endswith(b"\n\n")
 
     def test_contains_valid_json(self):
         """Test that the event contains valid JSON."""
@@ -346,8 +346,8 @@ class TestFormatSseEvent:
         )
         result = format_sse_event(chunk)
 
-        # Extract JSON part (between "data: " and "\n\n")
-        json_str = result[6:-2]  # Remove "data: " prefix and "\n\n" suffix
+        # Extract JSON part (between b"data: " and b"\n\n")
+        json_str = result[6:-2]  # Remove b"data: " prefix and b"\n\n" suffix
         parsed = json.loads(json_str)
 
         assert parsed["id"] == "chatcmpl-test"
@@ -377,30 +377,30 @@ class TestFormatSseEvent:
 class TestFormatSseDone:
     """Tests for format_sse_done() function."""
 
-    def test_returns_string(self):
-        """Test that function returns a string."""
+    def test_returns_bytes(self):
+        """Test that function returns bytes."""
         result = format_sse_done()
-        assert isinstance(result, str)
+        assert isinstance(result, bytes)
 
     def test_returns_correct_format(self):
         """Test that result is exactly 'data: [DONE]\\n\\n'."""
         result = format_sse_done()
-        assert result == "data: [DONE]\n\n"
+        assert result == b"data: [DONE]\n\n"
 
     def test_starts_with_data_prefix(self):
         """Test that result starts with 'data: '."""
         result = format_sse_done()
-        assert result.startswith("data: ")
+        assert result.startswith(b"data: ")
 
     def test_ends_with_double_newline(self):
         """Test that result ends with '\\n\\n'."""
         result = format_sse_done()
-        assert result.endswith("\n\n")
+        assert result.endswith(b"\n\n")
 
     def test_contains_done_marker(self):
         """Test that result contains '[DONE]'."""
         result = format_sse_done()
-        assert "[DONE]" in result
+        assert b"[DONE]" in result
 
     def test_returns_same_value_on_multiple_calls(self):
         """Test that function always returns same value."""
@@ -460,19 +460,19 @@ class TestStreamFormatterInit:
 class TestStreamFormatterFormatRoleChunk:
     """Tests for StreamFormatter.format_role_chunk() method."""
 
-    def test_returns_string(self):
-        """Test that method returns a string."""
+    def test_returns_bytes(self):
+        """Test that method returns bytes."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_role_chunk()
-        assert isinstance(result, str)
+        assert isinstance(result, bytes)
 
     def test_returns_sse_formatted_string(self):
         """Test that returned string is SSE formatted."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_role_chunk()
 
-        assert result.startswith("data: ")
-        assert result.endswith("\n\n")
+        assert result.startswith(b"data: ")
+        assert result.endswith(b"\n\n")
 
     def test_role_chunk_contains_valid_json(self):
         """Test that role chunk contains valid JSON."""
@@ -519,20 +519,20 @@ class TestStreamFormatterFormatRoleChunk:
         formatter = StreamFormatter(model="test-model")
 
         first_call = formatter.format_role_chunk()
-        assert first_call != ""
-        assert first_call.startswith("data: ")
+        assert first_call != b""
+        assert first_call.startswith(b"data: ")
 
         second_call = formatter.format_role_chunk()
-        assert second_call == ""
+        assert second_call == b""
 
     def test_returns_empty_string_on_multiple_subsequent_calls(self):
         """Test that all subsequent calls return empty string."""
         formatter = StreamFormatter(model="test-model")
         formatter.format_role_chunk()  # First call
 
-        assert formatter.format_role_chunk() == ""
-        assert formatter.format_role_chunk() == ""
-        assert formatter.format_role_chunk() == ""
+        assert formatter.format_role_chunk() == b""
+        assert formatter.format_role_chunk() == b""
+        assert formatter.format_role_chunk() == b""
 
     def test_uses_formatter_completion_id(self):
         """Test that role chunk uses formatter's completion ID."""
@@ -559,11 +559,11 @@ class TestStreamFormatterFormatRoleChunk:
 class TestStreamFormatterFormatContentChunk:
     """Tests for StreamFormatter.format_content_chunk() method."""
 
-    def test_returns_string(self):
-        """Test that method returns a string."""
+    def test_returns_bytes(self):
+        """Test that method returns bytes."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_content_chunk("test content")
-        assert isinstance(result, str)
+        assert isinstance(result, bytes)
 
     def test_returns_sse_formatted_string(self):
         """Test that returned string is SSE formatted."""
@@ -571,8 +571,8 @@ class TestStreamFormatterFormatContentChunk:
         result = formatter.format_content_chunk("test")
 
         # Should contain at least one SSE event
-        assert "data: " in result
-        assert "\n\n" in result
+        assert b"data: " in result
+        assert b"\n\n" in result
 
     def test_content_chunk_includes_provided_content(self):
         """Test that content chunk includes the provided content."""
@@ -582,10 +582,10 @@ class TestStreamFormatterFormatContentChunk:
 
         # Extract JSON from result
         # Result might have role chunk + content chunk
-        lines = result.split("\n\n")
+        lines = result.split(b"\n\n")
         # Last line with content should have the content
         for line in lines:
-            if line.startswith("data: {"):
+            if line.startswith(b"data: {"):
                 try:
                     parsed = json.loads(line[6:])
                     if parsed["choices"][0]["delta"].get("content") == content:
@@ -609,7 +609,7 @@ class TestStreamFormatterFormatContentChunk:
         assert formatter.has_sent_role is True
 
         # Result should contain both role and content
-        assert result.count("data: ") >= 2  # At least role + content
+        assert result.count(b"data: ") >= 2  # At least role + content
 
     def test_does_not_send_role_twice(self):
         """Test that role is only sent once even with multiple content chunks."""
@@ -619,11 +619,11 @@ class TestStreamFormatterFormatContentChunk:
         result2 = formatter.format_content_chunk("second")
 
         # First result should have role (role + content = 2 events)
-        count1 = result1.count("data: ")
+        count1 = result1.count(b"data: ")
         assert count1 == 2  # role + content
 
         # Second result should have only content (no role = 1 event)
-        count2 = result2.count("data: ")
+        count2 = result2.count(b"data: ")
         assert count2 == 1  # just content
 
     def test_content_chunks_use_formatter_id_and_model(self):
@@ -632,9 +632,9 @@ class TestStreamFormatterFormatContentChunk:
         result = formatter.format_content_chunk("test")
 
         # Extract the content chunk (last event before empty line)
-        lines = result.split("\n\n")
+        lines = result.split(b"\n\n")
         for line in reversed(lines):
-            if line.startswith("data: {"):
+            if line.startswith(b"data: {"):
                 parsed = json.loads(line[6:])
                 assert parsed["id"] == formatter.completion_id
                 assert parsed["model"] == "my-model"
@@ -646,8 +646,8 @@ class TestStreamFormatterFormatContentChunk:
         result = formatter.format_content_chunk("")
 
         # Should still return formatted result
-        assert isinstance(result, str)
-        assert "data: " in result
+        assert isinstance(result, bytes)
+        assert b"data: " in result
 
     def test_with_multiline_content(self):
         """Test that multiline content is handled correctly."""
@@ -656,9 +656,9 @@ class TestStreamFormatterFormatContentChunk:
         result = formatter.format_content_chunk(content)
 
         # Extract and verify content
-        lines = result.split("\n\n")
+        lines = result.split(b"\n\n")
         for line in lines:
-            if line.startswith("data: {"):
+            if line.startswith(b"data: {"):
                 parsed = json.loads(line[6:])
                 if parsed["choices"][0]["delta"].get("content") == content:
                     assert True
@@ -687,9 +687,9 @@ class TestStreamFormatterFormatContentChunk:
         result = formatter.format_content_chunk("test")
 
         # Extract content portion (last event)
-        lines = result.split("\n\n")
+        lines = result.split(b"\n\n")
         for line in reversed(lines):
-            if line.startswith("data: {"):
+            if line.startswith(b"data: {"):
                 parsed = json.loads(line[6:])
                 # Should have no finish_reason
                 assert parsed["choices"][0]["finish_reason"] is None
@@ -699,33 +699,33 @@ class TestStreamFormatterFormatContentChunk:
 class TestStreamFormatterFormatFinalChunk:
     """Tests for StreamFormatter.format_final_chunk() method."""
 
-    def test_returns_string(self):
-        """Test that method returns a string."""
+    def test_returns_bytes(self):
+        """Test that method returns bytes."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
-        assert isinstance(result, str)
+        assert isinstance(result, bytes)
 
     def test_returns_sse_formatted_string(self):
         """Test that returned string contains SSE events."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        assert "data: " in result
-        assert "\n\n" in result
+        assert b"data: " in result
+        assert b"\n\n" in result
 
     def test_includes_done_marker(self):
         """Test that final chunk includes [DONE] marker."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        assert "[DONE]" in result
+        assert b"[DONE]" in result
 
     def test_final_chunk_ends_with_done_marker(self):
         """Test that result ends with [DONE] marker."""
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        assert result.endswith("data: [DONE]\n\n")
+        assert result.endswith(b"data: [DONE]\n\n")
 
     def test_includes_finish_chunk_before_done(self):
         """Test that finish chunk comes before DONE marker."""
@@ -733,15 +733,15 @@ class TestStreamFormatterFormatFinalChunk:
         result = formatter.format_final_chunk()
 
         # Split by DONE
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         assert len(parts) == 2
 
         # First part should have finish chunk
         first_part = parts[0]
-        assert first_part.endswith("\n\n")
+        assert first_part.endswith(b"\n\n")
 
         # Extract and verify finish chunk JSON
-        json_str = first_part[6:-2]  # Remove "data: " and "\n\n"
+        json_str = first_part[6:-2]  # Remove b"data: " and b"\n\n"
         parsed = json.loads(json_str)
 
         # Should have finish_reason
@@ -753,7 +753,7 @@ class TestStreamFormatterFormatFinalChunk:
         result = formatter.format_final_chunk()
 
         # Extract finish chunk (before DONE)
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -765,7 +765,7 @@ class TestStreamFormatterFormatFinalChunk:
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -778,7 +778,7 @@ class TestStreamFormatterFormatFinalChunk:
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -791,7 +791,7 @@ class TestStreamFormatterFormatFinalChunk:
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -804,7 +804,7 @@ class TestStreamFormatterFormatFinalChunk:
         formatter = StreamFormatter(model=model)
         result = formatter.format_final_chunk()
 
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -816,7 +816,7 @@ class TestStreamFormatterFormatFinalChunk:
         formatter = StreamFormatter(model="test-model")
         result = formatter.format_final_chunk()
 
-        parts = result.split("data: [DONE]")
+        parts = result.split(b"data: [DONE]")
         first_part = parts[0]
         json_str = first_part[6:-2]
         parsed = json.loads(json_str)
@@ -838,16 +838,16 @@ class TestStreamFormatterIntegration:
         final = formatter.format_final_chunk()
 
         # Verify role sent only once
-        role_count = role_chunk.count("assistant")
+        role_count = role_chunk.count(b"assistant")
         assert role_count >= 1  # Should have role="assistant"
 
         # Verify content chunks
-        assert "Hello " in content1
-        assert "world" in content2
+        assert b"Hello " in content1
+        assert b"world" in content2
 
         # Verify final chunk
-        assert "[DONE]" in final
-        assert "stop" in final
+        assert b"[DONE]" in final
+        assert b"stop" in final
 
     def test_skipping_role_chunk_call(self):
         """Test that format_content_chunk sends role if not already sent."""
@@ -857,7 +857,7 @@ class TestStreamFormatterIntegration:
         content = formatter.format_content_chunk("direct content")
 
         # Should still have role included
-        assert "assistant" in content
+        assert b"assistant" in content
 
     def test_state_management_across_calls(self):
         """Test that formatter state is properly maintained."""
@@ -867,12 +867,12 @@ class TestStreamFormatterIntegration:
         assert formatter.has_sent_role is True
 
         chunk2 = formatter.format_role_chunk()
-        assert chunk2 == ""  # Should be empty second time
+        assert chunk2 == b""  # Should be empty second time
         assert formatter.has_sent_role is True  # State unchanged
 
         chunk3 = formatter.format_content_chunk("test")
         # Should not include role again
-        assert chunk3.count("data: ") == 1  # Only content
+        assert chunk3.count(b"data: ") == 1  # Only content
 
     def test_same_id_and_timestamp_across_all_chunks(self):
         """Test that all chunks use same completion ID and timestamp."""
@@ -888,9 +888,9 @@ class TestStreamFormatterIntegration:
 
         for chunk_str in chunks:
             # Extract all JSON objects from the chunk
-            events = chunk_str.split("\n\n")
+            events = chunk_str.split(b"\n\n")
             for event in events:
-                if event.startswith("data: {"):
+                if event.startswith(b"data: {"):
                     parsed = json.loads(event[6:])
                     assert parsed["id"] == expected_id
                     assert parsed["created"] == expected_created
@@ -912,7 +912,7 @@ class TestStreamFormatterIntegration:
         assert formatter1.completion_id != formatter2.completion_id
 
         # Verify content is separate
-        assert "f1 content" in f1_content
-        assert "f2 content" in f2_content
-        assert "f1 content" not in f2_content
-        assert "f2 content" not in f1_content
+        assert b"f1 content" in f1_content
+        assert b"f2 content" in f2_content
+        assert b"f1 content" not in f2_content
+        assert b"f2 content" not in f1_content
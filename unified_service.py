@@ -21,15 +21,24 @@ Example usage:
 import logging
 from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.convertors import Convertor, register_url_convertor
+from starlette.responses import Response
 from starlette.routing import Route
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp
 
 from src.config import config
+from src.api.dependencies import close_perplexity_client
 from src.api.routes import router
 from src.api.error_handlers import register_error_handlers
+from src.api.middleware import (
+    BodySizeLimitMiddleware,
+    RESTAuthMiddleware,
+    StaticCORSMiddleware,
+    StaticRouteFastPath,
+)
 from src.core.mcp_auth import MCPAuthMiddleware
 
 # Import the MCP server instance from mcp_service.py
@@ -37,74 +46,132 @@ from mcp_service import mcp
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, config.log_level, logging.WARNING),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Settings read by this module, bound once at import
+API_TITLE = config.api_title
+API_VERSION = config.api_version
+HOST = config.rest_api_host
+PORT = config.rest_api_port
+
+# Interactive docs and the OpenAPI schema are only exposed in debug runs, so
+# production instances never build the schema or register the docs routes
+DOCS_URL = "/docs" if config.debug else None
+REDOC_URL = "/redoc" if config.debug else None
+OPENAPI_URL = "/openapi.json" if config.debug else None
+
 
 @asynccontextmanager
 async def combined_lifespan(app: FastAPI):
     """Combined lifespan for FastAPI + MCP."""
-    logger.info(f"Starting {config.api_title} v{config.api_version}")
-    logger.info(
-        f"Server running at http://{config.rest_api_host}:{config.rest_api_port}"
-    )
+    logger.info("Starting %s v%s", API_TITLE, API_VERSION)
+    logger.info("Server running at http://%s:%s", HOST, PORT)
     logger.info("REST API: /v1/chat/completions, /v1/models")
     logger.info("MCP HTTP: /mcp (streamable-http transport)")
-    logger.info("Documentation: /docs")
+    if DOCS_URL:
+        logger.info("Documentation: %s", DOCS_URL)
+
+    # Build the MCP endpoint inside the event loop rather than at import
+    _install_mcp_routes(app)
 
     # Start MCP session manager (required for streamable-http transport)
     async with mcp.session_manager.run():
         yield
 
     logger.info("Shutting down...")
+    await close_perplexity_client()
+
+
+# (method, path) -> MCP endpoint table used by StaticRouteFastPath
+# Empty until combined_lifespan installs the MCP routes, which doubles as the
+# sentinel that keeps the installation to a single run
+MCP_FAST_PATH_ROUTES: dict[tuple[str, str], ASGIApp] = {}
+
+
+def _install_mcp_routes(app: FastAPI) -> None:
+    """Build the authenticated MCP endpoint and route /mcp to it."""
+    if MCP_FAST_PATH_ROUTES:
+        return
+
+    # Get the MCP Starlette app to extract its route endpoint
+    # We set path="/" so the route is created at "/" internally
+    mcp.settings.streamable_http_path = "/"
+    mcp_starlette_app = mcp.streamable_http_app()
+
+    # Extract the StreamableHTTPASGIApp endpoint from the MCP route
+    mcp_route = mcp_starlette_app.routes[0]  # The route at "/"
+    mcp_asgi_endpoint = mcp_route.endpoint  # StreamableHTTPASGIApp instance
 
+    # Create the authenticated MCP endpoint
+    mcp_endpoint_with_auth = MCPAuthMiddleware(mcp_asgi_endpoint)
 
-# Get the MCP Starlette app to extract its route endpoint
-# We set path="/" so the route is created at "/" internally
-mcp.settings.streamable_http_path = "/"
-mcp_starlette_app = mcp.streamable_http_app()
+    MCP_FAST_PATH_ROUTES.update(
+        {
+            (method, path): mcp_endpoint_with_auth
+            for method in ("GET", "POST", "DELETE")
+            for path in ("/mcp", "/mcp/")
+        }
+    )
+
+    # Add the MCP route directly to FastAPI's router as well, for methods the
+    # fast path does not cover
+    # A single route matches both /mcp and /mcp/ via the optional-slash
+    # convertor, which prevents the 307 redirect that would otherwise occur
+    # Mount("/mcp") is deliberately not used: it only matches /mcp/..., so a
+    # bare /mcp would be redirected, and it would also hand arbitrary
+    # sub-paths to the MCP app. GET/POST/DELETE never reach this route anyway,
+    # since StaticRouteFastPath resolves them with a single dict lookup
+    # The Route with no methods= accepts all HTTP methods
+    # It is inserted first because the router scans routes in order and MCP
+    # traffic is the hot path; REST and docs routes are checked afterwards
+    app.router.routes.insert(
+        0, Route("/mcp{slash:optslash}", endpoint=mcp_endpoint_with_auth)
+    )
 
-# Extract the StreamableHTTPASGIApp endpoint from the MCP route
-mcp_route = mcp_starlette_app.routes[0]  # The route at "/"
-mcp_asgi_endpoint = mcp_route.endpoint  # StreamableHTTPASGIApp instance
 
+class OptionalSlashConvertor(Convertor):
+    """Path convertor matching an optional trailing slash."""
 
-class MCPWithAuth:
-    """Wrapper that adds authentication middleware to the MCP ASGI endpoint."""
+    regex = "/?"
 
-    def __init__(self, app: ASGIApp):
-        self.app = app
-        self.auth_middleware = MCPAuthMiddleware(app)
+    def convert(self, value: str) -> str:
+        return value
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        # Apply auth middleware, which will call self.app if auth passes
-        await self.auth_middleware(scope, receive, send)
+    def to_string(self, value: str) -> str:
+        return value
 
 
-# Create the authenticated MCP endpoint
-mcp_endpoint_with_auth = MCPWithAuth(mcp_asgi_endpoint)
+register_url_convertor("optslash", OptionalSlashConvertor())
 
 
 # Create FastAPI app with combined lifespan
 app = FastAPI(
-    title=config.api_title,
-    version=config.api_version,
+    title=API_TITLE,
+    version=API_VERSION,
     description="OpenAI-compatible REST API + MCP Server for Perplexity AI",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url=DOCS_URL,
+    redoc_url=REDOC_URL,
+    openapi_url=OPENAPI_URL,
     lifespan=combined_lifespan,
 )
 
+# Check API keys for /v1/* before routing; added first so it runs inside CORS
+app.add_middleware(RESTAuthMiddleware)
+
+# Serve MCP requests without walking the route table
+# Added before CORS so CORS headers are still applied to MCP responses
+# The table is filled in at startup by combined_lifespan
+app.add_middleware(StaticRouteFastPath, routes=MCP_FAST_PATH_ROUTES)
+
+# Reject oversized request bodies before they are read or validated
+# Added before CORS so the 413 still carries CORS headers
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=config.max_request_body_bytes)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(StaticCORSMiddleware)
 
 # Register error handlers
 register_error_handlers(app)
@@ -113,41 +180,49 @@ register_error_handlers(app)
 app.include_router(router)
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with service information."""
-    return {
-        "name": config.api_title,
-        "version": config.api_version,
-        "status": "running",
-        "endpoints": {
-            "rest_api": {
-                "chat_completions": "/v1/chat/completions",
-                "models": "/v1/models",
-                "health": "/health",
-            },
-            "mcp": {
-                "endpoint": "/mcp",
-                "transport": "streamable-http",
-                "methods": ["tools/list", "tools/call"],
+# Root endpoint with service information
+# The payload is static, so it is serialized once and served from a shared
+# Response instance, which Starlette treats as a plain ASGI app
+ROOT_RESPONSE = Response(
+    content=orjson.dumps(
+        {
+            "name": API_TITLE,
+            "version": API_VERSION,
+            "status": "running",
+            "endpoints": {
+                "rest_api": {
+                    "chat_completions": "/v1/chat/completions",
+                    "models": "/v1/models",
+                    "health": "/health",
+                },
+                "mcp": {
+                    "endpoint": "/mcp",
+                    "transport": "streamable-http",
+                    "methods": ["tools/list", "tools/call"],
+                },
+                "docs": DOCS_URL,
             },
-            "docs": "/docs",
-        },
-    }
-
-
-# Add MCP routes directly to FastAPI's router
-# We add BOTH /mcp and /mcp/ to handle requests with or without trailing slash
-# This prevents the 307 redirect that would otherwise occur
-# The Route with no methods= accepts all HTTP methods (GET, POST, DELETE)
-app.routes.append(Route("/mcp", endpoint=mcp_endpoint_with_auth))
-app.routes.append(Route("/mcp/", endpoint=mcp_endpoint_with_auth))
+        }
+    ),
+    media_type="application/json",
+)
+app.router.routes.insert(0, Route("/", endpoint=ROOT_RESPONSE, methods=["GET"]))
 
 
 if __name__ == "__main__":
+    # MCP sessions live in the memory of the process that created them
+    # (mcp.session_manager), so with WORKERS > 1 either set
+    # MCP_SESSION_BACKEND=stateless or route clients stickily to the worker
+    # that issued their Mcp-Session-Id. Uvicorn binds the listening socket
+    # once in the supervisor and shares it with every worker, so the kernel
+    # spreads accept() calls across the worker processes.
     uvicorn.run(
         "unified_service:app",
-        host=config.rest_api_host,
-        port=config.rest_api_port,
-        reload=True,
+        host=HOST,
+        port=PORT,
+        reload=config.dev_reload,
+        workers=config.workers,
+        # loop="auto" already selects uvloop when installed (not on Windows)
+        http="httptools",
+        access_log=config.debug,
     )